@@ -167,6 +167,10 @@ class AnalystAgent:
             "Fetching programmatic data for %d tickers from YFinance...", len(tickers), emoji="🔍"
         )
         stocks_info = YFinance.get_stocks_info(tickers)
+        priced_tickers = [t for t in tickers if stocks_info.get(t, {}).get("price")]
+        filing_prices = PriceFetcher.get_avg_prices(
+            priced_tickers, date.fromisoformat(self.filing_date)
+        )
 
         autonomous_scores = {}
         for ticker in tickers:
@@ -178,9 +182,7 @@ class AnalystAgent:
             growth_score: float | None = None
 
             if current_price:
-                filing_price = PriceFetcher.get_avg_price(
-                    ticker, date.fromisoformat(self.filing_date)
-                )
+                filing_price = filing_prices.get(ticker)
                 if filing_price:
                     pct_change = ((float(current_price) - filing_price) / filing_price) * 100
                     growth_score = PerformanceEvaluator.calculate_growth_score(pct_change)
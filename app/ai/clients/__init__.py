@@ -3,15 +3,24 @@ This package contains the various AI client implementations.
 
 By importing the classes here, we can simplify imports in other parts of the application,
 allowing `from app.ai.clients import GoogleAIClient, GroqClient`, etc.
+
+Only the lightweight `AIClient` base is imported eagerly. The provider clients
+pull in the `openai` and `google-genai` SDKs (over a second of import time
+together), so they are loaded on first attribute access instead.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from app.ai.clients.base_client import AIClient
-from app.ai.clients.base_openai_client import OpenAIClient
-from app.ai.clients.github_client import GitHubClient
-from app.ai.clients.google_client import GoogleAIClient
-from app.ai.clients.groq_client import GroqClient
-from app.ai.clients.huggingface_client import HuggingFaceClient
-from app.ai.clients.openrouter_client import OpenRouterClient
+
+if TYPE_CHECKING:
+    from app.ai.clients.base_openai_client import OpenAIClient
+    from app.ai.clients.github_client import GitHubClient
+    from app.ai.clients.google_client import GoogleAIClient
+    from app.ai.clients.groq_client import GroqClient
+    from app.ai.clients.huggingface_client import HuggingFaceClient
+    from app.ai.clients.openrouter_client import OpenRouterClient
 
 # Defines the public API of this package
 __all__ = [
@@ -23,3 +32,25 @@ __all__ = [
     "HuggingFaceClient",
     "OpenRouterClient",
 ]
+
+_LAZY_CLIENTS = {
+    "OpenAIClient": "app.ai.clients.base_openai_client",
+    "GitHubClient": "app.ai.clients.github_client",
+    "GoogleAIClient": "app.ai.clients.google_client",
+    "GroqClient": "app.ai.clients.groq_client",
+    "HuggingFaceClient": "app.ai.clients.huggingface_client",
+    "OpenRouterClient": "app.ai.clients.openrouter_client",
+}
+
+
+def __getattr__(name: str):
+    """
+    Imports a provider client on first access and caches it on the package, so
+    later lookups (and `mock.patch` targets) see a plain module attribute.
+    """
+    module_name = _LAZY_CLIENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
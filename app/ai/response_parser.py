@@ -6,33 +6,44 @@ from app.utils.logger import get_logger, log_safe
 
 logger = get_logger(__name__)
 
+# Field keys we expect inside a per-stock or weights toon block. Used to repair
+# responses where an LLM drops the newline between consecutive key-value pairs.
+_KNOWN_FIELD_KEYS = (
+    "industry",
+    "momentum_score",
+    "low_volatility_score",
+    "risk_score",
+    "growth_score",
+    "High_Conviction_Count",
+    "Max_Portfolio_Pct",
+    "Ownership_Delta_Avg",
+    "Net_Buyers",
+    "New_Holder_Count",
+    "Portfolio_Concentration_Avg",
+    "Total_Delta_Value",
+    "Holder_Count",
+    "Buyer_Count",
+    "Seller_Count",
+    "Buyer_Seller_Ratio",
+)
+
+# Markdown code fences (```toon or bare ```), whose body is the TOON payload.
+_MARKDOWN_BLOCK_RE = re.compile(r"```(?:\s*toon)?\s*(.*?)```", re.DOTALL)
+# Group 1 captures a quoted string (kept), group 2 a comment (dropped).
+_COMMENT_RE = re.compile(r'("[^"\\]*(?:\\.[^"\\]*)*")|(#.*)')
+_JSON_LIST_RE = re.compile(r"\[\s*(.*?)\s*\]", re.DOTALL)
+_INDENT_RE = re.compile(r"^(\s*)")
+_SPLIT_FIELD_RE = re.compile(
+    r"\s+(?=(?:" + "|".join(re.escape(k) for k in _KNOWN_FIELD_KEYS) + r")\s*:)"
+)
+_GLUED_TICKER_RE = re.compile(r"(\d)(?=[A-Z][A-Z0-9]{1,9}:)")
+
 
 class ResponseParser:
     """
     Utility class for parsing TOON from LLM responses
     """
 
-    # Field keys we expect inside a per-stock or weights toon block. Used to repair
-    # responses where an LLM drops the newline between consecutive key-value pairs.
-    _KNOWN_FIELD_KEYS = (
-        "industry",
-        "momentum_score",
-        "low_volatility_score",
-        "risk_score",
-        "growth_score",
-        "High_Conviction_Count",
-        "Max_Portfolio_Pct",
-        "Ownership_Delta_Avg",
-        "Net_Buyers",
-        "New_Holder_Count",
-        "Portfolio_Concentration_Avg",
-        "Total_Delta_Value",
-        "Holder_Count",
-        "Buyer_Count",
-        "Seller_Count",
-        "Buyer_Seller_Ratio",
-    )
-
     @staticmethod
     def extract_and_decode_toon(response_text: str) -> dict:
         """
@@ -45,7 +56,7 @@ class ResponseParser:
 
             # Find all markdown blocks (toon or generic)
             # Allow for potential whitespace/newline before 'toon' (e.g. ```\n toon)
-            markdown_blocks = re.findall(r"```(?:\s*toon)?\s*(.*?)```", text, re.DOTALL)
+            markdown_blocks = _MARKDOWN_BLOCK_RE.findall(text)
 
             # Use the last block content, or the whole text as fallback
             toon_content = markdown_blocks[-1].strip() if markdown_blocks else text
@@ -77,30 +88,21 @@ class ResponseParser:
         3. Removes YAML-style bullets/checklists (which break toon).
         """
         # 1. Strip comments (respecting quotes) using regex
-        # Pattern captures: Group 1 (Quoted String), Group 2 (Comment)
-        pattern_comment = r'("[^"\\]*(?:\\.[^"\\]*)*")|(#.*)'
         # Replace comments with empty string, keep strings as is
-        text = re.sub(pattern_comment, lambda m: m.group(1) if m.group(1) else "", text)
+        text = _COMMENT_RE.sub(lambda m: m.group(1) if m.group(1) else "", text)
 
         # 2. Collapse JSON lists to single line (handling newlines inside [ ... ])
         # Uses DOTALL to match across lines.
-        text = re.sub(
-            r"\[\s*(.*?)\s*\]",
-            lambda m: "[" + " ".join(m.group(1).split()) + "]",
-            text,
-            flags=re.DOTALL,
-        )
+        text = _JSON_LIST_RE.sub(lambda m: "[" + " ".join(m.group(1).split()) + "]", text)
 
         # 3a. Repair missing newlines between known keys on the same line
         # (e.g. "momentum_score: 65  low_volatility_score: 70"), preserving indent.
-        keys_alt = "|".join(re.escape(k) for k in ResponseParser._KNOWN_FIELD_KEYS)
-        split_field_re = re.compile(rf"\s+(?=(?:{keys_alt})\s*:)")
         repaired_lines: list[str] = []
         for raw_line in text.split("\n"):
             # `^(\s*)` always matches (zero-width is fine), but mypy can't prove that.
-            indent_match = re.match(r"^(\s*)", raw_line)
+            indent_match = _INDENT_RE.match(raw_line)
             indent = indent_match.group(1) if indent_match else ""
-            parts = split_field_re.split(raw_line)
+            parts = _SPLIT_FIELD_RE.split(raw_line)
             if len(parts) > 1:
                 repaired_lines.append(parts[0])
                 for p in parts[1:]:
@@ -111,7 +113,7 @@ class ResponseParser:
 
         # 3b. Repair tickers glued to the previous numeric value
         # (e.g. "risk_score: 90KRRO:" → ticker on its own line).
-        text = re.sub(r"(\d)(?=[A-Z][A-Z0-9]{1,9}:)", r"\1\n", text)
+        text = _GLUED_TICKER_RE.sub(r"\1\n", text)
 
         # 4. Filter invalid lines (markdown bullets)
         valid_lines = []
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from app.database import load_non_quarterly_data
@@ -75,20 +76,23 @@ def get_non_quarterly_filings_dataframe(
     non_quarterly_filings_df["Value"] = pd.NA
     non_quarterly_filings_df["Avg_Price"] = pd.NA
 
-    for index, row in non_quarterly_filings_df.iterrows():
-        ticker = row["Ticker"]
-        if ticker is None or pd.isna(ticker):
-            if row["Shares"] == 0:
+    for index, ticker, shares, filing_date in non_quarterly_filings_df[
+        ["Ticker", "Shares", "Date"]
+    ].itertuples(name=None):
+        # Unresolved tickers surface as None or NaN depending on the column dtype;
+        # an isinstance probe covers both without a pandas dispatch per row.
+        if not isinstance(ticker, str):
+            if shares == 0:
                 non_quarterly_filings_df.at[index, "Value"] = 0
             continue
-        date = row["Date"].date()
+        date = filing_date.date()
         price = PriceFetcher.get_avg_price(ticker, date)
         if price:
             non_quarterly_filings_df.at[index, "Avg_Price"] = price
-            non_quarterly_filings_df.at[index, "Value"] = price * row["Shares"]
+            non_quarterly_filings_df.at[index, "Value"] = price * shares
         else:
             # If shares are 0, value is 0 regardless of price availability
-            if row["Shares"] == 0:
+            if shares == 0:
                 non_quarterly_filings_df.at[index, "Value"] = 0
             logger.warning("Could not find price for %s on %s.", log_safe(ticker), date)
 
@@ -168,17 +172,21 @@ def update_quarter_with_nq_filings(
         updated_df["Delta_Value_Num"],
     )
 
-    updated_df["Delta"] = updated_df.apply(
-        lambda row: (
-            "NEW"
-            if pd.isna(row["Shares_13f"]) or row["Shares_13f"] == 0
-            else "CLOSE"
-            if row["Shares_schedule"] == 0
-            else (row["Shares_schedule"] - row["Shares_13f"]) / row["Shares_13f"] * 100
-            if not pd.isna(row["Shares_schedule"])
-            else format_percentage(row["Delta"])
-        ),
-        axis=1,
+    # np.select takes the first matching condition, mirroring the label precedence.
+    # Object arrays keep the NQ percentages as floats next to the string labels;
+    # only rows without NQ activity re-format the carried-over 13F Delta.
+    shares_13f, shares_schedule = updated_df["Shares_13f"], updated_df["Shares_schedule"]
+    is_new = shares_13f.isna() | (shares_13f == 0)
+    is_close = shares_schedule == 0
+    has_schedule = shares_schedule.notna()
+    carried = ~(is_new | is_close | has_schedule)
+    nq_delta_pct = ((shares_schedule - shares_13f) / shares_13f * 100).to_numpy(dtype=object)
+    carried_delta = pd.Series(None, index=updated_df.index, dtype=object)
+    carried_delta[carried] = updated_df.loc[carried, "Delta"].map(format_percentage)
+    updated_df["Delta"] = np.select(
+        [is_new, is_close, has_schedule],
+        ["NEW", "CLOSE", nq_delta_pct],
+        default=carried_delta.to_numpy(),
     )
 
     updated_df["Value_Num"] = coalesce(
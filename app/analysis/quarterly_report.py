@@ -1,8 +1,9 @@
+import numpy as np
 import pandas as pd
 
 from app.stocks.ticker_resolver import TickerResolver
 from app.utils.logger import get_logger, log_safe
-from app.utils.pd import coalesce, format_value_series
+from app.utils.pd import coalesce, format_percentage_series, format_value_series
 from app.utils.strings import format_percentage, format_value
 
 logger = get_logger(__name__)
@@ -75,23 +76,25 @@ def generate_comparison(df_recent: pd.DataFrame, df_previous: pd.DataFrame | Non
     Generates a comparison report between the two DataFrames, calculating percentage change and indicating new positions.
     """
     if df_previous is None:
-        df_previous = pd.DataFrame(columns=df_recent.columns)
+        # An empty slice keeps df_recent's dtypes, so the merged numeric
+        # columns stay float64 (NaN for missing keys) rather than object.
+        df_previous = df_recent.iloc[:0]
 
     df_comparison = pd.merge(
         df_recent, df_previous, on=["CUSIP"], how="outer", suffixes=("_recent", "_previous")
     )
 
-    df_comparison["Shares"] = (
-        pd.to_numeric(df_comparison["Shares_recent"], errors="coerce").fillna(0).astype("int64")
-    )
-    df_comparison["Shares_previous"] = (
-        pd.to_numeric(df_comparison["Shares_previous"], errors="coerce").fillna(0).astype("int64")
-    )
-    df_comparison["Value"] = (
-        pd.to_numeric(df_comparison["Value_recent"], errors="coerce").fillna(0).astype("int64")
-    )
-    df_comparison["Value_previous"] = (
-        pd.to_numeric(df_comparison["Value_previous"], errors="coerce").fillna(0).astype("int64")
+    # Missing keys come out of the outer merge as NaN: fill and cast the four
+    # numeric columns in one block instead of one copy per column.
+    numeric_columns = {
+        "Shares_recent": "Shares",
+        "Shares_previous": "Shares_previous",
+        "Value_recent": "Value",
+        "Value_previous": "Value_previous",
+    }
+    numeric = df_comparison[list(numeric_columns)].apply(pd.to_numeric, errors="coerce")
+    df_comparison[list(numeric_columns.values())] = (
+        numeric.fillna(0).astype("int64").rename(columns=numeric_columns)
     )
 
     df_comparison["Company"] = coalesce(
@@ -107,8 +110,11 @@ def generate_comparison(df_recent: pd.DataFrame, df_previous: pd.DataFrame | Non
     )
     df_comparison["Delta_Shares"] = df_comparison["Shares"] - df_comparison["Shares_previous"]
     df_comparison["Delta_Value"] = df_comparison["Delta_Shares"] * df_comparison["Price_per_Share"]
+    # NaN (not pd.NA) for new positions keeps the division in float64 instead of
+    # object dtype; those rows are labelled NEW, so the value is never shown.
+    shares_previous = df_comparison["Shares_previous"]
     df_comparison["Delta%"] = (
-        df_comparison["Delta_Shares"] / df_comparison["Shares_previous"].replace(0, pd.NA)
+        df_comparison["Delta_Shares"] / shares_previous.where(shares_previous != 0)
     ) * 100
 
     # Share counts are not comparable across a CUSIP change: deltas for linked
@@ -126,19 +132,13 @@ def generate_comparison(df_recent: pd.DataFrame, df_previous: pd.DataFrame | Non
             delta_value / df_comparison.loc[linked, "Value_previous"]
         ) * 100
 
-    df_comparison["Delta"] = df_comparison.apply(
-        lambda row: (
-            format_percentage(row["Delta%"], True)
-            if row["CUSIP_Changed"]
-            else "NEW"
-            if row["Shares_previous"] == 0
-            else "CLOSE"
-            if row["Shares"] == 0
-            else "NO CHANGE"
-            if row["Shares"] == row["Shares_previous"]
-            else format_percentage(row["Delta%"], True)
-        ),
-        axis=1,
+    # np.select takes the first matching condition, mirroring the label precedence.
+    delta_pct = format_percentage_series(df_comparison["Delta%"], show_sign=True)
+    shares = df_comparison["Shares"]
+    df_comparison["Delta"] = np.select(
+        [linked, shares_previous == 0, shares == 0, shares == shares_previous],
+        [delta_pct, "NEW", "CLOSE", "NO CHANGE"],
+        default=delta_pct,
     )
 
     total_portfolio_value = df_comparison["Value"].sum()
@@ -151,29 +151,25 @@ def generate_comparison(df_recent: pd.DataFrame, df_previous: pd.DataFrame | Non
         else total_delta_value / total_portfolio_value * 100
     )
 
-    # Order results by Delta_Value descending
-    df_comparison = df_comparison.sort_values(by=["Delta_Value", "Value"], ascending=[False, False])
+    # Order results by Delta_Value, then Value, descending. One stable lexsort,
+    # applied to the output columns only rather than the whole working frame.
+    order = np.lexsort(
+        (-df_comparison["Value"].to_numpy(), -df_comparison["Delta_Value"].to_numpy())
+    )
+    df_comparison = df_comparison[
+        ["CUSIP", "Ticker", "Company", "Shares", "Delta_Shares", "Value", "Delta_Value", "Delta"]
+    ].take(order)
 
     # Format fields
-    df_comparison["Portfolio%"] = ((df_comparison["Value"] / total_portfolio_value) * 100).apply(
-        lambda x: format_percentage(x, decimal_places=2) if 0.01 <= x < 1 else format_percentage(x)
-    )
+    # Sub-1% weights get a second decimal so small positions stay distinguishable.
+    portfolio_pct = (df_comparison["Value"] / total_portfolio_value) * 100
     df_comparison["Value"] = format_value_series(df_comparison["Value"])
     df_comparison["Delta_Value"] = format_value_series(df_comparison["Delta_Value"])
-
-    df_comparison = df_comparison[
-        [
-            "CUSIP",
-            "Ticker",
-            "Company",
-            "Shares",
-            "Delta_Shares",
-            "Value",
-            "Delta_Value",
-            "Delta",
-            "Portfolio%",
-        ]
-    ]
+    df_comparison["Portfolio%"] = np.where(
+        (portfolio_pct >= 0.01) & (portfolio_pct < 1),
+        format_percentage_series(portfolio_pct, decimal_places=2),
+        format_percentage_series(portfolio_pct),
+    )
 
     # Final Total row
     total_row = pd.DataFrame(
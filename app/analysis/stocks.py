@@ -10,8 +10,11 @@ from app.database import (
     load_quarterly_data,
     load_stocks,
 )
-from app.utils.pd import get_numeric_series, get_percentage_number_series
-from app.utils.strings import format_percentage
+from app.utils.pd import (
+    format_percentage_series,
+    get_numeric_series,
+    get_percentage_number_series,
+)
 
 
 def aggregate_quarter_by_fund(df_quarter: pd.DataFrame) -> pd.DataFrame:
@@ -77,19 +80,12 @@ def aggregate_quarter_by_fund(df_quarter: pd.DataFrame) -> pd.DataFrame:
     )
 
     # Calculate 'Delta' based on aggregated values (for display/legacy compatibility)
-    df_fund_quarter["Delta"] = df_fund_quarter.apply(
-        lambda row: (
-            "CLOSE"
-            if row["Shares"] == 0
-            else "NO CHANGE"
-            if row["Delta_Shares"] == 0
-            else "NEW"
-            if row["Shares"] > 0 and row["Shares"] == row["Delta_Shares"]
-            else format_percentage(
-                row["Delta_Shares"] / (row["Shares"] - row["Delta_Shares"]) * 100, True
-            )
-        ),
-        axis=1,
+    # np.select takes the first matching condition, mirroring the label precedence.
+    shares, delta_shares = df_fund_quarter["Shares"], df_fund_quarter["Delta_Shares"]
+    df_fund_quarter["Delta"] = np.select(
+        [shares == 0, delta_shares == 0, (shares > 0) & (shares == delta_shares)],
+        ["CLOSE", "NO CHANGE", "NEW"],
+        default=format_percentage_series(delta_shares / previous_shares * 100, show_sign=True),
     )
 
     return df_fund_quarter
@@ -28,6 +28,10 @@ from collections.abc import Callable
 
 from fastapi.responses import StreamingResponse
 
+# How long an executor thread waits on an empty log queue before handing
+# control back to the consumer loop.
+_QUEUE_POLL_TIMEOUT_S = 1.0
+
 _request_log_q: contextvars.ContextVar[queue.SimpleQueue | None] = contextvars.ContextVar(
     "_request_log_q", default=None
 )
@@ -100,7 +104,7 @@ def _queue_get_with_timeout(log_q: queue.SimpleQueue) -> tuple | None:
     (or forever, if it hangs). Polling bounds that leak to one timeout window.
     """
     try:
-        return log_q.get(timeout=1.0)
+        return log_q.get(timeout=_QUEUE_POLL_TIMEOUT_S)
     except queue.Empty:
         return None
 
@@ -22,13 +22,6 @@ from pathlib import Path
 
 import pandas as pd
 
-from app.ai.clients import (
-    GitHubClient,
-    GoogleAIClient,
-    GroqClient,
-    HuggingFaceClient,
-    OpenRouterClient,
-)
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -94,6 +87,16 @@ def load_models(filepath: str | None = None) -> list:
     Returns:
         list: A list of dictionaries, each representing an AI model with the 'client' key holding the corresponding client class.
     """
+    # Deferred: the provider clients import the OpenAI/Google SDKs, which most
+    # users of the data layer never need.
+    from app.ai.clients import (
+        GitHubClient,
+        GoogleAIClient,
+        GroqClient,
+        HuggingFaceClient,
+        OpenRouterClient,
+    )
+
     if filepath is None:
         filepath = str(Path(DB_FOLDER) / MODELS_FILE)
     client_map = {
@@ -7,6 +7,7 @@ monkeypatching in tests).
 """
 
 import csv
+import io
 import os
 import tempfile
 import time
@@ -386,6 +387,9 @@ def sort_stocks(filepath: str | None = None) -> None:
     This function ensures the stocks file is clean, sorted, and consistently formatted.
     It sorts entries primarily by 'Ticker' and secondarily by 'CUSIP'.
     Any duplicates are removed keeping 'CUSIP' as the primary key.
+
+    The file is only rewritten when the canonical form differs from what is on
+    disk: an unchanged file keeps its mtime, so the `load_stocks` cache stays warm.
     """
     if filepath is None:
         filepath = str(Path(_db.DB_FOLDER) / _db.STOCKS_FILE)
@@ -393,9 +397,13 @@ def sort_stocks(filepath: str | None = None) -> None:
         from app.utils.pd import atomic_to_csv
 
         with stocks_lock():
-            df = pd.read_csv(filepath, dtype=str, keep_default_na=False).fillna("")
+            with Path(filepath).open(encoding="utf-8", newline="") as f:
+                original = f.read()
+            df = pd.read_csv(io.StringIO(original), dtype=str, keep_default_na=False).fillna("")
             df.drop_duplicates(subset=["CUSIP"], keep="first", inplace=True)
             df.sort_values(by=["Ticker", "CUSIP"], inplace=True)
+            if df.to_csv(index=False, quoting=csv.QUOTE_ALL) == original:
+                return
             atomic_to_csv(df, filepath, index=False, quoting=csv.QUOTE_ALL)
     except Exception:
         logger.error("An error occurred while processing file '%s'", filepath, exc_info=True)
@@ -0,0 +1,92 @@
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from app.scraper.xml_processor import xml_to_dataframe_13f
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_DIR = "__filingcache__"
+# Bump whenever xml_to_dataframe_13f's output changes, so stale parses are
+# ignored instead of silently feeding the old logic's results into reports.
+PARSER_VERSION = 2
+
+
+class FilingCache:
+    """
+    Persistent cache of parsed 13F information tables, keyed by a hash of the raw XML.
+
+    A filing never changes once published, yet every update run re-parses both
+    the latest and the previous quarter's filing, and next quarter's run parses
+    today's latest again as its previous. Parsed frames are stored as CSV next
+    to the other caches; only non-empty parses are stored.
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        """
+        Store the cache directory (defaults to `CACHE_DIR`).
+        """
+        self._dir = Path(path) if path is not None else Path(CACHE_DIR)
+
+    def _path_for(self, xml_content: bytes | str) -> Path:
+        """
+        Returns the cache file for a filing's raw XML.
+        """
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode("utf-8")
+        digest = hashlib.sha1(xml_content, usedforsecurity=False).hexdigest()[:16]
+        return self._dir / f"13f-v{PARSER_VERSION}-{digest}.csv"
+
+    def get(self, xml_content: bytes | str) -> pd.DataFrame | None:
+        """
+        Returns the cached parse of the filing, or None when it is not cached.
+        """
+        path = self._path_for(xml_content)
+        if not path.exists():
+            return None
+        try:
+            return pd.read_csv(
+                path,
+                dtype={"CUSIP": str, "Company": str, "Shares": "int64"},
+                keep_default_na=False,
+                na_values=[""],
+                float_precision="round_trip",
+            )
+        except (OSError, ValueError):
+            logger.warning("Could not read filing cache '%s'", path, exc_info=True)
+            return None
+
+    def put(self, xml_content: bytes | str, df: pd.DataFrame) -> None:
+        """
+        Stores the parse of the filing (a no-op for empty frames). Written to a
+        temporary file first so a crash mid-write never leaves a truncated entry.
+        """
+        if df.empty:
+            return
+        path = self._path_for(xml_content)
+        tmp_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_csv(tmp_path, index=False)
+            tmp_path.replace(path)
+        except OSError:
+            logger.warning("Could not write filing cache '%s'", path, exc_info=True)
+
+
+def parse_13f(xml_content: bytes | str) -> pd.DataFrame:
+    """
+    Parses a 13F information table through the default `FilingCache`.
+
+    A module-level function so process pools can pickle it by reference.
+    """
+    cache = FilingCache()
+    cached = cache.get(xml_content)
+    if cached is not None:
+        return cached
+    df = xml_to_dataframe_13f(xml_content)
+    cache.put(xml_content, df)
+    return df
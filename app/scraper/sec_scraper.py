@@ -1,13 +1,13 @@
 import atexit
 import os
-import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Any
 
-from bs4 import BeautifulSoup
 from curl_cffi import requests
 from curl_cffi.requests import exceptions as curl_exc
+from lxml import etree, html
 from tenacity import retry, retry_if_result, stop_after_attempt, wait_exponential, wait_random
 
 from app.scraper.rate_limiter import RateLimiter
@@ -23,6 +23,13 @@ USER_AGENT = os.environ.get("SEC_USER_AGENT", "Hedge Fund Tracker dok.son@msn.co
 SEC_HOST = "www.sec.gov"
 SEC_URL = "https://" + SEC_HOST
 
+# EDGAR page queries, compiled once and evaluated by libxml2 over the parsed
+# page. A filing index page labels each field with a <div> whose value is the
+# next element ("Filing Date" → <div class="info">2023-05-15</div>).
+_DOCUMENT_BUTTONS_XPATH = etree.XPath("//a[@id='documentsbutton']")
+_LABELLED_VALUE_XPATH = etree.XPath("//div[contains(text(), $label)]/following::*[1]")
+_XML_HREFS_XPATH = etree.XPath("//a[contains(@href, 'xml')]/@href")
+
 
 def _build_session() -> requests.Session:
     """
@@ -48,10 +55,12 @@ def _build_session() -> requests.Session:
 #   bounds requests across all worker threads regardless of how many sessions exist.
 # Lifecycle: sessions are created lazily on first use per thread, closed at interpreter exit
 # via atexit. Use reset_session() in tests to drop them and rebuild the rate limiter, or
-# scraper_session() for a scoped override.
+# scraper_session() for a scoped override. close_session() bumps a generation counter so
+# long-lived threads (the filing scrape pool) rebuild instead of reusing a closed session.
 _thread_local = threading.local()
 _sessions: list[requests.Session] = []
 _sessions_lock = threading.Lock()
+_session_generation = 0
 _rate_limiter = RateLimiter(rate=9, capacity=9)
 
 
@@ -64,11 +73,12 @@ def _get_session() -> requests.Session:
     connections at shutdown.
     """
     session: requests.Session | None = getattr(_thread_local, "session", None)
-    if session is None:
+    if session is None or getattr(_thread_local, "generation", None) != _session_generation:
         session = _build_session()
-        _thread_local.session = session
         with _sessions_lock:
             _sessions.append(session)
+            _thread_local.generation = _session_generation
+        _thread_local.session = session
     return session
 
 
@@ -77,16 +87,18 @@ def close_session() -> None:
     Closes every Session created across all threads, releasing pooled
     connections. Safe to call multiple times.
     """
+    global _session_generation
     with _sessions_lock:
         sessions = list(_sessions)
         _sessions.clear()
+        _session_generation += 1
     for session in sessions:
         try:
             session.close()
         except Exception:
             logger.debug("Error closing a SEC session", exc_info=True)
-    # Drop the current thread's reference so the next call rebuilds it. Other
-    # threads' references go stale but point at already-closed sessions.
+    # Drop the current thread's reference right away; other threads notice the
+    # new generation on their next request and rebuild theirs.
     if hasattr(_thread_local, "session"):
         del _thread_local.session
 
@@ -222,59 +234,86 @@ def _create_search_url(cik, filing_type="13F-HR", start_date=None, start_offset=
     return search_url
 
 
-def _get_accepted(report_page_soup):
+def _parse_page(text: str) -> html.HtmlElement:
+    """
+    Parses an EDGAR HTML page; an empty body yields an empty document.
+    """
+    try:
+        try:
+            return html.document_fromstring(text)
+        except ValueError:
+            # lxml refuses str input that starts with an <?xml ... encoding=...?>
+            # declaration. The text is already decoded, so parse its UTF-8 bytes
+            # as UTF-8 whatever the declaration claims.
+            return html.document_fromstring(
+                text.encode("utf-8"), parser=html.HTMLParser(encoding="utf-8")
+            )
+    except etree.ParserError:
+        return html.document_fromstring("<html></html>")
+
+
+def _get_document_tags(page_text: str) -> list[html.HtmlElement]:
+    """
+    Returns the 'Documents' link of every filing listed on an EDGAR search page.
+    """
+    return _DOCUMENT_BUTTONS_XPATH(_parse_page(page_text))
+
+
+def _get_labelled_value(report_page, label):
+    """
+    Returns the text of the element following the <div> labelled `label`, or None.
+    """
+    values = _LABELLED_VALUE_XPATH(report_page, label=label)
+    return values[0].text_content().strip() if values else None
+
+
+def _get_accepted(report_page):
     """
-    Extracts the accepted time from the report page's soup.
+    Extracts the accepted time from the parsed report page.
     """
     try:
-        filing_date_tag = report_page_soup.find("div", string=re.compile(r"Accepted"))
-        if filing_date_tag:
-            return filing_date_tag.find_next().text.strip()
+        return _get_labelled_value(report_page, "Accepted")
     except Exception:
         logger.error("Error extracting filing accepted time", exc_info=True)
     return None
 
 
-def _get_filing_date(report_page_soup):
+def _get_filing_date(report_page):
     """
-    Extracts the filing date from the report page's soup.
+    Extracts the filing date from the parsed report page.
     """
     try:
-        filing_date_tag = report_page_soup.find("div", string=re.compile(r"Filing Date"))
-        if filing_date_tag:
-            return filing_date_tag.find_next().text.strip()
+        return _get_labelled_value(report_page, "Filing Date")
     except Exception:
         logger.error("Error extracting filing date", exc_info=True)
     return None
 
 
-def _get_report_date(report_page_soup):
+def _get_report_date(report_page):
     """
-    Extracts the report date from the report page's soup.
+    Extracts the report date from the parsed report page.
     """
     try:
-        report_date_tag = report_page_soup.find("div", string=re.compile(r"Period of Report"))
-        if report_date_tag:
-            return report_date_tag.find_next().text.strip()
+        return _get_labelled_value(report_page, "Period of Report")
     except Exception:
         logger.error("Error extracting report date", exc_info=True)
     return None
 
 
-def _get_primary_xml_url(report_page_soup, filing_type):
+def _get_primary_xml_url(report_page, filing_type):
     """
-    Finds the link to the primary XML data file from the report page's soup.
+    Finds the link to the primary XML data file from the parsed report page.
     Uses the configuration based on filing type.
     """
     try:
         config = FILING_SPECS.get(filing_type)
         if config is None:
             return None
-        tags = report_page_soup.find_all("a", attrs={"href": re.compile("xml")})
+        hrefs = _XML_HREFS_XPATH(report_page)
 
         xml_link_index = int(config["xml_link_index"])
-        if len(tags) > xml_link_index:
-            return SEC_URL + tags[xml_link_index].get("href")
+        if len(hrefs) > xml_link_index:
+            return SEC_URL + hrefs[xml_link_index]
     except Exception:
         logger.error("Error finding XML URL for filing type %s", filing_type, exc_info=True)
     return None
@@ -285,22 +324,22 @@ def _scrape_filing(document_tag, filing_type):
     Processes a single filing document tag and extracts the XML content and metadata.
 
     Args:
-        document_tag: BeautifulSoup tag for the document link
+        document_tag: the filing's 'Documents' link element (anything with `.get("href")`)
         filing_type: Type of filing being processed
 
     Returns:
         Dictionary with 'date' and 'xml_content' or None if processing fails
     """
-    report_page_url = SEC_URL + document_tag["href"]
+    report_page_url = SEC_URL + document_tag.get("href")
     report_page_response = _get_request(report_page_url)
     if not report_page_response:
         return None
 
-    report_page_soup = BeautifulSoup(report_page_response.text, "html.parser")
-    filing_date = _get_filing_date(report_page_soup)
-    report_date = _get_report_date(report_page_soup)
-    accepted = _get_accepted(report_page_soup)
-    xml_url = _get_primary_xml_url(report_page_soup, filing_type)
+    report_page = _parse_page(report_page_response.text)
+    filing_date = _get_filing_date(report_page)
+    report_date = _get_report_date(report_page)
+    accepted = _get_accepted(report_page)
+    xml_url = _get_primary_xml_url(report_page, filing_type)
 
     if not (filing_date and xml_url):
         logger.info(
@@ -331,6 +370,38 @@ def _scrape_filing(document_tag, filing_type):
     }
 
 
+# Each filing costs two dependent requests (index page, then XML), so the
+# filings of one search are scraped concurrently to overlap those round-trips.
+# The pool is shared and long-lived so its threads keep their sessions warm;
+# _rate_limiter still bounds the total request rate across every thread.
+_SCRAPE_WORKERS = 8
+_scrape_pool: ThreadPoolExecutor | None = None
+_scrape_pool_lock = threading.Lock()
+
+
+def _get_scrape_pool() -> ThreadPoolExecutor:
+    """
+    Returns the shared filing scrape pool, creating it on first use.
+    """
+    global _scrape_pool
+    with _scrape_pool_lock:
+        if _scrape_pool is None:
+            _scrape_pool = ThreadPoolExecutor(
+                max_workers=_SCRAPE_WORKERS, thread_name_prefix="sec-scrape"
+            )
+        return _scrape_pool
+
+
+def _scrape_filings(tags: list[tuple[Any, str]]) -> list[dict | None]:
+    """
+    Scrapes (document_tag, filing_type) pairs concurrently, returning the
+    results of `_scrape_filing` in input order.
+    """
+    if len(tags) < 2:
+        return [_scrape_filing(tag, filing_type) for tag, filing_type in tags]
+    return list(_get_scrape_pool().map(lambda pair: _scrape_filing(*pair), tags))
+
+
 def fetch_latest_two_13f_filings(cik, offset=0):
     """
     Fetches the raw XML content and filing dates for the two most recent 13F-HR filings for a given CIK.
@@ -342,25 +413,21 @@ def fetch_latest_two_13f_filings(cik, offset=0):
     if not response:
         return None
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    document_tags = soup.find_all("a", id="documentsbutton")
+    document_tags = _get_document_tags(response.text)
 
     if not document_tags:
         logger.info("No 13F-HR filings found for CIK: %s", log_safe(cik))
         return None
 
-    filings = []
-    for tag in document_tags[offset : offset + 2]:
-        filing_data = _scrape_filing(tag, "13F-HR")
-        if filing_data is None:
-            # A partial list would make the caller compare against an empty previous
-            # quarter and rewrite every position as NEW; signal an error instead.
-            logger.warning(
-                "Could not scrape a 13F-HR filing for CIK %s; skipping to avoid a degraded comparison.",
-                log_safe(cik),
-            )
-            return None
-        filings.append(filing_data)
+    filings = _scrape_filings([(tag, "13F-HR") for tag in document_tags[offset : offset + 2]])
+    if any(filing_data is None for filing_data in filings):
+        # A partial list would make the caller compare against an empty previous
+        # quarter and rewrite every position as NEW; signal an error instead.
+        logger.warning(
+            "Could not scrape a 13F-HR filing for CIK %s; skipping to avoid a degraded comparison.",
+            log_safe(cik),
+        )
+        return None
 
     return filings
 
@@ -396,8 +463,7 @@ def fetch_non_quarterly_after_date(cik: str, start_date: str | None) -> list[dic
                         offset,
                     )
                     break
-                soup = BeautifulSoup(resp.text, "html.parser")
-                all_tags_on_page = soup.find_all("a", id="documentsbutton")
+                all_tags_on_page = _get_document_tags(resp.text)
 
                 if not all_tags_on_page:
                     break
@@ -409,9 +475,9 @@ def fetch_non_quarterly_after_date(cik: str, start_date: str | None) -> list[dic
                 type_reject = spec.get("type_reject", set())
                 filtered_tags = []
                 for tag in all_tags_on_page:
-                    row = tag.find_parent("tr")
-                    cells = row.find_all("td") if row else []
-                    actual_type = cells[0].get_text(strip=True) if cells else ""
+                    rows = tag.xpath("ancestor::tr[1]")
+                    cells = rows[0].findall(".//td") if rows else []
+                    actual_type = cells[0].text_content().strip() if cells else ""
                     if type_prefix and not actual_type.startswith(type_prefix):
                         continue
                     if any(actual_type.startswith(r) for r in type_reject):
@@ -454,10 +520,7 @@ def fetch_non_quarterly_after_date(cik: str, start_date: str | None) -> list[dic
         )
         return filings
 
-    for tag, f_type in all_tags:
-        filing_data = _scrape_filing(tag, f_type)
-        if filing_data:
-            filings.append(filing_data)
+    filings.extend(filing_data for filing_data in _scrape_filings(all_tags) if filing_data)
 
     return filings
 
@@ -482,9 +545,8 @@ def get_latest_13f_filing_date(cik: str) -> str | None:
         return None
 
     try:
-        soup = BeautifulSoup(response.text, "html.parser")
-        button = soup.find("a", id="documentsbutton")
-        if not button:
+        buttons = _get_document_tags(response.text)
+        if not buttons:
             logger.info(
                 "No 'documentsbutton' found for CIK %s on page %s",
                 log_safe(cik),
@@ -493,11 +555,11 @@ def get_latest_13f_filing_date(cik: str) -> str | None:
             return None
 
         # The filing date is in the 4th <td> of the same <tr> as the button
-        row = button.find_parent("tr")
-        if row is None:
+        rows = buttons[0].xpath("ancestor::tr[1]")
+        if not rows:
             return None
-        return row.find_all("td")[3].text.strip()
-    except (AttributeError, IndexError):
+        return rows[0].findall(".//td")[3].text_content().strip()
+    except IndexError:
         logger.error(
             "Error parsing filing date for CIK %s. Page structure may have changed.",
             log_safe(cik),
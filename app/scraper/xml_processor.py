@@ -1,8 +1,10 @@
+import io
 import re
 import warnings
 
 import pandas as pd
 from bs4 import BeautifulSoup, Tag, XMLParsedAsHTMLWarning
+from lxml import etree
 
 from app.stocks.ticker_resolver import TickerResolver
 from app.utils.logger import get_logger, log_safe
@@ -12,11 +14,12 @@ logger = get_logger(__name__)
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 
 # Strip ``<!ENTITY ...>`` and ``<!DOCTYPE ...>`` declarations before parsing.
-# We currently use BeautifulSoup with lxml's HTML parser, which does not
-# resolve external entities, so XXE is not exploitable today. This sanitiser
-# is belt-and-suspenders: if a future change switches to ``lxml-xml`` or a
-# different parser that honours DTDs, SEC filings cannot smuggle in external
-# entity references that exfiltrate local files or trigger SSRF.
+# The schedule/Form 4 parsers use BeautifulSoup with lxml's HTML parser and
+# the 13F parser uses lxml's XML iterparse with entity resolution and network
+# access disabled, so XXE is not exploitable today. This sanitiser is
+# belt-and-suspenders: if a parser option ever changes to honour DTDs, SEC
+# filings cannot smuggle in external entity references that exfiltrate local
+# files or trigger SSRF.
 # We strip ENTITY first so the subsequent DOCTYPE match doesn't have to deal
 # with nested ``>`` characters inside the internal subset.
 _ENTITY_RE = re.compile(rb"<!ENTITY[^>]*>", re.IGNORECASE)
@@ -50,28 +53,74 @@ def _get_tag_text(element, tag_suffix):
     return None
 
 
-def xml_to_dataframe_13f(xml_content):
+def _local_name(element) -> str:
     """
-    Parses the XML content of a 13F filing and returns the data as a Pandas DataFrame.
+    Returns the lower-cased tag name of an lxml element without its namespace
+    URI or prefix, or '' for comments and processing instructions.
     """
-    soup_xml = BeautifulSoup(_sanitize_xml(xml_content), "lxml")
+    tag = element.tag
+    if not isinstance(tag, str):
+        return ""
+    return tag.rpartition("}")[2].rpartition(":")[2].lower()
 
-    columns = ["Company", "CUSIP", "Value", "Shares", "Put/Call"]
 
-    data = []
+# Child fields read from each 13F <infoTable>, matched by tag-name suffix.
+_13F_FIELDS = ("nameofissuer", "cusip", "value", "sshprnamt", "putcall")
 
-    for info_table in soup_xml.find_all(lambda tag: tag.name.endswith("infotable")):
-        company = _get_tag_text(info_table, "nameofissuer")
-        cusip = _get_tag_text(info_table, "cusip")
-        value = _get_tag_text(info_table, "value")
-        shares = _get_tag_text(info_table, "sshprnamt")
-        put_call = _get_tag_text(info_table, "putcall") or ""
 
-        data.append([company, cusip, value, shares, put_call])
+def _iter_13f_rows(xml_bytes: bytes):
+    """
+    Streams the <infoTable> entries of a 13F information table as
+    (company, cusip, value, shares) tuples, skipping option (Put/Call) rows.
+    Company names come out with whitespace runs collapsed to single spaces.
+
+    Each entry is read in one pass over its descendants, taking the first tag
+    whose name ends with each field, and is cleared once read so memory stays
+    flat on large filings. Parsing recovers from malformed markup the way the
+    HTML parser used to, keeping whatever rows precede the damage.
+    """
+    events = etree.iterparse(
+        io.BytesIO(xml_bytes),
+        events=("end",),
+        recover=True,
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True,
+    )
+    try:
+        for _, element in events:
+            if not _local_name(element).endswith("infotable"):
+                continue
+            found: dict[str, str] = {}
+            for child in element.iterdescendants():
+                name = _local_name(child)
+                for field in _13F_FIELDS:
+                    if field not in found and name.endswith(field):
+                        found[field] = "".join(child.itertext()).strip()
+            if not found.get("putcall"):
+                company = found.get("nameofissuer")
+                yield (
+                    # Collapse whitespace runs here, while the string is at hand,
+                    # instead of in a regex pass over the whole column later.
+                    " ".join(company.split()) if company is not None else None,
+                    found.get("cusip"),
+                    found.get("value"),
+                    found.get("sshprnamt"),
+                )
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+    except etree.XMLSyntaxError:
+        logger.warning("13F information table could not be parsed", exc_info=True)
 
-    df = pd.DataFrame(data, columns=columns)
 
-    df = df[df["Put/Call"] == ""].drop("Put/Call", axis=1)
+def xml_to_dataframe_13f(xml_content):
+    """
+    Parses the XML content of a 13F filing and returns the data as a Pandas DataFrame.
+    """
+    columns = ["Company", "CUSIP", "Value", "Shares"]
+    # Options are dropped while parsing, so they never reach the DataFrame.
+    df = pd.DataFrame.from_records(_iter_13f_rows(_sanitize_xml(xml_content)), columns=columns)
 
     # PRN (principal-amount) rows are kept on purpose: the saved per-fund CSV
     # must stay a faithful record of the filing, debt positions included.
@@ -79,7 +128,6 @@ def xml_to_dataframe_13f(xml_content):
 
     df = df[(df["Value"] != "0") & (df["Shares"] != "0")]
 
-    df["Company"] = df["Company"].str.strip().str.replace(r"\s+", " ", regex=True)
     df["CUSIP"] = df["CUSIP"].str.upper()
     df["Value"] = pd.to_numeric(df["Value"], errors="coerce")
     df["Shares"] = pd.to_numeric(df["Shares"], errors="coerce")
@@ -97,7 +145,7 @@ def xml_to_dataframe_13f(xml_content):
     # Some funds report Value in thousands instead of full dollars (SEC XML
     # spec requires full dollars). Median implied price < $0.50 across an
     # institutional portfolio is only possible if scaled by 1000.
-    implied_prices = (df["Value"] / df["Shares"].replace(0, pd.NA)).dropna()
+    implied_prices = (df["Value"] / df["Shares"].where(df["Shares"] != 0)).dropna()
     if implied_prices.empty:
         return df
     median_price = float(implied_prices.median())
@@ -106,9 +154,20 @@ def xml_to_dataframe_13f(xml_content):
     if median_price < PRICE_THRESHOLD:
         df["Value"] = df["Value"] * 1000
 
-    return df.groupby(["CUSIP"], as_index=False).agg(
-        {"Company": "max", "Value": "sum", "Shares": "sum"}
-    )
+    # Most CUSIPs appear once per filing, so only the repeated ones go through
+    # the (object-column) groupby; the rest pass straight through. Holdings
+    # without a CUSIP can't be merged or resolved, so they're dropped first.
+    output_columns = ["CUSIP", "Company", "Value", "Shares"]
+    df = df[df["CUSIP"].notna()]
+    repeated = df["CUSIP"].duplicated(keep=False)
+    if repeated.any():
+        merged = (
+            df[repeated]
+            .groupby("CUSIP", as_index=False)
+            .agg({"Company": "max", "Value": "sum", "Shares": "sum"})
+        )
+        df = pd.concat([df.loc[~repeated, output_columns], merged])
+    return df[output_columns].sort_values("CUSIP", ignore_index=True)
 
 
 def xml_to_dataframe_schedule(xml_content):
@@ -140,9 +199,9 @@ def xml_to_dataframe_schedule(xml_content):
         )
         owner_name = _get_tag_text(reporting_person, "reportingpersonname")
 
-        data.append([company, cusip, cik, shares, owner_cik, owner_name, date])
+        data.append((company, cusip, cik, shares, owner_cik, owner_name, date))
 
-    df = pd.DataFrame(data, columns=columns)
+    df = pd.DataFrame.from_records(data, columns=columns)
 
     df["Company"] = df["Company"].str.replace(r"\s+", " ", regex=True)
     df["CUSIP"] = df["CUSIP"].str.upper()
@@ -213,9 +272,9 @@ def xml_to_dataframe_4(xml_content):
         owner_cik = _get_tag_text(reporting_person, "rptownercik")
         owner_name = _get_tag_text(reporting_person, "rptownername")
 
-        data.append([company, ticker, cik, total_shares, owner_cik, owner_name, date])
+        data.append((company, ticker, cik, total_shares, owner_cik, owner_name, date))
 
-    df = pd.DataFrame(data, columns=columns)
+    df = pd.DataFrame.from_records(data, columns=columns)
 
     df["Company"] = df["Company"].str.replace(r"\s+", " ", regex=True)
     df["Ticker"] = df["Ticker"].str.replace(r"[^a-zA-Z0-9]", "", regex=True).str.upper()
@@ -21,10 +21,10 @@ import os
 import re
 from typing import cast
 
-from curl_cffi import requests
 from curl_cffi.requests.exceptions import RequestException
 
 from app.database import load_sector_hierarchy, load_stocks
+from app.stocks.libraries import http_session
 from app.stocks.libraries.yfinance import YFinance
 from app.utils.logger import get_logger, log_safe
 
@@ -77,7 +77,9 @@ def _llm_classify(ticker: str, company: str) -> str | None:
     )
 
     try:
-        response = requests.post(
+        # Pooled per-thread session: a resolve run classifies every new
+        # ticker, so the Groq connection is reused instead of re-handshaken.
+        response = http_session.post(
             GROQ_URL,
             headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
             json={
@@ -1,6 +1,15 @@
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
+from app.utils.logger import get_logger, log_safe
+
+logger = get_logger(__name__)
+
+# Marks a CUSIP whose lookup failed (as opposed to one the library has no ticker for).
+_LOOKUP_FAILED = object()
+
 
 class FinanceLibrary(ABC):
     """
@@ -10,6 +19,9 @@ class FinanceLibrary(ABC):
     company / price information from different financial data sources.
 
     `get_ticker` and `get_company` are required (every library must implement them).
+    `get_ticker` returns None only when the source has no match; a lookup that
+    could not be answered (network error, rate limit, bad response) should raise,
+    so batch resolution can tell a definitive miss from an outage.
     Price-related methods are optional — subclasses override the ones they support;
     the base no-op default returns None so PriceFetcher can iterate over libraries
     without runtime hasattr checks.
@@ -31,6 +43,47 @@ class FinanceLibrary(ABC):
         """
         pass
 
+    # Concurrent per-CUSIP lookups in the default get_tickers. Kept at 2: the
+    # lookups are latency-bound, but Yahoo bans IPs that sweep it harder.
+    LOOKUP_WORKERS = 2
+
+    @classmethod
+    def _safe_get_ticker(cls, cusip: str, company: str) -> str | None | object:
+        """
+        Calls `get_ticker`, logging failures and returning `_LOOKUP_FAILED` for
+        them so one bad lookup does not abort a batch.
+        """
+        try:
+            return cls.get_ticker(cusip, company_name=company) or None
+        except Exception:
+            logger.warning(
+                "%s: Failed to resolve ticker for CUSIP %s",
+                cls.__name__,
+                log_safe(cusip),
+                exc_info=True,
+            )
+            return _LOOKUP_FAILED
+
+    @classmethod
+    def get_tickers(cls, companies: dict[str, str]) -> dict[str, str | None]:
+        """
+        Resolves many CUSIPs at once from a CUSIP → company-name mapping and
+        returns the CUSIPs the library answered, mapped to their ticker or to
+        None when it has no match. CUSIPs whose lookup failed are left out.
+
+        The default runs `get_ticker` per CUSIP on `LOOKUP_WORKERS` threads, so
+        wall time scales with N / workers round-trips instead of N; libraries
+        with a batch endpoint override it.
+        """
+        if not companies:
+            return {}
+        results = get_lookup_pool().map(cls._safe_get_ticker, companies.keys(), companies.values())
+        return {
+            cusip: ticker
+            for cusip, ticker in zip(companies, results, strict=True)
+            if ticker is not _LOOKUP_FAILED
+        }
+
     @staticmethod
     def get_current_price(ticker: str, **kwargs) -> float | None:
         """
@@ -51,3 +104,23 @@ class FinanceLibrary(ABC):
         Gets historical price points for a ticker. Default no-op.
         """
         return None
+
+
+# Per-CUSIP lookups run on one shared, long-lived pool (like the SEC scrape pool),
+# so the same LOOKUP_WORKERS threads, and their pooled http_session connections,
+# serve every batch instead of each batch spawning threads that leak a session.
+_lookup_pool: ThreadPoolExecutor | None = None
+_lookup_pool_lock = threading.Lock()
+
+
+def get_lookup_pool() -> ThreadPoolExecutor:
+    """
+    Returns the shared library lookup pool, creating it on first use.
+    """
+    global _lookup_pool
+    with _lookup_pool_lock:
+        if _lookup_pool is None:
+            _lookup_pool = ThreadPoolExecutor(
+                max_workers=FinanceLibrary.LOOKUP_WORKERS, thread_name_prefix="library-lookup"
+            )
+        return _lookup_pool
@@ -1,9 +1,9 @@
 import os
 
-from curl_cffi import requests
 from curl_cffi.requests.exceptions import RequestException
 from dotenv import load_dotenv
 
+from app.stocks.libraries import http_session
 from app.utils.logger import get_logger, log_safe
 
 logger = get_logger(__name__)
@@ -40,7 +40,7 @@ class FMP:
             return None
 
         try:
-            response = requests.get(
+            response = http_session.get(
                 FMP.ENDPOINT,
                 params={"symbol": ticker, "apikey": FMP.API_KEY},
                 timeout=FMP.TIMEOUT,
@@ -0,0 +1,84 @@
+"""
+Pooled HTTP sessions shared by the finance library clients.
+
+Module-level `curl_cffi.requests.get/post` build and tear down a Session per
+call, paying a fresh TCP+TLS handshake for every CUSIP or price lookup. The
+helpers here route those calls through a Session kept per thread (curl_cffi
+Sessions wrap a single libcurl handle and are not thread-safe; the resolver
+fans lookups across a small thread pool), so connections to each API host are
+reused for the life of the process. Mirrors the SEC scraper's session handling.
+
+Sessions are registered by owning thread: creating a new one closes those of
+threads that have exited (e.g. SSE job threads), so short-lived threads do not
+leak a connection pool each for the life of the API server.
+"""
+
+import atexit
+import threading
+
+from curl_cffi import requests
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_thread_local = threading.local()
+_sessions: dict[threading.Thread, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Returns the calling thread's Session, creating and registering it on first use
+    (and closing the sessions of threads that have since exited).
+    """
+    session: requests.Session | None = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+        with _sessions_lock:
+            dead = [thread for thread in _sessions if not thread.is_alive()]
+            stale = [_sessions.pop(thread) for thread in dead]
+            _sessions[threading.current_thread()] = session
+        _close_all(stale)
+    return session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """
+    Sends a GET through the calling thread's pooled Session.
+    """
+    return _get_session().get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """
+    Sends a POST through the calling thread's pooled Session.
+    """
+    return _get_session().post(url, **kwargs)
+
+
+def close_sessions() -> None:
+    """
+    Closes every Session created across all threads. Safe to call multiple times.
+    """
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    _close_all(sessions)
+    if hasattr(_thread_local, "session"):
+        del _thread_local.session
+
+
+def _close_all(sessions: list[requests.Session]) -> None:
+    """
+    Closes the given sessions, ignoring errors from already-broken handles.
+    """
+    for session in sessions:
+        try:
+            session.close()
+        except Exception:
+            logger.debug("Error closing a library session", exc_info=True)
+
+
+atexit.register(close_sessions)
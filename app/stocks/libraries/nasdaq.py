@@ -1,7 +1,6 @@
 from datetime import date, timedelta
 
-from curl_cffi import requests
-
+from app.stocks.libraries import http_session
 from app.stocks.libraries.base_library import FinanceLibrary
 from app.utils.logger import get_logger
 
@@ -27,7 +26,7 @@ class Nasdaq(FinanceLibrary):
         Returns a list of dicts with 'oldSymbol', 'newSymbol', and 'companyName' keys.
         """
         try:
-            resp = requests.get(Nasdaq.SYMBOL_CHANGE_URL, headers=Nasdaq.HEADERS, timeout=10)
+            resp = http_session.get(Nasdaq.SYMBOL_CHANGE_URL, headers=Nasdaq.HEADERS, timeout=10)
             data = resp.json().get("data")
             if not data:
                 return []
@@ -67,7 +66,7 @@ class Nasdaq(FinanceLibrary):
                     f"{Nasdaq.BASE_URL}/{ticker}/historical"
                     f"?assetclass={asset_class}&fromdate={from_str}&todate={to_str}&limit=5"
                 )
-                resp = requests.get(url, headers=Nasdaq.HEADERS, timeout=10)
+                resp = http_session.get(url, headers=Nasdaq.HEADERS, timeout=10)
                 data = resp.json().get("data")
                 if data and data.get("tradesTable", {}).get("rows"):
                     for row in data["tradesTable"]["rows"]:
@@ -122,7 +121,7 @@ class Nasdaq(FinanceLibrary):
                     f"{Nasdaq.BASE_URL}/{ticker}/historical"
                     f"?assetclass={asset_class}&fromdate={date_str_from}&todate={date_str_to}&limit=1"
                 )
-                resp = requests.get(url, headers=Nasdaq.HEADERS, timeout=10)
+                resp = http_session.get(url, headers=Nasdaq.HEADERS, timeout=10)
                 data = resp.json().get("data")
                 if data and data.get("tradesTable", {}).get("rows"):
                     close = Nasdaq._parse_price(data["tradesTable"]["rows"][0].get("close"))
@@ -1,10 +1,13 @@
 import os
-import time
+import threading
+from collections.abc import Iterator
+from functools import lru_cache
 
-from curl_cffi import requests
-from curl_cffi.requests.exceptions import RequestException
+from curl_cffi.requests.exceptions import HTTPError, RequestException
 from dotenv import load_dotenv
 
+from app.scraper.rate_limiter import RateLimiter
+from app.stocks.libraries import http_session
 from app.stocks.libraries.base_library import FinanceLibrary
 from app.stocks.utils.identifiers import normalize_ticker
 from app.utils.logger import get_logger, log_safe
@@ -30,64 +33,124 @@ class OpenFIGI(FinanceLibrary):
     TIMEOUT = 10
     PREFERRED_SECURITY_TYPES = {"Common Stock", "Depositary Receipt", "ADR", "REIT", "ETP"}
 
+    # Mapping quota: 25 requests/minute anonymously, 25 per 6 seconds with a key.
+    # Capacity 1 spaces requests evenly instead of bursting into a 429.
+    _ANONYMOUS_LIMITER = RateLimiter(rate=25 / 60, capacity=1)
+    _API_KEY_LIMITER = RateLimiter(rate=25 / 6, capacity=1)
+
+    # Answers from batched mapping requests (record, or None for "no match"),
+    # reused by the single-CUSIP lookups so the resolver's get_company fallback
+    # does not spend another rate-limited request on an already mapped CUSIP.
+    # Oldest answers are dropped past the same size as `_lookup_by_cusip`'s cache.
+    _BATCH_RECORDS_MAXSIZE = 4096
+    _batch_records: dict[str, dict | None] = {}
+    _batch_records_lock = threading.Lock()
+
     @staticmethod
-    def _post(payload: list[dict]) -> list | None:
+    def _limiter() -> RateLimiter:
+        """
+        Returns the token bucket matching the configured API key tier.
         """
-        POSTs a mapping payload to OpenFIGI. Returns the parsed JSON list on
-        success, or None on rate limit / HTTP error / network failure.
+        return OpenFIGI._API_KEY_LIMITER if OpenFIGI.API_KEY else OpenFIGI._ANONYMOUS_LIMITER
+
+    @staticmethod
+    def _post(payload: list[dict]) -> list:
+        """
+        POSTs a mapping payload to OpenFIGI and returns the parsed JSON list.
+        A network failure, rate limit or other non-OK status raises
+        RequestException, and an invalid JSON body raises ValueError, so a
+        failed request is never mistaken for (or cached as) "no match".
+
+        Every request first takes a token from the tier's limiter, so batched
+        and single-CUSIP lookups from any thread share one quota and time
+        already spent on the previous request counts towards the spacing.
         """
         headers = {"Content-Type": "application/json"}
         if OpenFIGI.API_KEY:
             headers["X-OPENFIGI-APIKEY"] = OpenFIGI.API_KEY
 
-        try:
-            response = requests.post(
-                OpenFIGI.ENDPOINT,
-                json=payload,
-                headers=headers,
-                timeout=OpenFIGI.TIMEOUT,
-            )
-        except RequestException:
-            logger.warning("OpenFIGI: network error", exc_info=True)
-            return None
+        OpenFIGI._limiter().acquire()
+        response = http_session.post(
+            OpenFIGI.ENDPOINT,
+            json=payload,
+            headers=headers,
+            timeout=OpenFIGI.TIMEOUT,
+        )
 
         if response.status_code == 429:
-            logger.warning("OpenFIGI: rate limit hit (HTTP 429)")
-            return None
+            raise HTTPError("OpenFIGI: rate limit hit (HTTP 429)")
 
         if not response.ok:
-            logger.warning("OpenFIGI: HTTP %s response", response.status_code)
-            return None
+            raise HTTPError(f"OpenFIGI: HTTP {response.status_code} response")
 
-        try:
-            return response.json()
-        except ValueError:
-            logger.warning("OpenFIGI: invalid JSON response", exc_info=True)
-            return None
+        return response.json()
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _lookup_by_cusip(cusip: str) -> dict | None:
         """
         Looks up a CUSIP and returns the best-matching record, preferring
         Common Stock and similar equity-like security types.
 
+        Memoized for the process: the resolver asks for the ticker and then the
+        company of the same CUSIP, which would otherwise cost two requests
+        against a ~25 requests/minute budget. Request failures propagate from
+        `_post` and so are not cached.
+
         Restricted to the US composite exchange: without exchCode the API can
         return a foreign listing's symbol first, which is useless for this
         US-equity database and poisons ticker comparisons.
         """
         results = OpenFIGI._post([{"idType": "ID_CUSIP", "idValue": cusip, "exchCode": "US"}])
-        if not results:
-            return None
+        if not isinstance(results, list) or len(results) != 1:
+            raise ValueError("OpenFIGI: expected one mapping result")
+        return OpenFIGI._job_record(results[0])
 
-        first = results[0]
-        if not isinstance(first, dict):
-            return None
+    @staticmethod
+    def _job_record(job) -> dict | None:
+        """
+        Returns the best record of one mapping job's result, or None when
+        OpenFIGI answered "no match" (a `warning` or empty `data`).
 
-        data = first.get("data") or []
-        if not data:
-            return None
+        Raises:
+            ValueError: For a per-job `error` or an unrecognised entry, which
+                must stay unanswered rather than count as a confirmed miss.
+        """
+        if isinstance(job, dict) and "error" not in job:
+            data = job.get("data")
+            if data:
+                return OpenFIGI._best_record(data)
+            if "warning" in job or "data" in job:
+                return None
+        raise ValueError(f"OpenFIGI: unusable mapping result {job!r}")
 
-        return OpenFIGI._best_record(data)
+    @staticmethod
+    def _remember_batch(records: dict[str, dict | None]) -> None:
+        """
+        Stores a batch's answers for `_safe_lookup`, dropping the oldest past
+        `_BATCH_RECORDS_MAXSIZE`.
+        """
+        with OpenFIGI._batch_records_lock:
+            for cusip, record in records.items():
+                OpenFIGI._batch_records.pop(cusip, None)
+                OpenFIGI._batch_records[cusip] = record
+            while len(OpenFIGI._batch_records) > OpenFIGI._BATCH_RECORDS_MAXSIZE:
+                del OpenFIGI._batch_records[next(iter(OpenFIGI._batch_records))]
+
+    @staticmethod
+    def _safe_lookup(cusip: str) -> dict | None:
+        """
+        Returns the batch-mapped answer for `cusip` if there is one, otherwise
+        calls `_lookup_by_cusip`, logging a failed request and returning None.
+        """
+        with OpenFIGI._batch_records_lock:
+            if cusip in OpenFIGI._batch_records:
+                return OpenFIGI._batch_records[cusip]
+        try:
+            return OpenFIGI._lookup_by_cusip(cusip)
+        except (RequestException, ValueError):
+            logger.warning("OpenFIGI: lookup failed for CUSIP %s", log_safe(cusip), exc_info=True)
+            return None
 
     @staticmethod
     def _best_record(data: list[dict]) -> dict:
@@ -101,42 +164,68 @@ class OpenFIGI(FinanceLibrary):
         return data[0]
 
     @staticmethod
-    def map_cusips(cusips: list[str]) -> dict[str, dict]:
+    def _map_batches(
+        cusips: list[str],
+    ) -> Iterator[tuple[list[str], dict[str, dict | None] | None]]:
         """
-        Maps many CUSIPs to their best US-listing record in batched requests.
+        Maps CUSIPs in batched requests, yielding each batch with the answer per
+        CUSIP: the best US-listing record, or None for "no match". CUSIPs whose
+        job returned an error are omitted, and the whole batch is None when the
+        request failed or the response does not have one result per job.
 
-        Batch size and pacing follow OpenFIGI's job limits (100 jobs/request
-        with an API key, 10 without). Unresolved CUSIPs and failed batches are
-        omitted from the result, so callers see only confirmed mappings.
+        Batch size follows OpenFIGI's job limits (100 jobs/request with an API
+        key, 10 without); pacing is left to `_post`'s rate limiter.
         """
         batch_size = 100 if OpenFIGI.API_KEY else 10
-        pause = 0.3 if OpenFIGI.API_KEY else 2.6
         total_batches = -(-len(cusips) // batch_size)
-        records: dict[str, dict] = {}
         for batch_index, start in enumerate(range(0, len(cusips), batch_size)):
-            if start:
-                time.sleep(pause)
             if batch_index and batch_index % 10 == 0:
                 logger.progress("OpenFIGI mapping: batch %d/%d", batch_index, total_batches)
             chunk = cusips[start : start + batch_size]
             payload = [
                 {"idType": "ID_CUSIP", "idValue": cusip, "exchCode": "US"} for cusip in chunk
             ]
-            responses = OpenFIGI._post(payload)
-            if not responses:
+            try:
+                responses = OpenFIGI._post(payload)
+                if not isinstance(responses, list) or len(responses) != len(chunk):
+                    raise ValueError(
+                        f"OpenFIGI: {len(chunk)} jobs sent, malformed or short response"
+                    )
+            except (RequestException, ValueError):
+                logger.warning("OpenFIGI: mapping batch failed", exc_info=True)
+                yield chunk, None
                 continue
-            for cusip, response in zip(chunk, responses, strict=False):
-                data = response.get("data") if isinstance(response, dict) else None
-                if data:
-                    records[cusip] = OpenFIGI._best_record(data)
+            records: dict[str, dict | None] = {}
+            for cusip, response in zip(chunk, responses, strict=True):
+                try:
+                    records[cusip] = OpenFIGI._job_record(response)
+                except ValueError:
+                    logger.warning("OpenFIGI: mapping failed for CUSIP %s", log_safe(cusip))
+            OpenFIGI._remember_batch(records)
+            yield chunk, records
+
+    @staticmethod
+    def map_cusips(cusips: list[str]) -> dict[str, dict]:
+        """
+        Maps many CUSIPs to their best US-listing record in batched requests.
+        Unresolved CUSIPs and failed batches are omitted from the result, so
+        callers see only confirmed mappings.
+        """
+        records: dict[str, dict] = {}
+        for _chunk, batch in OpenFIGI._map_batches(cusips):
+            if batch:
+                records.update(
+                    (cusip, record) for cusip, record in batch.items() if record is not None
+                )
         return records
 
     @staticmethod
     def get_ticker(cusip: str, **kwargs) -> str | None:
         """
-        Returns the ticker for a given CUSIP, or None if no match.
+        Returns the ticker for a given CUSIP, or None if no match (or if the
+        request failed; batch resolution goes through `get_tickers` instead).
         """
-        match = OpenFIGI._lookup_by_cusip(cusip)
+        match = OpenFIGI._safe_lookup(cusip)
         if not match:
             logger.warning("OpenFIGI: No ticker found for CUSIP %s", log_safe(cusip))
             return None
@@ -146,12 +235,28 @@ class OpenFIGI(FinanceLibrary):
             return None
         return normalize_ticker(ticker) or None
 
+    @classmethod
+    def get_tickers(cls, companies: dict[str, str]) -> dict[str, str | None]:
+        """
+        Resolves many CUSIPs through the batched mapping endpoint (see
+        `_map_batches`), so N CUSIPs cost ceil(N/100) requests instead of N.
+        CUSIPs of a failed batch or job are left out, per the base contract.
+        """
+        tickers: dict[str, str | None] = {}
+        for _chunk, batch in OpenFIGI._map_batches(list(companies)):
+            if batch is None:
+                continue
+            for cusip, record in batch.items():
+                ticker = (record or {}).get("ticker") or ""
+                tickers[cusip] = normalize_ticker(ticker) or None
+        return tickers
+
     @staticmethod
     def get_company(cusip: str, **kwargs) -> str | None:
         """
         Returns the formatted company name for a given CUSIP, or None.
         """
-        match = OpenFIGI._lookup_by_cusip(cusip)
+        match = OpenFIGI._safe_lookup(cusip)
         if not match:
             logger.warning("OpenFIGI: No company found for CUSIP %s", log_safe(cusip))
             return None
@@ -1,7 +1,6 @@
 from datetime import date
 
-from curl_cffi import requests
-
+from app.stocks.libraries import http_session
 from app.stocks.libraries.base_library import FinanceLibrary
 from app.utils.logger import get_logger, log_safe
 
@@ -52,7 +51,7 @@ class StockAnalysis(FinanceLibrary):
         """
         url = f"{StockAnalysis.BASE_URL}/{ticker}/history?range={api_range}&period={api_period}"
         try:
-            response = requests.get(url, headers=StockAnalysis.HEADERS, timeout=10)
+            response = http_session.get(url, headers=StockAnalysis.HEADERS, timeout=10)
             data = response.json().get("data")
             return data or []
         except Exception:
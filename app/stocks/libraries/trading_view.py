@@ -1,13 +1,14 @@
 import logging
 import re
 from datetime import date
+from functools import lru_cache
 
 import pandas as pd
-from curl_cffi import requests
-from curl_cffi.requests.exceptions import RequestException
+from curl_cffi.requests.exceptions import HTTPError, RequestException
 from tvDatafeed import Interval as TvInterval
 from tvDatafeed import TvDatafeed
 
+from app.stocks.libraries import http_session
 from app.stocks.libraries.base_library import FinanceLibrary
 from app.stocks.utils.identifiers import cusip_to_isin, normalize_ticker
 from app.utils.logger import get_logger, log_safe
@@ -46,46 +47,44 @@ class TradingView(FinanceLibrary):
     SYMBOL_SEARCH_TIMEOUT = 8
 
     @staticmethod
-    def _search_by_text(query: str) -> list[dict]:
+    @lru_cache(maxsize=8192)
+    def _search_by_text(query: str) -> tuple[dict, ...]:
         """
         Calls the TradingView symbol_search endpoint with an arbitrary query string
-        (ISIN or company name) and returns the raw symbols list, or an empty list on
-        network/HTTP/JSON failure.
+        (ISIN or company name) and returns the raw symbols (empty when nothing
+        matches). Network and HTTP errors raise RequestException and an invalid
+        JSON body raises ValueError.
+
+        Memoized per query string: share classes of one issuer (GOOG/GOOGL) fall
+        back to the same company-name search, which is then sent only once.
+        Failures raise instead of returning, so they are never cached.
+        Results are shared between callers and must not be mutated.
         """
         params = {"text": query, "hl": "1", "lang": "en", "domain": "production"}
-        try:
-            response = requests.get(
-                TradingView.SYMBOL_SEARCH_URL,
-                params=params,
-                headers=TradingView.SYMBOL_SEARCH_HEADERS,
-                timeout=TradingView.SYMBOL_SEARCH_TIMEOUT,
-            )
-        except RequestException:
-            logger.warning("TradingView: network error during symbol_search", exc_info=True)
-            return []
-
+        response = http_session.get(
+            TradingView.SYMBOL_SEARCH_URL,
+            params=params,
+            headers=TradingView.SYMBOL_SEARCH_HEADERS,
+            timeout=TradingView.SYMBOL_SEARCH_TIMEOUT,
+        )
         if not response.ok:
-            logger.warning("TradingView: symbol_search HTTP %s", response.status_code)
-            return []
+            raise HTTPError(f"TradingView: symbol_search HTTP {response.status_code}")
 
-        try:
-            payload = response.json()
-        except ValueError:
-            return []
+        payload = response.json()
 
         symbols = payload.get("symbols") if isinstance(payload, dict) else payload
         if not symbols:
-            return []
+            return ()
         # Strip <em>...</em> highlight markup from symbol and description fields.
         for entry in symbols:
             for field in ("symbol", "description"):
                 value = entry.get(field)
                 if isinstance(value, str):
                     entry[field] = _EM_TAGS.sub("", value)
-        return symbols
+        return tuple(symbols)
 
     @staticmethod
-    def _first_us_match(symbols: list[dict]) -> dict | None:
+    def _first_us_match(symbols: tuple[dict, ...]) -> dict | None:
         """
         Returns the first symbol listed on a recognised US exchange, or None.
         """
@@ -110,6 +109,21 @@ class TradingView(FinanceLibrary):
         possibly-stale 13F filing.
         """
         del company_name  # tolerated for chain interface; intentionally not used
+        try:
+            return TradingView._search_cusip(cusip)
+        except (RequestException, ValueError):
+            logger.warning(
+                "TradingView: symbol_search failed for CUSIP %s", log_safe(cusip), exc_info=True
+            )
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _search_cusip(cusip: str) -> dict | None:
+        """
+        Memoized body of `_symbol_search`, keyed on the CUSIP alone so the
+        ticker and company lookups for one CUSIP share up to two HTTP requests.
+        """
         try:
             isin = cusip_to_isin(cusip)
         except ValueError:
@@ -147,8 +161,10 @@ class TradingView(FinanceLibrary):
     def get_ticker(cusip: str, **kwargs) -> str | None:
         """
         Returns the ticker for a given CUSIP, or None if no match is found.
+        A failed symbol_search raises (RequestException / ValueError) rather
+        than passing for a miss.
         """
-        match = TradingView._symbol_search(cusip, company_name=kwargs.get("company_name"))
+        match = TradingView._search_cusip(cusip)
         if not match:
             return None
         symbol = match.get("symbol")
@@ -216,21 +232,10 @@ class TradingView(FinanceLibrary):
                             year_start = pd.Timestamp(date.today().year, 1, 1)
                             hist = hist[hist.index >= year_start]
                         points = []
-                        for idx, row in hist.iterrows():
-                            o, h, low, c = (
-                                row.get("open"),
-                                row.get("high"),
-                                row.get("low"),
-                                row.get("close"),
-                            )
+                        bars = hist[["open", "high", "low", "close"]]
+                        for idx, o, h, low, c in bars.itertuples(name=None):
                             if any(v is None or v != v for v in (o, h, low, c)):
                                 continue
-                            assert (
-                                o is not None
-                                and h is not None
-                                and low is not None
-                                and c is not None
-                            )
                             if not isinstance(idx, pd.Timestamp):
                                 continue
                             date_str = idx.strftime("%Y-%m-%d")
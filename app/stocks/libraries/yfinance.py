@@ -1,15 +1,20 @@
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
 from datetime import date, timedelta
+from functools import lru_cache
 
 import pandas as pd
 import yfinance as yf
-from curl_cffi import requests
 from curl_cffi.requests.exceptions import RequestException
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt, wait_exponential, wait_random
 from yfinance.exceptions import YFRateLimitError
 
-from app.stocks.libraries.base_library import FinanceLibrary
+from app.stocks.libraries import http_session
+from app.stocks.libraries.base_library import FinanceLibrary, get_lookup_pool
 from app.utils.logger import get_logger, log_safe
 
 logger = get_logger(__name__)
@@ -17,22 +22,100 @@ logger = get_logger(__name__)
 # Silence yfinance logger
 logging.getLogger("yfinance").setLevel(logging.CRITICAL)
 
+# Yahoo throttles per IP, so concurrent lookups tend to be rate-limited together;
+# the random term keeps their retries from backing off in lockstep and colliding
+# again (same scheme as the SEC scraper).
+_RETRY_WAIT = wait_exponential(multiplier=1, min=2, max=8) + wait_random(0, 2)
+
+# Marks a ticker whose info lookup failed (as opposed to one with no sector).
+_INFO_UNAVAILABLE = object()
+
+
+class _PriceCache:
+    """
+    Thread-safe in-memory price cache bounded to `maxsize` entries.
+
+    Without `ttl_s` it is an LRU: a hit refreshes the entry and the least
+    recently used one is evicted when full. With `ttl_s`, entries expire that
+    many seconds after being stored and expired ones are evicted on each store.
+    """
+
+    def __init__(self, maxsize: int, ttl_s: float | None = None) -> None:
+        self._maxsize = maxsize
+        self._ttl_s = ttl_s
+        self._entries: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> float | None:
+        """
+        Returns the cached price, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, price = entry
+            if self._ttl_s is None:
+                self._entries.move_to_end(key)
+            elif time.monotonic() - stored_at >= self._ttl_s:
+                del self._entries[key]
+                return None
+            return price
+
+    def set(self, key: Hashable, price: float) -> None:
+        """
+        Stores a price, evicting expired entries and then the oldest ones past `maxsize`.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._entries.pop(key, None)
+            self._entries[key] = (now, price)
+            if self._ttl_s is not None:
+                # Same TTL for every entry, so the oldest stored are the first to expire.
+                while now - next(iter(self._entries.values()))[0] >= self._ttl_s:
+                    self._entries.popitem(last=False)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drops every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stored entries, expired ones included until evicted.
+        """
+        with self._lock:
+            return len(self._entries)
+
 
 class YFinance(FinanceLibrary):
     """
     Client for searching stock information using the yfinance library, implementing the FinanceLibrary interface.
     """
 
-    FALLBACK_SUFFIXES = [".TO", ".V"]
+    FALLBACK_SUFFIXES = (".TO", ".V")
     # Days to look back so a non-trading requested date falls onto the prior trading day.
     AVG_PRICE_LOOKBACK_DAYS = 7
+    # Seconds a current price is reused before Yahoo is asked again.
+    CURRENT_PRICE_TTL_S = 300
+
+    # Prices already fetched this process: a past day's average never changes, while
+    # current prices expire after CURRENT_PRICE_TTL_S. Misses are not stored, since a
+    # rate-limited Yahoo answers with empty data rather than an error. Both are
+    # bounded, as the API server keeps them for its whole lifetime.
+    _avg_price_cache = _PriceCache(maxsize=131072)
+    _current_price_cache = _PriceCache(maxsize=4096, ttl_s=CURRENT_PRICE_TTL_S)
 
     @staticmethod
     def _sanitize_ticker(ticker: str) -> str:
         """
         Sanitizes the ticker for yfinance. Replaces '.' with '-' for share classes (e.g., BRK.B), but preserves '.' for international suffixes (e.g., AAPL.TO).
         """
-        if "." in ticker and not any(ticker.endswith(s) for s in YFinance.FALLBACK_SUFFIXES):
+        if "." in ticker and not ticker.endswith(YFinance.FALLBACK_SUFFIXES):
             return ticker.replace(".", "-")
         return ticker
 
@@ -49,7 +132,18 @@ class YFinance(FinanceLibrary):
             str | None: The company name if found, otherwise None.
         """
         ticker = kwargs.get("ticker")
-        ticker = YFinance.get_ticker(cusip) if not ticker else YFinance._sanitize_ticker(ticker)
+        if ticker:
+            ticker = YFinance._sanitize_ticker(ticker)
+        else:
+            try:
+                ticker = YFinance.get_ticker(cusip)
+            except (RequestException, ValueError):
+                logger.error(
+                    "Failed to get ticker for CUSIP %s using YFinance",
+                    log_safe(cusip),
+                    exc_info=True,
+                )
+                return None
 
         if not ticker:
             logger.warning("YFinance: No ticker resolved for CUSIP %s.", log_safe(cusip))
@@ -114,31 +208,39 @@ class YFinance(FinanceLibrary):
 
         Returns:
             str | None: The ticker symbol if found, otherwise None.
+
+        Raises:
+            RequestException | ValueError: If the search request or its JSON body failed.
+        """
+        symbol = YFinance._search_cusip(cusip)
+        if not symbol:
+            logger.warning("YFinance: No ticker found for CUSIP %s.", log_safe(cusip))
+        return symbol
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _search_cusip(cusip: str) -> str | None:
+        """
+        Memoized body of `get_ticker`: the first non-empty quote symbol Yahoo's
+        search returns for the CUSIP, or None. Request and JSON errors propagate
+        (and so are not cached), leaving a transient failure free to be retried.
         """
         url = f"https://query1.finance.yahoo.com/v1/finance/search?q={cusip}"
         headers = {"User-Agent": "Mozilla/5.0"}
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            quotes = data.get("quotes", [])
-            for quote in quotes:
-                symbol = quote.get("symbol")
-                if symbol:
-                    return symbol
-            logger.warning("YFinance: No ticker found for CUSIP %s.", log_safe(cusip))
-            return None
-        except (RequestException, ValueError):
-            logger.error(
-                "Failed to get ticker for CUSIP %s using YFinance", log_safe(cusip), exc_info=True
-            )
-            return None
+        response = http_session.get(url, headers=headers, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+
+        for quote in data.get("quotes", []):
+            symbol = quote.get("symbol")
+            if symbol:
+                return symbol
+        return None
 
     @staticmethod
     @retry(
         stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=2, max=8),
+        wait=_RETRY_WAIT,
         before_sleep=lambda retry_state: logger.progress(
             f"Retrying get_avg_price for {retry_state.args[0]} (attempt #{retry_state.attempt_number})..."
         ),
@@ -157,6 +259,12 @@ class YFinance(FinanceLibrary):
         Returns:
             float | None: The average price if found, otherwise None.
         """
+        cache_key = (YFinance._sanitize_ticker(ticker), date_obj)
+        cached = YFinance._avg_price_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # Today's range is still moving, so only completed days are remembered.
+        cacheable = date_obj < date.today()
 
         def _get_single_avg_price(t: str) -> float | None:
             search_ticker = YFinance._sanitize_ticker(t)
@@ -180,6 +288,8 @@ class YFinance(FinanceLibrary):
             # Try original ticker first
             price = _get_single_avg_price(ticker)
             if price is not None:
+                if cacheable:
+                    YFinance._avg_price_cache.set(cache_key, price)
                 return price
 
             # Fallback for international tickers (e.g., TSX, TSXV)
@@ -195,6 +305,8 @@ class YFinance(FinanceLibrary):
                         )
                         price = _get_single_avg_price(fallback_ticker)
                         if price is not None:
+                            if cacheable:
+                                YFinance._avg_price_cache.set(cache_key, price)
                             return price
                     except Exception:
                         continue
@@ -210,10 +322,79 @@ class YFinance(FinanceLibrary):
             )
             raise e
 
+    @staticmethod
+    def get_avg_prices(tickers: list[str], date_obj: date) -> dict[str, float]:
+        """
+        Gets the average daily prices of many tickers on one date with a single
+        yf.download, instead of one request per ticker. Non-trading dates resolve
+        to the last trading day at or before them, as in `get_avg_price`.
+
+        Args:
+            tickers (list[str]): The stock tickers.
+            date_obj (date): The date for which to fetch the prices.
+
+        Returns:
+            dict[str, float]: Average price per ticker; tickers without data are
+                omitted (callers can retry them one by one, with the suffix fallbacks).
+        """
+        prices: dict[str, float] = {}
+        ticker_map: dict[str, list[str]] = {}
+        for ticker in dict.fromkeys(tickers):
+            sanitized = YFinance._sanitize_ticker(ticker)
+            cached = YFinance._avg_price_cache.get((sanitized, date_obj))
+            if cached is not None:
+                prices[ticker] = cached
+            else:
+                ticker_map.setdefault(sanitized, []).append(ticker)
+        if not ticker_map:
+            return prices
+
+        try:
+            data = yf.download(
+                tickers=list(ticker_map),
+                start=date_obj - timedelta(days=YFinance.AVG_PRICE_LOOKBACK_DAYS),
+                end=date_obj + timedelta(days=1),
+                group_by="ticker",
+                auto_adjust=False,
+                progress=False,
+            )
+        except YFRateLimitError:
+            raise
+        except Exception:
+            logger.error(
+                "Failed to batch-download prices on %s using YFinance", date_obj, exc_info=True
+            )
+            return prices
+        if data is None or data.empty:
+            return prices
+
+        if isinstance(data.columns, pd.MultiIndex):
+            high = data.xs("High", axis=1, level=1)
+            low = data.xs("Low", axis=1, level=1)
+        else:
+            (sanitized,) = ticker_map
+            high = data[["High"]].set_axis([sanitized], axis=1)
+            low = data[["Low"]].set_axis([sanitized], axis=1)
+
+        # Rows are the union of all tickers' trading days, so forward-fill to take
+        # each ticker's last trading day at or before the requested date.
+        averages = ((high + low) / 2).ffill().iloc[-1].dropna().round(2)
+
+        cacheable = date_obj < date.today()
+        for sanitized, price in averages.items():
+            if sanitized not in ticker_map:
+                continue
+            price = float(price)
+            if cacheable:
+                YFinance._avg_price_cache.set((sanitized, date_obj), price)
+            for ticker in ticker_map[sanitized]:
+                prices[ticker] = price
+        return prices
+
     @staticmethod
     @retry(
         stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=2, max=8),
+        wait=_RETRY_WAIT,
         before_sleep=lambda retry_state: logger.progress(
             f"Retrying get_current_price for {retry_state.args[0]} (attempt #{retry_state.attempt_number})..."
         ),
@@ -228,8 +409,12 @@ class YFinance(FinanceLibrary):
         Returns:
             float | None: The current price if found, otherwise None.
         """
+        search_ticker = YFinance._sanitize_ticker(ticker)
+        cached = YFinance._current_price_cache.get(search_ticker)
+        if cached is not None:
+            return cached
+
         try:
-            search_ticker = YFinance._sanitize_ticker(ticker)
             stock = yf.Ticker(search_ticker)
             price = stock.info.get("currentPrice")
 
@@ -247,7 +432,11 @@ class YFinance(FinanceLibrary):
                     except Exception:
                         continue
 
-            return float(price) if price is not None else None
+            if price is None:
+                return None
+            price = float(price)
+            YFinance._current_price_cache.set(search_ticker, price)
+            return price
         except Exception as e:
             logger.error(
                 "Failed to get current price for Ticker %s using YFinance",
@@ -259,7 +448,7 @@ class YFinance(FinanceLibrary):
     @staticmethod
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=8),
+        wait=_RETRY_WAIT,
         before_sleep=lambda retry_state: logger.progress(
             f"Retrying get_stocks_info for {retry_state.args[0]} (attempt #{retry_state.attempt_number})..."
         ),
@@ -313,12 +502,28 @@ class YFinance(FinanceLibrary):
                 except Exception:
                     continue
 
-            # Get sector info for all tickers (both successful and failed price fetches)
-            for sanitized, original in ticker_map.items():
+            # Get sector info for all tickers (both successful and failed price fetches).
+            # Each .info is its own request, so they overlap on LOOKUP_WORKERS threads.
+            # After a rate-limit error the queued lookups are cancelled and any that
+            # already started skip their request, so the outer retry backs off at once.
+            stop = threading.Event()
+            pool = get_lookup_pool()
+            futures = [
+                pool.submit(YFinance._get_info_sector, sanitized, stop)
+                for sanitized in sanitized_tickers
+            ]
+            try:
+                sectors = [future.result() for future in futures]
+            except YFRateLimitError:
+                stop.set()
+                for future in futures:
+                    future.cancel()
+                raise
+
+            for original, sector in zip(ticker_map.values(), sectors, strict=True):
+                if sector is _INFO_UNAVAILABLE:
+                    continue
                 try:
-                    stock = yf.Ticker(sanitized)
-                    sector = stock.info.get("sector") or stock.info.get("industry")
-
                     if original in stocks_info:
                         stocks_info[original]["sector"] = sector
                     else:
@@ -342,6 +547,24 @@ class YFinance(FinanceLibrary):
             logger.error("Failed to get stock info using YFinance", exc_info=True)
             raise e
 
+    @staticmethod
+    def _get_info_sector(sanitized: str, stop: threading.Event):
+        """
+        Returns the sector (or, failing that, the industry) from a ticker's info
+        payload, or `_INFO_UNAVAILABLE` when the lookup fails or `stop` is set.
+        Rate-limit errors set `stop` and propagate so `get_stocks_info` can back off.
+        """
+        if stop.is_set():
+            return _INFO_UNAVAILABLE
+        try:
+            info = yf.Ticker(sanitized).info
+            return info.get("sector") or info.get("industry")
+        except YFRateLimitError:
+            stop.set()
+            raise
+        except Exception:
+            return _INFO_UNAVAILABLE
+
     PERIOD_TO_INTERVAL = {
         "ytd": "1d",
         "1y": "1d",
@@ -379,15 +602,14 @@ class YFinance(FinanceLibrary):
                 return None
 
             points = []
-            for idx, row in history.iterrows():
-                o, h, low, c = row.get("Open"), row.get("High"), row.get("Low"), row.get("Close")
+            for idx, o, h, low, c in history[["Open", "High", "Low", "Close"]].itertuples(
+                name=None
+            ):
                 if any(v is None or v != v for v in (o, h, low, c)):
                     continue
-                # The values are validated as non-None above; narrow for the type-checker.
-                assert o is not None and h is not None and low is not None and c is not None
-                # idx is a Timestamp at runtime (DatetimeIndex), but DataFrame.iterrows()
-                # widens its static type to Hashable. Narrow with isinstance so pyright
-                # accepts .strftime without a `# type: ignore`.
+                # idx is a Timestamp at runtime (DatetimeIndex), but itertuples()
+                # types it as Any. Narrow with isinstance so pyright accepts
+                # .strftime without a `# type: ignore`.
                 if not isinstance(idx, pd.Timestamp):
                     continue
                 date_str = idx.strftime("%Y-%m-%d")
@@ -412,7 +634,7 @@ class YFinance(FinanceLibrary):
     @staticmethod
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=8),
+        wait=_RETRY_WAIT,
         before_sleep=lambda retry_state: logger.progress(
             f"Retrying get_sector_tickers for {retry_state.args[0]} (attempt #{retry_state.attempt_number})..."
         ),
@@ -430,12 +652,7 @@ class YFinance(FinanceLibrary):
                        Example: [{'symbol': 'AAPL', 'name': 'Apple Inc.', 'weight': 0.15}, ...]
         """
         try:
-            sector = yf.Sector(sector_key)
-            top_companies = sector.top_companies
-
-            if top_companies is None or top_companies.empty:
-                # Raise error to trigger @retry
-                raise ValueError(f"🚨 No companies found for sector '{sector_key}'")
+            top_companies = YFinance._sector_top_companies(sector_key, date.today().isoformat())
 
             companies = []
             for _, row in top_companies.iterrows():
@@ -455,3 +672,17 @@ class YFinance(FinanceLibrary):
                 "Failed to get tickers for sector '%s'", log_safe(sector_key), exc_info=True
             )
             raise e
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _sector_top_companies(sector_key: str, daystamp: str) -> pd.DataFrame:
+        """
+        Memoized `yf.Sector(sector_key).top_companies`. Keyed on the day as well,
+        since sector composition changes at most daily. Empty answers raise (and
+        so are not cached), leaving `get_sector_tickers` free to retry them.
+        """
+        top_companies = yf.Sector(sector_key).top_companies
+        if top_companies is None or top_companies.empty:
+            # Raise error to trigger @retry
+            raise ValueError(f"🚨 No companies found for sector '{sector_key}'")
+        return top_companies
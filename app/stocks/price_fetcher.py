@@ -98,3 +98,20 @@ class PriceFetcher:
             date_obj,
         )
         return None
+
+    @staticmethod
+    def get_avg_prices(tickers: list[str], date_obj: date) -> dict[str, float | None]:
+        """
+        Gets the average prices of many tickers on one date: a single batched
+        YFinance download first, then the per-ticker chain for whatever it missed.
+        """
+        try:
+            prices: dict[str, float | None] = dict(YFinance.get_avg_prices(tickers, date_obj))
+        except Exception:
+            logger.error("YFinance failed to batch-fetch avg prices", exc_info=True)
+            prices = {}
+
+        for ticker in tickers:
+            if ticker not in prices:
+                prices[ticker] = PriceFetcher.get_avg_price(ticker, date_obj)
+        return prices
@@ -0,0 +1,115 @@
+import csv
+import os
+import threading
+from collections.abc import Callable, Iterable
+from datetime import date, timedelta
+from pathlib import Path
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_DIR = "__tickercache__"
+CACHE_FILE = "misses.csv"
+_FIELDNAMES = ["cusip", "checked_on"]
+
+# Report runs resolve tickers on several threads, each through its own cache
+# instance; `record` re-reads the file under this lock so writers merge instead
+# of the last one overwriting the others' misses.
+_write_lock = threading.Lock()
+
+
+class TickerMissCache:
+    """
+    Persistent record of CUSIPs that no library could resolve to a ticker.
+
+    Resolved CUSIPs are already remembered across runs by stocks.csv; misses are
+    not, so every report run re-queried the whole library chain (and re-opened
+    the same GitHub issue) for CUSIPs that cannot resolve. A miss is skipped for
+    `ttl_days` after it was recorded, then retried so newly listed securities
+    are eventually picked up. Only misses every library confirmed are recorded;
+    a lookup that failed on a network error or rate limit is not a miss.
+    """
+
+    TTL_DAYS = 7
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        ttl_days: int = TTL_DAYS,
+        today_fn: Callable[[], date] = date.today,
+    ) -> None:
+        """
+        Load any existing cache file and store the expiry settings.
+        """
+        self._path = Path(path) if path is not None else Path(CACHE_DIR) / CACHE_FILE
+        self._ttl = timedelta(days=ttl_days)
+        self._today_fn = today_fn
+        self._checked_on: dict[str, date] = self._load()
+
+    def _load(self) -> dict[str, date]:
+        """
+        Read the persisted misses into memory, keeping the latest check per CUSIP
+        and skipping malformed rows.
+        """
+        checked_on: dict[str, date] = {}
+        if not self._path.exists():
+            return checked_on
+        try:
+            with self._path.open(newline="", encoding="utf-8") as handle:
+                for row in csv.DictReader(handle):
+                    try:
+                        cusip, day = row["cusip"], date.fromisoformat(row["checked_on"])
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    if cusip not in checked_on or day > checked_on[cusip]:
+                        checked_on[cusip] = day
+        except OSError:
+            logger.warning("Could not read ticker miss cache '%s'", self._path, exc_info=True)
+        return checked_on
+
+    def recent_misses(self) -> set[str]:
+        """
+        Returns the CUSIPs whose last failed lookup is still within the TTL.
+        """
+        cutoff = self._today_fn() - self._ttl
+        return {cusip for cusip, day in self._checked_on.items() if day > cutoff}
+
+    def record(self, cusips: Iterable[str]) -> None:
+        """
+        Record the given CUSIPs as misses checked today, then rewrite the file with
+        the unexpired misses only, so it never grows past one row per live miss.
+        Misses other instances wrote since this one was loaded are merged in first.
+        Written to a temporary file first so a crash mid-write never truncates it.
+        """
+        cusips = list(cusips)
+        if not cusips:
+            return
+        with _write_lock:
+            for cusip, day in self._load().items():
+                if cusip not in self._checked_on or day > self._checked_on[cusip]:
+                    self._checked_on[cusip] = day
+            today = self._today_fn()
+            for cusip in cusips:
+                self._checked_on[cusip] = today
+            cutoff = today - self._ttl
+            self._checked_on = {
+                cusip: day for cusip, day in self._checked_on.items() if day > cutoff
+            }
+            self._write()
+
+    def _write(self) -> None:
+        """
+        Replace the cache file with the in-memory misses via a temporary file.
+        """
+        tmp_path = self._path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w", newline="", encoding="utf-8") as handle:
+                writer = csv.DictWriter(handle, fieldnames=_FIELDNAMES, quoting=csv.QUOTE_ALL)
+                writer.writeheader()
+                for cusip, day in self._checked_on.items():
+                    writer.writerow({"cusip": cusip, "checked_on": day.isoformat()})
+            tmp_path.replace(self._path)
+        except OSError:
+            logger.warning("Could not write ticker miss cache '%s'", self._path, exc_info=True)
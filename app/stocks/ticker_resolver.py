@@ -1,7 +1,4 @@
-from typing import cast
-
 import pandas as pd
-from pandas import Series
 
 from app.database import load_stocks, save_stock, save_stocks
 from app.stocks.classification import resolve_industry
@@ -13,19 +10,13 @@ from app.stocks.libraries import (
     YFinance,
 )
 from app.stocks.libraries.nasdaq import Nasdaq
+from app.stocks.ticker_cache import TickerMissCache
 from app.utils.github import open_issue
 from app.utils.logger import get_logger, log_safe
 
 logger = get_logger(__name__)
 
 
-def _scalar[T](value: T | Series) -> T:
-    """
-    Returns the first element when pandas yields a Series for a duplicated CUSIP index.
-    """
-    return cast(T, value.iloc[0]) if isinstance(value, Series) else value
-
-
 class TickerResolver:
     """
     Orchestrates the resolution of CUSIPs to Tickers and Company names using a prioritized list of financial data libraries.
@@ -38,11 +29,56 @@ class TickerResolver:
         """
         return [YFinance, OpenFIGI, TradingView]
 
+    @staticmethod
+    def _resolve_tickers(
+        companies: dict[str, str], libraries: list[type[FinanceLibrary]]
+    ) -> tuple[dict[str, str], set[str]]:
+        """
+        Resolves unknown CUSIPs (mapped to their company names) library by library.
+
+        Each library only sees the CUSIPs its predecessors missed, which keeps the
+        per-CUSIP priority order while letting libraries with a batch endpoint
+        (OpenFIGI) resolve all of them in a handful of requests.
+
+        Returns the resolved tickers and the CUSIPs some library failed to answer
+        (network error, rate limit), whose miss is therefore not confirmed.
+        """
+        tickers: dict[str, str] = {}
+        unanswered: set[str] = set()
+        for library in libraries:
+            pending = {cusip: name for cusip, name in companies.items() if cusip not in tickers}
+            if not pending:
+                break
+            try:
+                answers = library.get_tickers(pending)
+            except Exception:
+                logger.warning("%s: Failed to resolve tickers", library.__name__, exc_info=True)
+                answers = {}
+            unanswered.update(cusip for cusip in pending if cusip not in answers)
+            tickers.update({cusip: ticker for cusip, ticker in answers.items() if ticker})
+        return tickers, unanswered
+
+    @staticmethod
+    def _ticker_details(stocks: pd.DataFrame) -> dict[str, tuple[str, str]]:
+        """
+        Maps each ticker in stocks.csv to the (Company, Industry) of its first row.
+        """
+        first_rows = stocks[~stocks["Ticker"].duplicated(keep="first")]
+        industries = first_rows.get("Industry", pd.Series("", index=first_rows.index))
+        return {
+            ticker: (company, industry if isinstance(industry, str) else "")
+            for ticker, company, industry in zip(
+                first_rows["Ticker"], first_rows["Company"], industries, strict=True
+            )
+        }
+
     @staticmethod
     def resolve_ticker(df: pd.DataFrame) -> pd.DataFrame:
         """
         Maps CUSIPs to tickers and company names by querying multiple sources in a specific order.
-        It prioritizes libraries defined in `get_libraries()`.
+        It prioritizes libraries defined in `get_libraries()`. CUSIPs that every
+        library answered with "no match" within the last week (see `TickerMissCache`)
+        are not looked up again; a lookup that merely failed is retried next run.
 
         Args:
             df (pd.DataFrame): DataFrame containing 'CUSIP' and 'Company' columns.
@@ -50,78 +86,77 @@ class TickerResolver:
         Returns:
             pd.DataFrame: The verified DataFrame with 'Ticker' and 'Company' columns updated.
         """
-        stocks = load_stocks().copy()
+        stocks = load_stocks()
         libraries = TickerResolver.get_libraries()
 
-        for index, row in df.iterrows():
-            cusip = row["CUSIP"]
-            company = row["Company"]
-            ticker = None
-
-            if cusip not in stocks.index:
-                for library in libraries:
-                    try:
-                        ticker = library.get_ticker(cusip, company_name=company)
-                        if ticker:
-                            break
-                    except Exception:
-                        logger.warning(
-                            "%s: Failed to resolve ticker for CUSIP %s",
-                            library.__name__,
-                            log_safe(cusip),
-                            exc_info=True,
-                        )
-                        continue
-
-                if ticker:
-                    # A known ticker (CUSIP change) inherits its existing Company/Industry,
-                    # preserving the ticker→company uniqueness invariant.
-                    existing = stocks[stocks["Ticker"] == ticker]
-                    if not existing.empty:
-                        company_name = existing.iloc[0]["Company"]
-                        industry = existing.iloc[0].get("Industry", "")
-                        industry = "" if pd.isna(industry) else industry
-                    else:
-                        company_name = None
-                        for library in libraries:
-                            try:
-                                company_name = library.get_company(cusip, ticker=ticker)
-                                if company_name:
-                                    break
-                            except Exception:
-                                continue
-
-                        company_name = company_name or company
-
-                        if not company_name:
-                            subject = f"Company not found for CUSIP '{cusip}'"
-                            body = f"Could not find any company for the CUSIP: {cusip} / Ticker: '{ticker}'."
-                            open_issue(subject, body)
-
-                        # Resolve the Industry through the chained fallback:
-                        # yfinance → same-Company in stocks.csv → Groq LLM. Empty on
-                        # full miss so the row is still saved; the AI backfill can
-                        # revisit it. Sector is not stored — derive it via
-                        # database/sector_hierarchy.csv.
-                        industry = resolve_industry(ticker, company_name)
-
-                    # save_stock persists; 'stocks' here is just an in-memory copy.
-                    stocks.loc[cusip, "Ticker"] = ticker
-                    stocks.loc[cusip, "Company"] = company_name
-                    stocks.loc[cusip, "Industry"] = industry
-                    save_stock(cusip, ticker, company_name, industry=industry)
-                else:
-                    subject = f"Ticker not found for CUSIP '{cusip}'"
-                    body = f"Could not resolve ticker for CUSIP: {cusip} / Company: '{company}'"
-                    open_issue(subject, body)
+        unknown = df.drop_duplicates(subset="CUSIP")
+        unknown = unknown[~unknown["CUSIP"].isin(stocks.index)]
+        miss_cache = TickerMissCache()
+        unknown = unknown[~unknown["CUSIP"].isin(miss_cache.recent_misses())]
+        resolved, unanswered = TickerResolver._resolve_tickers(
+            dict(zip(unknown["CUSIP"], unknown["Company"], strict=True)), libraries
+        )
+        miss_cache.record(
+            cusip for cusip in unknown["CUSIP"] if cusip not in resolved and cusip not in unanswered
+        )
 
-            if cusip in stocks.index:
-                ticker = stocks.loc[cusip, "Ticker"]
+        # New rows are collected in plain dicts and joined to 'stocks' once at the
+        # end; save_stock persists each of them.
+        new_rows: dict[str, tuple[str, str]] = {}
+        known_tickers = TickerResolver._ticker_details(stocks) if resolved else {}
 
-            df.at[index, "Ticker"] = _scalar(ticker)
+        for cusip, company in zip(unknown["CUSIP"], unknown["Company"], strict=True):
+            ticker = resolved.get(cusip)
 
-            if company == "":
-                df.at[index, "Company"] = _scalar(stocks.loc[cusip, "Company"])
+            if ticker:
+                # A known ticker (CUSIP change) inherits its existing Company/Industry,
+                # preserving the ticker→company uniqueness invariant.
+                if ticker in known_tickers:
+                    company_name, industry = known_tickers[ticker]
+                else:
+                    company_name = None
+                    for library in libraries:
+                        try:
+                            company_name = library.get_company(cusip, ticker=ticker)
+                            if company_name:
+                                break
+                        except Exception:
+                            continue
+
+                    company_name = company_name or company
+
+                    if not company_name:
+                        subject = f"Company not found for CUSIP '{cusip}'"
+                        body = f"Could not find any company for the CUSIP: {cusip} / Ticker: '{ticker}'."
+                        open_issue(subject, body)
+
+                    # Resolve the Industry through the chained fallback:
+                    # yfinance → same-Company in stocks.csv → Groq LLM. Empty on
+                    # full miss so the row is still saved; the AI backfill can
+                    # revisit it. Sector is not stored — derive it via
+                    # database/sector_hierarchy.csv.
+                    industry = resolve_industry(ticker, company_name)
+                    known_tickers[ticker] = (company_name, industry)
+
+                new_rows[cusip] = (ticker, company_name)
+                save_stock(cusip, ticker, company_name, industry=industry)
+            else:
+                subject = f"Ticker not found for CUSIP '{cusip}'"
+                body = f"Could not resolve ticker for CUSIP: {cusip} / Company: '{company}'"
+                open_issue(subject, body)
+
+        # A CUSIP duplicated in stocks.csv resolves to its first row. Unresolved
+        # CUSIPs map to NaN and keep their original (empty) Company.
+        known = stocks.loc[~stocks.index.duplicated(keep="first"), ["Ticker", "Company"]]
+        if new_rows:
+            added = pd.DataFrame.from_dict(new_rows, orient="index", columns=["Ticker", "Company"])
+            known = pd.concat([known, added])
+        df["Ticker"] = df["CUSIP"].map(known["Ticker"])
+        missing_company = df["Company"] == ""
+        if missing_company.any():
+            df.loc[missing_company, "Company"] = (
+                df.loc[missing_company, "CUSIP"].map(known["Company"]).fillna("")
+            )
 
         return df
 
@@ -203,14 +238,13 @@ class TickerResolver:
 
         if missing_stocks.any():
 
-            def fetch_and_save(row):
+            def fetch_and_save(ticker: str, company: str) -> str | None:
                 """
                 Resolves a CUSIP for a new ticker via FMP and persists it. When FMP
                 cannot resolve the ticker, opens a GitHub issue and leaves the CUSIP
                 unset — no synthetic placeholders are written, so stocks.csv only
                 ever contains real CUSIPs.
                 """
-                ticker = row["Ticker"]
                 try:
                     cusip = FMP.get_cusip(ticker)
                 except Exception:
@@ -223,14 +257,18 @@ class TickerResolver:
                     open_issue(subject, body)
                     return None
 
-                save_stock(
-                    cusip,
-                    ticker,
-                    row["Company"],
-                    industry=resolve_industry(ticker, row["Company"]),
-                )
+                save_stock(cusip, ticker, company, industry=resolve_industry(ticker, company))
                 return cusip
 
-            df.loc[missing_stocks, "CUSIP"] = df[missing_stocks].apply(fetch_and_save, axis=1)
+            # One lookup per new ticker (a Form 4 batch often repeats one), taking
+            # the Company of its first row.
+            new_tickers = df.loc[missing_stocks, ["Ticker", "Company"]].drop_duplicates("Ticker")
+            fetched = {
+                ticker: fetch_and_save(ticker, company)
+                for ticker, company in zip(
+                    new_tickers["Ticker"], new_tickers["Company"], strict=True
+                )
+            }
+            df.loc[missing_stocks, "CUSIP"] = df.loc[missing_stocks, "Ticker"].map(fetched)
 
         return df
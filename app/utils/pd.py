@@ -5,6 +5,7 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+from pandas.api.extensions import ExtensionDtype
 
 from app.utils.strings import VALUE_FORMAT_MAP, escape_csv_formula
 
@@ -56,37 +57,96 @@ def coalesce(*series: pd.Series | int | float | str) -> pd.Series:
 
     The first argument must be a Series; subsequent arguments may be Series
     or scalars (used as fillna defaults). Equivalent to SQL's COALESCE.
+
+    Works on a single NumPy copy of the first Series, filling only the
+    still-null positions from each fallback and stopping as soon as none are
+    left — one allocation instead of one `fillna` Series per argument.
     """
     result = series[0]
     if not isinstance(result, pd.Series):
         # assert would be stripped under `python -O`; raise so the contract holds.
         raise TypeError("first coalesce argument must be a Series")
+
+    values = result.to_numpy(copy=True)
+    mask = pd.isna(values)
     for s in series[1:]:
-        result = result.fillna(s)
-    return result
+        if not mask.any():
+            break
+        if isinstance(s, pd.Series):
+            # fillna aligned on the index; keep that contract for misaligned inputs.
+            if not s.index.equals(result.index):
+                s = s.reindex(result.index)
+            fill = s.to_numpy()[mask]
+        else:
+            fill = s
+        try:
+            values[mask] = fill
+        except (TypeError, ValueError):
+            # The fallback does not fit the current dtype (e.g. text into floats).
+            values = values.astype(object)
+            values[mask] = fill
+        mask = pd.isna(values)
+
+    coalesced = pd.Series(values, index=result.index, name=result.name, dtype=values.dtype)
+    if isinstance(result.dtype, ExtensionDtype):
+        # to_numpy() dropped the extension dtype (str, Int64, ...): restore it.
+        with suppress(TypeError, ValueError):
+            coalesced = coalesced.astype(result.dtype)
+    return coalesced
 
 
 def format_value_series(series: pd.Series) -> pd.Series:
     """
     Vectorized version of format_value.
-    """
-    # Base conditions for null and infinity
-    conditions: list = [series.isnull(), series == float("inf")]
-    choices: list = ["N/A", "∞"]
 
-    # Dynamically build conditions and choices from the rules
-    for threshold, suffix in VALUE_FORMAT_MAP:
-        conditions.append(series.abs() >= threshold)
-        formatted_series = (series / threshold).map("{:.2f}".format).str.rstrip("0").str.rstrip(".")
-        choices.append(formatted_series + suffix)
-
-    # The default choice is for numbers smaller than the lowest threshold
+    Each value's scale is picked with one `searchsorted` over the thresholds,
+    so every value is divided and formatted once rather than once per suffix.
+    """
+    if series.empty:
+        return pd.Series([], index=series.index, dtype=object)
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+
+    # Ascending thresholds; index i means "at least thresholds[i - 1]".
+    scales = sorted(VALUE_FORMAT_MAP)
+    thresholds = np.array([threshold for threshold, _ in scales], dtype="float64")
+    divisors = np.array([1.0, *thresholds])
+    suffixes = np.array(["", *(suffix for _, suffix in scales)], dtype=object)
+    scale = np.searchsorted(thresholds, np.abs(values), side="right")
+
+    formatted = (
+        pd.Series(values / divisors[scale], index=series.index)
+        .map("{:.2f}".format)
+        .str.rstrip("0")
+        .str.rstrip(".")
+    )
     result_array = np.select(
-        conditions, choices, default=series.map("{:.2f}".format).str.rstrip("0").str.rstrip(".")
+        [np.isnan(values), values == float("inf")],
+        ["N/A", "∞"],
+        default=(formatted + suffixes[scale]).to_numpy(dtype=object),
     )
     return pd.Series(result_array, index=series.index)
 
 
+def format_percentage_series(
+    series: pd.Series, show_sign: bool = False, decimal_places: int = 1
+) -> pd.Series:
+    """
+    Vectorized version of format_percentage for numeric Series.
+    """
+    values = pd.to_numeric(series, errors="coerce").astype("float64")
+    sign = "+" if show_sign else ""
+
+    conditions: list = [values.isnull(), values == float("inf")]
+    choices: list = ["N/A", f"{sign}∞"]
+    if not show_sign:
+        conditions.append((values > 0) & (values < 0.01))
+        choices.append("<.01%")
+
+    formatted = values.map(f"{{:{sign}.{decimal_places}f}}".format).str.rstrip("0").str.rstrip(".")
+    result_array = np.select(conditions, choices, default=formatted + "%")
+    return pd.Series(result_array, index=series.index, dtype=object)
+
+
 def get_numeric_series(series: pd.Series) -> pd.Series:
     """
     Vectorized version of get_numeric.
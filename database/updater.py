@@ -1,4 +1,12 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import os
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 
 from tabulate import tabulate
 
@@ -20,12 +28,12 @@ from app.database import (
     update_ticker,
     update_ticker_for_cusip,
 )
+from app.scraper.filing_cache import parse_13f
 from app.scraper.sec_scraper import (
     fetch_latest_two_13f_filings,
     fetch_non_quarterly_after_date,
     get_latest_13f_filing_date,
 )
-from app.scraper.xml_processor import xml_to_dataframe_13f
 from app.utils.console import (
     horizontal_rule,
     print_centered,
@@ -59,7 +67,29 @@ def exit_app():
     return False
 
 
-def process_fund(fund_info, offset=0, skip_old=False):
+def _start_13f_parse(xml_content, parse_pool: Executor | None = None) -> Future:
+    """
+    Starts parsing a 13F XML filing on `parse_pool` and returns its Future.
+    Parses are cached on disk (see `parse_13f`), so a filing seen by an
+    earlier run is not parsed again.
+
+    The XML-to-DataFrame step is CPU-bound pure Python: run in the fetching
+    thread it contends on the GIL with every other fund's parse, so bulk runs
+    hand it to a process pool. Returning the Future instead of waiting lets the
+    caller keep fetching (and start the other filing's parse) meanwhile.
+    Without a pool the parse runs inline and the Future is already done.
+    """
+    if parse_pool is not None:
+        return parse_pool.submit(parse_13f, xml_content)
+    future: Future = Future()
+    try:
+        future.set_result(parse_13f(xml_content))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def process_fund(fund_info, offset=0, skip_old=False, parse_pool: Executor | None = None):
     """
     Fetches 13F filings for a single fund and generates a comparison report.
 
@@ -70,6 +100,8 @@ def process_fund(fund_info, offset=0, skip_old=False):
     Args:
         fund_info (dict): A dictionary containing fund information, including 'CIK' and 'Fund' name.
         offset (int, optional): The number of filings to skip. Defaults to 0 (latest filing).
+        parse_pool (Executor, optional): Process pool for the CPU-bound XML parsing.
+            Defaults to None (parse in the calling thread).
     """
     cik = fund_info.get("CIK")
     fund_name = fund_info.get("Fund") or fund_info.get("CIK")
@@ -91,7 +123,8 @@ def process_fund(fund_info, offset=0, skip_old=False):
                 continue
             break
 
-        dataframe_latest = xml_to_dataframe_13f(filings[0]["xml_content"])
+        # Parsed in the background while the previous quarter is searched for.
+        latest_parse = _start_13f_parse(filings[0]["xml_content"], parse_pool)
 
         # Step 2: Find the filing for the immediately preceding quarter.
         # This loop skips amendments and ensures we are comparing against the correct previous period.
@@ -130,9 +163,13 @@ def process_fund(fund_info, offset=0, skip_old=False):
 
         previous_filing = found_previous or fallback_previous
 
-        dataframe_previous = (
-            xml_to_dataframe_13f(previous_filing["xml_content"]) if previous_filing else None
+        previous_parse = (
+            _start_13f_parse(previous_filing["xml_content"], parse_pool)
+            if previous_filing
+            else None
         )
+        dataframe_latest = latest_parse.result()
+        dataframe_previous = previous_parse.result() if previous_parse else None
         dataframe_comparison = generate_comparison(dataframe_latest, dataframe_previous)
         save_comparison(dataframe_comparison, latest_date, fund_name)
     except Exception as e:
@@ -144,16 +181,25 @@ def run_all_funds_report():
     1. Generates and saves the latest 13F comparison reports for all known hedge funds.
 
     This function iterates through all funds listed in the database, processing them in parallel using a thread pool to fetch filings
-    and generate quarterly comparison reports.
+    and generate quarterly comparison reports. The CPU-bound XML parsing is offloaded to a process pool shared by all threads.
     """
     hedge_funds = load_hedge_funds()
     total_funds = len(hedge_funds)
     print(f"Starting updating reports for all {total_funds} funds...")
     print("This will generate last vs previous quarter comparisons.")
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
+    # "spawn": forking a process that already runs threads (the API server,
+    # this thread pool) can deadlock the child on a lock held at fork time.
+    with (
+        ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        ) as parse_pool,
+        ThreadPoolExecutor(max_workers=10) as executor,
+    ):
         futures = {
-            executor.submit(process_fund, fund, offset=0, skip_old=True): fund
+            executor.submit(
+                process_fund, fund, offset=0, skip_old=True, parse_pool=parse_pool
+            ): fund
             for fund in hedge_funds
         }
 
@@ -190,7 +236,8 @@ def process_fund_nq(fund):
                 filings, fund_denomination, cik_to_process
             )
             if filings_df is not None:
-                filings_df = filings_df.copy()
+                # The column selection at the end of get_non_quarterly_filings_dataframe
+                # already yields a fresh frame, so the Fund column is inserted in place.
                 filings_df.insert(0, "Fund", fund_name)
                 return filings_df
         return None
@@ -29,6 +29,7 @@ import sys
 from pathlib import Path
 
 from cryptography.fernet import Fernet
+from dotenv import dotenv_values
 
 
 def _fresh_pairs() -> list[tuple[str, str]]:
@@ -58,18 +59,14 @@ def _render(pairs: list[tuple[str, str]], header: bool = True) -> str:
 
 def _existing_keys(path: Path) -> set[str]:
     """
-    Parse the keys already present in `path`. Comments and blank lines ignored.
+    Parse the keys already present in `path` with python-dotenv, the same parser
+    that loads the file at runtime, so `export KEY=...` and quoted lines count as
+    present. Comments, blank lines and bare names without `=` are ignored.
     """
     if not path.exists():
         return set()
-    keys: set[str] = set()
-    for line in path.read_text(encoding="utf-8").splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if "=" in stripped:
-            keys.add(stripped.split("=", 1)[0].strip())
-    return keys
+    values = dotenv_values(path, interpolate=False, encoding="utf-8")
+    return {key for key, value in values.items() if value is not None}
 
 
 def main() -> None:
@@ -20,7 +20,6 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
-from bs4 import BeautifulSoup  # noqa: E402
 
 from app.analysis.quarterly_report import generate_comparison  # noqa: E402
 from app.database import (  # noqa: E402
@@ -32,6 +31,7 @@ from app.database import (  # noqa: E402
 )
 from app.scraper.sec_scraper import (  # noqa: E402
     _create_search_url,
+    _get_document_tags,
     _get_request,
     _scrape_filing,
     scraper_session,
@@ -106,13 +106,13 @@ def fetch_fund_filings(cik: str) -> list[dict]:
     if not response:
         return []
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    document_tags = _get_document_tags(response.text)
 
     def scrape_all() -> Iterator[dict | None]:
         """
         Yields each scraped filing from the fund's EDGAR listing, lazily.
         """
-        for tag in soup.find_all("a", id="documentsbutton"):
+        for tag in document_tags:
             yield _scrape_filing(tag, "13F-HR")
 
     return collect_filings_until_floor(scrape_all())
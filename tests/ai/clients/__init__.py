@@ -0,0 +1,21 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.ai.clients.base_client import AIClient
+
+
+def isolate_llm_cache(test_case: unittest.TestCase) -> Path:
+    """
+    Points `AIClient.CACHE_DIR` at a fresh temporary directory for the duration
+    of a test, so `generate_content`'s response logs neither land in the repo's
+    ``__llmcache__/`` nor collide with a concurrently running test process.
+    """
+    cache_dir = tempfile.mkdtemp(prefix="hft_llmcache_")
+    test_case.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+    cache_patcher = patch.object(AIClient, "CACHE_DIR", cache_dir)
+    cache_patcher.start()
+    test_case.addCleanup(cache_patcher.stop)
+    return Path(cache_dir)
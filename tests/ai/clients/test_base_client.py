@@ -1,10 +1,8 @@
-import shutil
-import tempfile
 import unittest
-from pathlib import Path
 from unittest.mock import patch
 
 from app.ai.clients.base_client import AIClient
+from tests.ai.clients import isolate_llm_cache
 
 
 class MockAIClient(AIClient):
@@ -20,22 +18,20 @@ class MockAIClient(AIClient):
 
 
 class TestBaseClient(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Use an isolated tempdir as cache root so tests can't wipe or pollute
-        the real ``__llmcache__/`` directory in the repo.
+        The client is stateless (its cache root is a class attribute), so one
+        instance serves every test.
         """
-        self.cache_dir = tempfile.mkdtemp(prefix="hft_llmcache_")
-        cache_patcher = patch.object(AIClient, "CACHE_DIR", self.cache_dir)
-        self.addCleanup(cache_patcher.stop)
-        cache_patcher.start()
-        self.client = MockAIClient()
+        cls.client = MockAIClient()
 
-    def tearDown(self):
+    def setUp(self):
         """
-        Remove the tempdir; ignore errors on Windows file-locking edge cases.
+        Use an isolated tempdir as cache root so tests can't wipe or pollute
+        the real ``__llmcache__/`` directory in the repo.
         """
-        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self.cache_dir = isolate_llm_cache(self)
 
     def test_log_response_creates_file(self):
         """
@@ -43,7 +39,7 @@ class TestBaseClient(unittest.TestCase):
         """
         self.client.generate_content("Test Prompt")
 
-        files = list(Path(self.cache_dir).glob("response_*.log"))
+        files = list(self.cache_dir.glob("response_*.log"))
         self.assertEqual(len(files), 1)
 
         with files[0].open(encoding="utf-8") as f:
@@ -56,12 +52,14 @@ class TestBaseClient(unittest.TestCase):
         """
         Test that the logger keeps only the last LOG_RETENTION_LIMIT files
         """
-        limit = AIClient.LOG_RETENTION_LIMIT
-        # Create a few more files than the limit
-        for i in range(limit + 5):
-            self.client.generate_content(f"Prompt {i}")
+        # A small limit exercises the same pruning without writing 50+ files.
+        limit = 3
+        with patch.object(AIClient, "LOG_RETENTION_LIMIT", limit):
+            # Create a few more files than the limit
+            for i in range(limit + 5):
+                self.client.generate_content(f"Prompt {i}")
 
-        files = list(Path(self.cache_dir).glob("response_*.log"))
+        files = list(self.cache_dir.glob("response_*.log"))
         self.assertEqual(len(files), limit)
 
 
@@ -1,5 +1,6 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import ANY, patch
 
 import httpx
 from openai import BadRequestError
@@ -10,6 +11,11 @@ from app.ai.clients.base_openai_client import (
     OpenAIClient,
     OpenAIProviderConfig,
 )
+from app.ai.clients.github_client import GitHubClient
+from app.ai.clients.groq_client import GroqClient
+from app.ai.clients.huggingface_client import HuggingFaceClient
+from app.ai.clients.openrouter_client import OpenRouterClient
+from tests.ai.clients import isolate_llm_cache
 
 
 def _stream(*contents):
@@ -17,7 +23,10 @@ def _stream(*contents):
     Builds a fake streaming response: one chunk per content delta. A ``None``
     delta models a chunk that carries no text (e.g. role-only or final chunk).
     """
-    return [MagicMock(choices=[MagicMock(delta=MagicMock(content=c))]) for c in contents]
+    return [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=c))])
+        for c in contents
+    ]
 
 
 def _reasoning_effort_rejected() -> BadRequestError:
@@ -93,11 +102,16 @@ class TestOpenAIClientGenerateContent(unittest.TestCase):
     def setUp(self):
         """
         Patches time.sleep to avoid wait_exponential delay in tenacity retry,
-        and clears the reasoning-unsupported cache so tests don't leak state.
+        provides the provider API key for every test, and clears the
+        reasoning-unsupported cache so tests don't leak state.
         """
+        isolate_llm_cache(self)
         # Patch time.sleep to avoid wait_exponential delay in tenacity retry
         self.sleep_patcher = patch("time.sleep")
         self.sleep_patcher.start()
+        env_patcher = patch.dict("os.environ", {"TEST_API_KEY": "key"})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
         OpenAIClient._reasoning_unsupported.clear()
 
     def tearDown(self):
@@ -114,8 +128,7 @@ class TestOpenAIClientGenerateContent(unittest.TestCase):
         mock_instance = mock_openai.return_value
         mock_instance.chat.completions.create.return_value = _stream("Generated ", "text")
 
-        with patch.dict("os.environ", {"TEST_API_KEY": "key"}):
-            client = ConcreteOpenAIClient()
+        client = ConcreteOpenAIClient()
 
         result = client.generate_content("Test prompt")
 
@@ -129,8 +142,7 @@ class TestOpenAIClientGenerateContent(unittest.TestCase):
         mock_instance = mock_openai.return_value
         mock_instance.chat.completions.create.side_effect = RuntimeError("API unavailable")
 
-        with patch.dict("os.environ", {"TEST_API_KEY": "key"}):
-            client = ConcreteOpenAIClient()
+        client = ConcreteOpenAIClient()
 
         with self.assertRaises(RetryError):
             client.generate_content("Test prompt")
@@ -144,8 +156,7 @@ class TestOpenAIClientGenerateContent(unittest.TestCase):
         mock_instance = mock_openai.return_value
         mock_instance.chat.completions.create.return_value = _stream("OK")
 
-        with patch.dict("os.environ", {"TEST_API_KEY": "key"}):
-            client = ConcreteOpenAIClient(model="test-model-v1")
+        client = ConcreteOpenAIClient(model="test-model-v1")
 
         client.generate_content("Hello!")
 
@@ -168,8 +179,7 @@ class TestOpenAIClientGenerateContent(unittest.TestCase):
             _stream("OK"),
         ]
 
-        with patch.dict("os.environ", {"TEST_API_KEY": "key"}):
-            client = ConcreteOpenAIClient()
+        client = ConcreteOpenAIClient()
 
         result = client.generate_content("Hello!")
 
@@ -195,8 +205,7 @@ class TestOpenAIClientGenerateContent(unittest.TestCase):
             _stream("OK again"),
         ]
 
-        with patch.dict("os.environ", {"TEST_API_KEY": "key"}):
-            client = ConcreteOpenAIClient()
+        client = ConcreteOpenAIClient()
 
         client.generate_content("Hello!")
         client.generate_content("Hello again!")
@@ -217,8 +226,7 @@ class TestOpenAIClientGenerateContent(unittest.TestCase):
         mock_instance = mock_openai.return_value
         mock_instance.chat.completions.create.return_value = _stream(None)
 
-        with patch.dict("os.environ", {"TEST_API_KEY": "key"}):
-            client = ConcreteOpenAIClient()
+        client = ConcreteOpenAIClient()
 
         result = client.generate_content("Test prompt")
 
@@ -233,8 +241,7 @@ class TestOpenAIClientGenerateContent(unittest.TestCase):
         mock_instance = mock_openai.return_value
         mock_instance.chat.completions.create.return_value = _stream("hello")
 
-        with patch.dict("os.environ", {"TEST_API_KEY": "key"}):
-            client = ConcreteOpenAIClient()
+        client = ConcreteOpenAIClient()
 
         with self.assertLogs("app.ai.clients.base_openai_client", level="INFO") as cm:
             client.generate_content("Test prompt")
@@ -242,5 +249,60 @@ class TestOpenAIClientGenerateContent(unittest.TestCase):
         self.assertTrue(any("first token" in line for line in cm.output))
 
 
+class TestOpenAIProviders(unittest.TestCase):
+    """
+    Each OpenAI-compatible provider is only configuration on top of
+    OpenAIClient: its endpoint, credential variable and extra headers.
+    """
+
+    PROVIDERS = [
+        (GitHubClient, "GITHUB_TOKEN", "https://models.github.ai/inference", {}),
+        (GroqClient, "GROQ_API_KEY", "https://api.groq.com/openai/v1", {}),
+        (HuggingFaceClient, "HF_TOKEN", "https://router.huggingface.co/v1/", {}),
+        (
+            OpenRouterClient,
+            "OPENROUTER_API_KEY",
+            "https://openrouter.ai/api/v1",
+            {
+                "HTTP-Referer": "https://github.com/dokson/hedge-fund-tracker",
+                "X-Title": "Hedge Fund Tracker",
+            },
+        ),
+    ]
+
+    def setUp(self):
+        isolate_llm_cache(self)
+
+    @patch("app.ai.clients.base_openai_client.OpenAI")
+    def test_generate_content_invocation(self, mock_openai):
+        """
+        Every provider builds its OpenAI client against its own endpoint and
+        key, and streams the completion with the shared request shape.
+        """
+        for client_cls, env_var, base_url, headers in self.PROVIDERS:
+            with self.subTest(provider=client_cls.__name__):
+                mock_openai.reset_mock()
+                mock_instance = mock_openai.return_value
+                mock_instance.chat.completions.create.return_value = _stream("Mocked response")
+
+                with patch.dict("os.environ", {env_var: "test-key"}):
+                    client = client_cls()
+
+                prompt = f"Hello, {client_cls.__name__}!"
+                self.assertEqual(client.generate_content(prompt), "Mocked response")
+                mock_instance.chat.completions.create.assert_called_once_with(
+                    model=client_cls.DEFAULT_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    extra_body={"reasoning_effort": "low"},
+                    stream=True,
+                )
+                mock_openai.assert_called_with(
+                    base_url=base_url,
+                    api_key="test-key",
+                    default_headers=headers,
+                    timeout=ANY,
+                )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,13 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from google.genai import types
 from google.genai.errors import ClientError, ServerError
 from tenacity import RetryError
 
 from app.ai.clients.google_client import GoogleAIClient
+from tests.ai.clients import isolate_llm_cache
 
 
 def _thinking_level_rejected() -> ClientError:
@@ -38,14 +40,14 @@ def _model_overloaded() -> ServerError:
 
 class TestGoogleAIClient(unittest.TestCase):
     def setUp(self):
+        isolate_llm_cache(self)
         # Patch genai.Client globally for the setup to avoid ValueError in CI
         self.patcher = patch("app.ai.clients.google_client.genai.Client")
         self.mock_genai_client = self.patcher.start()
 
         # Setup mock instance
         self.mock_instance = self.mock_genai_client.return_value
-        self.mock_response = MagicMock()
-        self.mock_response.text = "Mocked Gemini response"
+        self.mock_response = SimpleNamespace(text="Mocked Gemini response")
         self.mock_instance.models.generate_content.return_value = self.mock_response
 
         GoogleAIClient._thinking_unsupported.clear()
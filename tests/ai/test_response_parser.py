@@ -32,53 +32,32 @@ description: "This is item # 1 in the list"
         result = ResponseParser.extract_and_decode_toon(response_text)
         self.assertEqual(result, expected)
 
-    def test_extract_and_decode_simple_toon(self):
-        """
-        Tests parsing a simple, valid TOON string.
-        """
-        response_text = 'key1: "value1"\nkey2: 123\nbool_key: true'
-        expected = {"key1": "value1", "key2": 123, "bool_key": True}
-        self.assertEqual(ResponseParser.extract_and_decode_toon(response_text), expected)
-
-    def test_extract_and_decode_with_toon_markdown(self):
-        """
-        Tests parsing a TOON string enclosed in ```toon ... ``` markdown.
-        """
-        response_text = '```toon\nkey: "value"\n```'
-        expected = {"key": "value"}
-        self.assertEqual(ResponseParser.extract_and_decode_toon(response_text), expected)
-
-    def test_extract_and_decode_with_split_markdown_tag(self):
-        """
-        Tests parsing a TOON string where 'toon' is on the next line after backticks.
-        E.g. ```\ntoon
-        """
-        response_text = '```\ntoon\nkey: "value"\n```'
-        expected = {"key": "value"}
-        self.assertEqual(ResponseParser.extract_and_decode_toon(response_text), expected)
-
-    def test_extract_and_decode_with_generic_markdown(self):
-        """
-        Tests parsing a TOON string enclosed in generic ``` ... ``` markdown.
-        """
-        response_text = "```\nnested:\n  inner_key: 42\n```"
-        expected = {"nested": {"inner_key": 42}}
-        self.assertEqual(ResponseParser.extract_and_decode_toon(response_text), expected)
-
-    def test_extract_and_decode_with_quoted_keys(self):
-        """
-        Tests parsing TOON where keys are quoted (required for special characters).
-        """
-        response_text = '"BRK-B": 500\n"BF.B": 200'
-        expected = {"BRK-B": 500, "BF.B": 200}
-        self.assertEqual(ResponseParser.extract_and_decode_toon(response_text), expected)
-
-    def test_extract_and_decode_empty_or_whitespace_string(self):
-        """
-        Tests that an empty string returns an empty dictionary.
-        """
-        self.assertEqual(ResponseParser.extract_and_decode_toon(""), {})
-        self.assertEqual(ResponseParser.extract_and_decode_toon("   \n \t "), {})
+    def test_extract_and_decode_simple_cases(self):
+        """
+        Tests parsing plain TOON, TOON inside ```toon, generic and split-tag
+        markdown fences, quoted keys, and that empty or whitespace-only input
+        yields an empty dictionary.
+        """
+        cases = [
+            (
+                "simple",
+                'key1: "value1"\nkey2: 123\nbool_key: true',
+                {"key1": "value1", "key2": 123, "bool_key": True},
+            ),
+            ("toon markdown", '```toon\nkey: "value"\n```', {"key": "value"}),
+            ("split markdown tag", '```\ntoon\nkey: "value"\n```', {"key": "value"}),
+            (
+                "generic markdown",
+                "```\nnested:\n  inner_key: 42\n```",
+                {"nested": {"inner_key": 42}},
+            ),
+            ("quoted keys", '"BRK-B": 500\n"BF.B": 200', {"BRK-B": 500, "BF.B": 200}),
+            ("empty", "", {}),
+            ("whitespace", "   \n \t ", {}),
+        ]
+        for label, response_text, expected in cases:
+            with self.subTest(label):
+                self.assertEqual(ResponseParser.extract_and_decode_toon(response_text), expected)
 
     def test_checklist_with_yaml_list(self):
         """
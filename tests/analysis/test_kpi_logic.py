@@ -10,9 +10,11 @@ from app.analysis.stocks import (
 
 
 class TestKPILogic(unittest.TestCase):
-    def setUp(self):
-        # Mock fund-level data (as if returned by aggregate_quarter_by_fund)
-        self.df_fund = pd.DataFrame(
+    @classmethod
+    def setUpClass(cls):
+        # Mock fund-level data (as if returned by aggregate_quarter_by_fund).
+        # Built once: _calculate_fund_level_flags works on a copy of its input.
+        cls.df_fund = pd.DataFrame(
             [
                 # Fund A: TSLA is NEW, Top 10, and > 3% (High Conviction)
                 {
@@ -72,42 +74,50 @@ class TestKPILogic(unittest.TestCase):
                 },
             ]
         )
+        # Each stage feeds the next, so later tests reuse the earlier outputs.
+        cls.df_flags = _calculate_fund_level_flags(cls.df_fund)
+        cls.df_agg = _aggregate_stock_data(cls.df_flags)
 
-    def test_kpi_calculations(self):
+    def test_calculate_fund_level_flags(self):
         """
-        Tests TSLA's high-conviction flag, aggregation, and derived metrics across funds.
+        TSLA must be high-conviction only in FundA.
         """
-        # 1. Test Flags — TSLA must be high-conviction only in FundA.
-        df_flags = _calculate_fund_level_flags(self.df_fund)
         conviction_cases = [
             ("FundA", True),
             ("FundB", False),  # NEW but rank/pct too low
             ("FundC", False),  # existing position, not NEW
         ]
         for fund, expected in conviction_cases:
-            with self.subTest(stage="flags", fund=fund):
-                row = df_flags[(df_flags["Fund"] == fund) & (df_flags["Ticker"] == "TSLA")].iloc[0]
+            with self.subTest(fund=fund):
+                row = self.df_flags[
+                    (self.df_flags["Fund"] == fund) & (self.df_flags["Ticker"] == "TSLA")
+                ].iloc[0]
                 self.assertEqual(bool(row["is_high_conviction"]), expected)
 
-        # 2. Test Aggregation — TSLA summary across funds.
-        df_agg = _aggregate_stock_data(df_flags)
-        tsla_summary = df_agg[df_agg["Ticker"] == "TSLA"].iloc[0]
+    def test_aggregate_stock_data(self):
+        """
+        Aggregates TSLA's flags and ratios across the three funds holding it.
+        """
+        tsla_summary = self.df_agg[self.df_agg["Ticker"] == "TSLA"].iloc[0]
         agg_expected = {
             "High_Conviction_Count": 1,  # only FundA
             "Avg_Fund_Concentration": 40.0,  # (40 + 30 + 50) / 3
             "Ownership_Delta_Avg": 50.0,  # only FundC's +50% (NEW positions excluded)
         }
         for col, expected in agg_expected.items():
-            with self.subTest(stage="aggregation", column=col):
+            with self.subTest(column=col):
                 self.assertEqual(tsla_summary[col], expected)
 
-        # 3. Test Derived Metrics — values + required-column presence.
-        df_derived = _calculate_derived_metrics(df_agg)
+    def test_calculate_derived_metrics(self):
+        """
+        Derives TSLA's final metrics and keeps the required columns.
+        """
+        df_derived = _calculate_derived_metrics(self.df_agg)
         tsla_final = df_derived[df_derived["Ticker"] == "TSLA"].iloc[0]
-        with self.subTest(stage="derived", column="Portfolio_Concentration_Avg"):
+        with self.subTest(column="Portfolio_Concentration_Avg"):
             self.assertEqual(tsla_final["Portfolio_Concentration_Avg"], 40.0)
         for col in ("High_Conviction_Count", "Ownership_Delta_Avg"):
-            with self.subTest(stage="derived", column=col):
+            with self.subTest(column=col):
                 self.assertIn(col, tsla_final)
 
 
@@ -6,6 +6,14 @@ import pandas as pd
 from app.analysis.performance_evaluator import PerformanceEvaluator
 
 
+def _holdings_by_quarter(holdings: dict[str, pd.DataFrame]):
+    """
+    Builds a load_fund_holdings side effect that serves each quarter's frame
+    from a lookup table, and an empty frame for any other quarter.
+    """
+    return lambda _fund, quarter: holdings.get(quarter, pd.DataFrame())
+
+
 class TestPerformanceEvaluator(unittest.TestCase):
     @patch("app.analysis.performance_evaluator.load_fund_holdings")
     @patch("app.analysis.performance_evaluator.get_previous_quarter")
@@ -50,14 +58,9 @@ class TestPerformanceEvaluator(unittest.TestCase):
             ]
         )
 
-        def side_effect(fund, quarter):
-            if quarter == "2024Q4":
-                return df_prev
-            if quarter == "2025Q1":
-                return df_curr
-            return pd.DataFrame()
-
-        mock_load_holdings.side_effect = side_effect
+        mock_load_holdings.side_effect = _holdings_by_quarter(
+            {"2024Q4": df_prev, "2025Q1": df_curr}
+        )
 
         result = PerformanceEvaluator.calculate_quarterly_performance("Test Fund", "2025Q1")
 
@@ -117,14 +120,9 @@ class TestPerformanceEvaluator(unittest.TestCase):
             [{"CUSIP": "OTHER", "Shares": 10, "Value": 100, "Reported_Price": 10.0}]
         )
 
-        def side_effect(fund, quarter):
-            if quarter == "2024Q4":
-                return df_prev
-            if quarter == "2025Q1":
-                return df_curr
-            return pd.DataFrame()
-
-        mock_load_holdings.side_effect = side_effect
+        mock_load_holdings.side_effect = _holdings_by_quarter(
+            {"2024Q4": df_prev, "2025Q1": df_curr}
+        )
 
         result = PerformanceEvaluator.calculate_quarterly_performance("Test Fund", "2025Q1")
 
@@ -296,6 +296,32 @@ class TestCusipChangeLinking(unittest.TestCase):
         self.assertEqual(len(df_output), 2)
         self.assertEqual(df_output.loc[0, "Delta"], "NEW")
 
+    def test_portfolio_percentage_precision(self, mock_resolve_ticker):
+        """
+        Weights between 0.01% and 1% get two decimals, smaller ones collapse to
+        '<.01%' and the rest keep one decimal.
+        """
+
+        def resolve_ticker(df):
+            df["Ticker"] = df["CUSIP"]
+            return df
+
+        mock_resolve_ticker.side_effect = resolve_ticker
+
+        df_recent = pd.DataFrame(
+            [
+                {"CUSIP": "TC200001", "Company": "Big Co", "Shares": 10, "Value": 9_934_500},
+                {"CUSIP": "TC200002", "Company": "Small Co", "Shares": 10, "Value": 65_000},
+                {"CUSIP": "TC200003", "Company": "Tiny Co", "Shares": 10, "Value": 500},
+            ]
+        )
+
+        df_output = generate_comparison(df_recent, None).set_index("Ticker")
+
+        self.assertEqual(df_output.loc["TC200001", "Portfolio%"], "99.3%")
+        self.assertEqual(df_output.loc["TC200002", "Portfolio%"], "0.65%")
+        self.assertEqual(df_output.loc["TC200003", "Portfolio%"], "<.01%")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ import asyncio
 import queue
 import time
 import unittest
+from unittest.mock import patch
 
 from app.api.sse import _make_sse_stream, _queue_get_with_timeout
 
@@ -22,7 +23,8 @@ class TestQueueGetWithTimeout(unittest.TestCase):
         """
         q: queue.SimpleQueue = queue.SimpleQueue()
         started = time.monotonic()
-        self.assertIsNone(_queue_get_with_timeout(q))
+        with patch("app.api.sse._QUEUE_POLL_TIMEOUT_S", 0.05):
+            self.assertIsNone(_queue_get_with_timeout(q))
         self.assertLess(time.monotonic() - started, 5)
 
 
@@ -62,10 +64,11 @@ class TestMakeSseStream(unittest.TestCase):
         """
 
         def target():
-            time.sleep(1.5)
+            time.sleep(0.3)
             return "done"
 
-        chunks = self._collect(_make_sse_stream(target))
+        with patch("app.api.sse._QUEUE_POLL_TIMEOUT_S", 0.05):
+            chunks = self._collect(_make_sse_stream(target))
 
         self.assertIn('"type": "result"', chunks[-1])
         self.assertIn("done", chunks[-1])
@@ -4,26 +4,34 @@ import unittest
 
 
 class TestHedgeFunds(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Loads hedge_funds.csv once; the tests below only read it.
+        """
+        cls.hedge_funds = load_hedge_funds()
+
+        # List each quarter folder once for the unknown-report check below
+        cls.report_files = {}
+        for quarter in get_all_quarters():
+            quarter_path = os.path.join(DB_FOLDER, quarter)
+            if os.path.isdir(quarter_path):
+                cls.report_files[quarter_path] = [filename for filename in os.listdir(quarter_path) if filename.endswith('.csv')]
+
     def test_all_reports_belong_to_hedge_funds_file(self):
         """
         Verifies that all quarterly report files correspond to a fund listed in hedge_funds.csv.
         """
-        hedge_funds = load_hedge_funds()
+        hedge_funds = self.hedge_funds
         known_fund_names = {fund['Fund'] for fund in hedge_funds}
-        all_quarters = get_all_quarters()
 
         unexpected_files = []
 
-        for quarter in all_quarters:
-            quarter_path = os.path.join(DB_FOLDER, quarter)
-            if not os.path.isdir(quarter_path):
-                continue
-
-            for filename in os.listdir(quarter_path):
-                if filename.endswith('.csv'):
-                    fund_name_from_file = os.path.splitext(filename)[0].replace('_', ' ')
-                    if fund_name_from_file not in known_fund_names:
-                        unexpected_files.append(os.path.join(quarter_path, filename))
+        for quarter_path, filenames in self.report_files.items():
+            for filename in filenames:
+                fund_name_from_file = os.path.splitext(filename)[0].replace('_', ' ')
+                if fund_name_from_file not in known_fund_names:
+                    unexpected_files.append(os.path.join(quarter_path, filename))
 
         if unexpected_files:
             formatted_files = "\n".join(sorted(unexpected_files))
@@ -39,7 +47,7 @@ class TestHedgeFunds(unittest.TestCase):
         """
         Verifies that every fund listed in hedge_funds.csv has at least one quarterly report file.
         """
-        hedge_funds = load_hedge_funds()
+        hedge_funds = self.hedge_funds
         funds_without_reports = []
 
         for fund in hedge_funds:
@@ -61,7 +69,7 @@ class TestHedgeFunds(unittest.TestCase):
         """
         Verifies that hedge_funds.csv is sorted alphabetically (case-insensitive) by 'Fund'.
         """
-        hedge_funds = load_hedge_funds()
+        hedge_funds = self.hedge_funds
         funds_to_check = [f['Fund'] for f in hedge_funds]
         sorted_funds = sorted(funds_to_check, key=str.casefold)
 
@@ -78,7 +86,7 @@ class TestHedgeFunds(unittest.TestCase):
         """
         Verifies that hedge_funds.csv exposes a URL field for every fund (may be empty).
         """
-        hedge_funds = load_hedge_funds()
+        hedge_funds = self.hedge_funds
         self.assertGreater(len(hedge_funds), 0)
         for fund in hedge_funds:
             self.assertIn('URL', fund, f"Fund '{fund.get('Fund')}' missing URL field")
@@ -88,7 +96,7 @@ class TestHedgeFunds(unittest.TestCase):
         """
         Verifies that no fund (by CIK) is present in both hedge_funds.csv and excluded_hedge_funds.csv.
         """
-        hedge_funds = load_hedge_funds()
+        hedge_funds = self.hedge_funds
         excluded_path = os.path.join(DB_FOLDER, EXCLUDED_HEDGE_FUNDS_FILE)
         excluded_funds = load_hedge_funds(excluded_path)
 
@@ -1,15 +1,50 @@
-from app.database import DB_FOLDER, LATEST_SCHEDULE_FILINGS_FILE, get_all_quarters, load_quarterly_data, load_sector_hierarchy, load_stocks
+from app.database import DB_FOLDER, LATEST_SCHEDULE_FILINGS_FILE, get_all_quarter_files, get_all_quarters, load_sector_hierarchy, load_stocks
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+import numpy as np
 import pandas as pd
 import unittest
 
 
+@cache
+def _all_filing_cusips() -> frozenset:
+    """
+    Returns every CUSIP found in quarterly and non-quarterly filings.
+    Reading all quarterly reports dominates this module's runtime, so it is done once per run.
+    """
+    all_filing_cusips = set()
+
+    # Same approach as clean_stocks: read only the CUSIP column of each fund file, in parallel.
+    def _cusips_from_file(file_path):
+        cusips = pd.read_csv(file_path, usecols=['CUSIP'], dtype=str)['CUSIP']
+        return {c for c in cusips.dropna() if c != 'Total'}
+
+    all_files = [file_path for quarter in get_all_quarters() for file_path in get_all_quarter_files(quarter)]
+    with ThreadPoolExecutor(max_workers=min(16, max(4, len(all_files)))) as pool:
+        for partial in pool.map(_cusips_from_file, all_files):
+            all_filing_cusips.update(partial)
+
+    non_quarterly_path = f"{DB_FOLDER}/{LATEST_SCHEDULE_FILINGS_FILE}"
+    non_quarterly_cusips_df = pd.read_csv(non_quarterly_path, usecols=['CUSIP'], dtype={'CUSIP': str})
+    all_filing_cusips.update(non_quarterly_cusips_df['CUSIP'].dropna().unique())
+
+    return frozenset(all_filing_cusips)
+
+
 class TestStocksDatabase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Loads stocks.csv once; the tests below only read it.
+        """
+        cls.stocks_df = load_stocks().reset_index()
+
     def test_no_duplicate_tickers_with_different_companies(self):
         """
         Verifies that each ticker corresponds to only one unique company name in the stocks.csv file.
         If a ticker is found with multiple different company descriptions, the test will fail.
         """
-        stocks_df = load_stocks().reset_index()
+        stocks_df = self.stocks_df
 
         # Group by Ticker and count the number of unique Company names
         ticker_companies = stocks_df.groupby('Ticker')['Company'].nunique()
@@ -34,34 +69,16 @@ class TestStocksDatabase(unittest.TestCase):
         Identifies orphan CUSIPs that belong to a Ticker with multiple CUSIPs in stocks.csv.
         An orphan CUSIP is one that exists in stocks.csv but not in any filing. This test helps pinpoint and clean up obsolete CUSIPs.
         """
-        stocks_df = load_stocks().reset_index()
-        all_stock_cusips = set(stocks_df['CUSIP'])
-        all_filing_cusips = set()
-
-        # 1. Collect all CUSIPs from all quarterly reports
-        for quarter in get_all_quarters():
-            quarter_df = load_quarterly_data(quarter)
-            if not quarter_df.empty:
-                all_filing_cusips.update(quarter_df['CUSIP'].dropna().unique())
-
-        # 2. Collect all CUSIPs from non-quarterly filings
-        non_quarterly_path = f"{DB_FOLDER}/{LATEST_SCHEDULE_FILINGS_FILE}"
-        non_quarterly_cusips_df = pd.read_csv(non_quarterly_path, usecols=['CUSIP'], dtype={'CUSIP': str})
-        all_filing_cusips.update(non_quarterly_cusips_df['CUSIP'].dropna().unique())
-
-        # 3. Find orphan CUSIPs (present in stocks.csv but not in any filings)
-        orphan_cusips = all_stock_cusips - all_filing_cusips
+        stocks_df = self.stocks_df
+        # 1-2. Collect all CUSIPs from quarterly and non-quarterly filings
+        all_filing_cusips = _all_filing_cusips()
 
-        if not orphan_cusips:
-            return
+        # 3. Flag orphan CUSIPs (present in stocks.csv but not in any filings)
+        is_orphan = ~stocks_df['CUSIP'].isin(all_filing_cusips)
 
-        # 4. Filter orphans to find only those belonging to Tickers with more than one CUSIP
-        orphan_df = stocks_df[stocks_df['CUSIP'].isin(orphan_cusips)]
-        ticker_cusip_counts = stocks_df.groupby('Ticker')['CUSIP'].nunique()
-        tickers_with_multiple_cusips = ticker_cusip_counts[ticker_cusip_counts > 1].index
-
-        # Isolate orphan CUSIPs that belong to these tickers
-        final_orphans_df = orphan_df[orphan_df['Ticker'].isin(tickers_with_multiple_cusips)]
+        # 4. Keep only orphans belonging to Tickers with more than one CUSIP
+        has_multiple_cusips = stocks_df.groupby('Ticker')['CUSIP'].transform('nunique') > 1
+        final_orphans_df = stocks_df[is_orphan & has_multiple_cusips]
 
         if not final_orphans_df.empty:
             sorted_orphans_df = final_orphans_df.sort_values(by=['Ticker', 'CUSIP'])
@@ -78,20 +95,10 @@ class TestStocksDatabase(unittest.TestCase):
         Verifies that all CUSIPs found in quarterly and non-quarterly filings are present in stocks.csv.
         If any CUSIP from a filing is not in stocks.csv, the test will fail, indicating a data integrity issue.
         """
-        stocks_df = load_stocks().reset_index()
+        stocks_df = self.stocks_df
         master_cusips = set(stocks_df['CUSIP'])
-        all_filing_cusips = set()
-
-        # 1. Collect all CUSIPs from all quarterly reports
-        for quarter in get_all_quarters():
-            quarter_df = load_quarterly_data(quarter)
-            if not quarter_df.empty:
-                all_filing_cusips.update(quarter_df['CUSIP'].dropna().unique())
-
-        # 2. Collect all CUSIPs from non-quarterly filings
-        non_quarterly_path = f"{DB_FOLDER}/{LATEST_SCHEDULE_FILINGS_FILE}"
-        non_quarterly_cusips_df = pd.read_csv(non_quarterly_path, usecols=['CUSIP'], dtype={'CUSIP': str})
-        all_filing_cusips.update(non_quarterly_cusips_df['CUSIP'].dropna().unique())
+        # 1-2. Collect all CUSIPs from quarterly and non-quarterly filings
+        all_filing_cusips = _all_filing_cusips()
 
         # 3. Find CUSIPs that are in reports but NOT in stocks.csv
         missing_cusips_in_master = all_filing_cusips - master_cusips
@@ -113,15 +120,17 @@ class TestStocksDatabase(unittest.TestCase):
         Verifies that stocks.csv is sorted by 'Ticker' and then by 'CUSIP'.
         This ensures that the file is consistently organized, which is important for readability and version control.
         """
-        stocks_df = load_stocks().reset_index()
+        tickers = self.stocks_df['Ticker'].to_numpy()
+        cusips = self.stocks_df['CUSIP'].to_numpy()
 
-        # Create a sorted version of the DataFrame
-        sorted_df = stocks_df.sort_values(by=['Ticker', 'CUSIP'])
+        # Each row must not sort before its predecessor: a single pass over adjacent pairs, no sorted copy
+        in_order = (tickers[:-1] < tickers[1:]) | ((tickers[:-1] == tickers[1:]) & (cusips[:-1] <= cusips[1:]))
 
-        # Check if the original DataFrame is identical to the sorted one
-        if not stocks_df.equals(sorted_df):
+        if not in_order.all():
+            row = int(np.argmin(in_order)) + 1
             error_message = (
                 f"The stock.csv file is not sorted correctly by 'Ticker'.\n"
+                f"First out-of-order row: {tickers[row]} ({cusips[row]}) after {tickers[row - 1]} ({cusips[row - 1]}).\n"
                 "Please run the database updater with option '0. Exit' to sort the file."
             )
             self.fail(error_message)
@@ -134,7 +143,7 @@ class TestStocksDatabase(unittest.TestCase):
         an industry missing from the hierarchy would silently lose its sector
         and break the dashboard's sector roll-up.
         """
-        stocks_df = load_stocks().reset_index()
+        stocks_df = self.stocks_df
         hierarchy_df = load_sector_hierarchy()
 
         allowed = set(hierarchy_df["Industry"])
@@ -164,7 +173,7 @@ class TestStocksDatabase(unittest.TestCase):
         the underlying common stock is `Software - Application` — they describe
         the same business.
         """
-        stocks_df = load_stocks().reset_index()
+        stocks_df = self.stocks_df
         populated = stocks_df[stocks_df["Industry"] != ""]
         # For each Company, collect the distinct industries assigned to it.
         industries_per_company = populated.groupby("Company")["Industry"].agg(
@@ -193,7 +202,7 @@ class TestStocksDatabase(unittest.TestCase):
         Checks for company names in stocks.csv that appear to be truncated.
         Fails if any company name ends with suspicious suffixes indicating truncation.
         """
-        stocks_df = load_stocks().reset_index()
+        stocks_df = self.stocks_df
 
         # List of suffixes that often indicate truncation
         suspicious_suffixes = (
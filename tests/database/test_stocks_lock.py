@@ -52,7 +52,7 @@ class TestStocksLock(unittest.TestCase):
         self.lock_path.touch()
 
         with self.assertRaises(TimeoutError):
-            with stocks_lock(timeout=1):
+            with stocks_lock(timeout=0.2):
                 pass
 
         self.assertTrue(self.lock_path.exists())
@@ -0,0 +1,89 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from app.scraper.filing_cache import FilingCache, parse_13f
+from app.scraper.xml_processor import xml_to_dataframe_13f
+
+XML_CONTENT = b"""
+<informationtable>
+    <infotable>
+        <nameofissuer>NA Holdings</nameofissuer>
+        <cusip>123456789</cusip>
+        <value>10000000</value>
+        <shrsorprnamt><sshprnamt>100000</sshprnamt></shrsorprnamt>
+    </infotable>
+    <infotable>
+        <nameofissuer>Other Corp</nameofissuer>
+        <cusip>987654321</cusip>
+        <value>3333333</value>
+        <shrsorprnamt><sshprnamt>30000</sshprnamt></shrsorprnamt>
+    </infotable>
+</informationtable>
+"""
+
+
+class TestFilingCache(unittest.TestCase):
+    """
+    Tests for the on-disk cache of parsed 13F information tables.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary cache directory.
+        """
+        self.tmp = tempfile.mkdtemp(prefix="hft_filing_cache_")
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+    def test_round_trip_preserves_the_parsed_frame(self):
+        """
+        A stored parse reads back identical, dtypes included, from a fresh instance.
+        """
+        df = xml_to_dataframe_13f(XML_CONTENT)
+        FilingCache(self.tmp).put(XML_CONTENT, df)
+
+        cached = FilingCache(self.tmp).get(XML_CONTENT)
+
+        assert cached is not None
+        pd.testing.assert_frame_equal(cached, df)
+
+    def test_unknown_filing_is_a_miss(self):
+        """
+        A filing that was never stored (or whose XML differs) is not served.
+        """
+        cache = FilingCache(self.tmp)
+        cache.put(XML_CONTENT, xml_to_dataframe_13f(XML_CONTENT))
+
+        self.assertIsNone(cache.get(XML_CONTENT.replace(b"3333333", b"3333334")))
+
+    def test_empty_parse_is_not_stored(self):
+        """
+        Empty frames are not cached, so a filing that failed to parse is retried.
+        """
+        FilingCache(self.tmp).put(XML_CONTENT, pd.DataFrame())
+
+        self.assertEqual(list(Path(self.tmp).iterdir()), [])
+
+    def test_parse_13f_parses_once_then_serves_the_cache(self):
+        """
+        parse_13f stores the first parse and answers the same filing from disk.
+        """
+        with (
+            patch("app.scraper.filing_cache.CACHE_DIR", self.tmp),
+            patch(
+                "app.scraper.filing_cache.xml_to_dataframe_13f", wraps=xml_to_dataframe_13f
+            ) as mock_parse,
+        ):
+            first = parse_13f(XML_CONTENT)
+            second = parse_13f(XML_CONTENT)
+
+        mock_parse.assert_called_once()
+        pd.testing.assert_frame_equal(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
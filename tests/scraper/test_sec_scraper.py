@@ -1,8 +1,8 @@
 import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
-from bs4 import BeautifulSoup
 from curl_cffi import requests
 from curl_cffi.requests.exceptions import HTTPError, RequestException
 from tenacity import wait_combine, wait_random
@@ -15,11 +15,13 @@ from app.scraper.sec_scraper import (
     _build_session,
     _create_search_url,
     _get_accepted,
+    _get_document_tags,
     _get_filing_date,
     _get_primary_xml_url,
     _get_report_date,
     _get_request,
     _get_session,
+    _parse_page,
     _scrape_filing,
     close_session,
     fetch_latest_two_13f_filings,
@@ -168,8 +170,21 @@ class TestSecScraper(unittest.TestCase):
         expected_url_date = f"https://www.sec.gov/cgi-bin/browse-edgar?CIK={cik}&action=getcompany&type=SCHEDULE&count=100&datea={date}"
         self.assertEqual(_create_search_url(cik, "SCHEDULE", date), expected_url_date)
 
+    def test_parse_page_accepts_xml_encoding_declaration(self):
+        """
+        A page starting with an <?xml ... encoding=...?> declaration is parsed
+        like any other instead of raising, keeping non-ASCII text intact.
+        """
+        page_text = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>\n'
+            '<html><body><a id="documentsbutton" href="/doc1">Société</a></body></html>'
+        )
+
+        self.assertEqual(_get_document_tags(page_text)[0].get("href"), "/doc1")
+        self.assertEqual(_parse_page(page_text).xpath("//a")[0].text, "Société")
+
     def test_html_parsing_helpers(self):
-        """Test helper functions for parsing HTML soup."""
+        """Test helper functions for parsing the report page."""
         # Updated mock HTML to reflect expected structure (label in one tag, value in next)
         html = """
         <div>Accepted</div>
@@ -183,23 +198,23 @@ class TestSecScraper(unittest.TestCase):
         <a href="/Archives/edgar/data/123/000/other.xml">xml</a>
         <a href="/Archives/edgar/data/123/000/target.xml">xml</a>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        page = _parse_page(html)
 
-        self.assertEqual(_get_accepted(soup), "2023-01-01 10:00:00")
-        self.assertEqual(_get_filing_date(soup), "2023-01-02")
-        self.assertEqual(_get_report_date(soup), "2022-12-31")
+        self.assertEqual(_get_accepted(page), "2023-01-01 10:00:00")
+        self.assertEqual(_get_filing_date(page), "2023-01-02")
+        self.assertEqual(_get_report_date(page), "2022-12-31")
 
         # Test 13F-HR (index 3)
         # In our mock HTML, index 3 is target.xml
         self.assertEqual(
-            _get_primary_xml_url(soup, "13F-HR"),
+            _get_primary_xml_url(page, "13F-HR"),
             "https://www.sec.gov/Archives/edgar/data/123/000/target.xml",
         )
 
         # Test SCHEDULE (index 1)
         # In our mock HTML, index 1 is xsl.xml
         self.assertEqual(
-            _get_primary_xml_url(soup, "SCHEDULE"),
+            _get_primary_xml_url(page, "SCHEDULE"),
             "https://www.sec.gov/Archives/edgar/data/123/000/xsl.xml",
         )
 
@@ -255,14 +270,15 @@ class TestSecScraper(unittest.TestCase):
         mock_get_request.return_value = mock_search_response
 
         with patch("app.scraper.sec_scraper._scrape_filing") as mock_scrape:
-            # Mock return values for the first 2 calls.
             # Note: The code slices [offset:offset+2] BEFORE scraping.
-            # So it will only scrape doc1 and doc2.
-            # We give them dates to verify sorting (doc1 is older, doc2 is newer).
-            mock_scrape.side_effect = [
-                {"id": 1, "date": "2023-06-30"},  # last filing
-                {"id": 2, "date": "2023-03-31"},  # second last filing
-            ]
+            # So it will only scrape doc1 and doc2. Filings are scraped
+            # concurrently, so results are keyed by document rather than
+            # by call order; the output must still follow the search order.
+            scraped = {
+                "/doc1": {"id": 1, "date": "2023-06-30"},  # last filing
+                "/doc2": {"id": 2, "date": "2023-03-31"},  # second last filing
+            }
+            mock_scrape.side_effect = lambda tag, filing_type: scraped[tag.get("href")]
 
             filings = fetch_latest_two_13f_filings("CIK123")
 
@@ -294,7 +310,8 @@ class TestSecScraper(unittest.TestCase):
         mock_get_request.return_value = mock_search_response
 
         with patch("app.scraper.sec_scraper._scrape_filing") as mock_scrape:
-            mock_scrape.side_effect = [{"id": 1, "date": "2023-06-30"}, None]
+            scraped = {"/doc1": {"id": 1, "date": "2023-06-30"}, "/doc2": None}
+            mock_scrape.side_effect = lambda tag, filing_type: scraped[tag.get("href")]
 
             filings = fetch_latest_two_13f_filings("CIK123")
 
@@ -399,6 +416,32 @@ class TestSecScraperLifecycle(unittest.TestCase):
         close_session()
         close_session()  # should not raise
 
+    def test_long_lived_thread_rebuilds_after_close_session(self):
+        """
+        A thread that outlives close_session() (e.g. a scrape pool worker) must
+        get a fresh Session on its next request, not the closed one.
+        """
+        import app.scraper.sec_scraper as scraper
+
+        sessions = []
+        closed = threading.Event()
+
+        def worker():
+            sessions.append(scraper._get_session())
+            closed.wait(timeout=5)
+            sessions.append(scraper._get_session())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        while not sessions:
+            time.sleep(0.001)
+        close_session()
+        closed.set()
+        thread.join(timeout=5)
+
+        self.assertEqual(len(sessions), 2)
+        self.assertIsNot(sessions[0], sessions[1])
+
     def test_reset_session_rebuilds_rate_limiter(self):
         """reset_session must replace _rate_limiter with a fresh instance and clear sessions."""
         import app.scraper.sec_scraper as scraper
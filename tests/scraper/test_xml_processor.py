@@ -177,6 +177,98 @@ class TestXmlProcessor(unittest.TestCase):
         self.assertEqual(df["Company"][0], "Good Co")
         self.assertTrue(any("2" in message for message in captured.output))
 
+    def test_xml_to_dataframe_13f_company_whitespace_is_collapsed(self):
+        """
+        Issuer names wrapped across lines or padded with runs of spaces come out
+        trimmed with single spaces.
+        """
+        xml_content = """
+        <informationtable>
+            <infotable>
+                <nameofissuer>
+                    Wrapped   Name
+                    Holdings	Inc
+                </nameofissuer>
+                <cusip>CUSIP1</cusip>
+                <value>10000000</value>
+                <shrsorprnamt><sshprnamt>100000</sshprnamt></shrsorprnamt>
+            </infotable>
+        </informationtable>
+        """
+
+        df = xml_to_dataframe_13f(xml_content)
+
+        self.assertEqual(df["Company"][0], "Wrapped Name Holdings Inc")
+
+    def test_xml_to_dataframe_13f_namespaced_filing_drops_options_and_merges_cusips(self):
+        """
+        Parses an EDGAR-style namespaced, camelCase information table: option
+        rows are dropped and lots sharing a CUSIP are summed into one row.
+        """
+        xml_content = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <ns1:informationTable xmlns:ns1="http://www.sec.gov/edgar/document/thirteenf/informationtable">
+            <ns1:infoTable>
+                <ns1:nameOfIssuer>ACME  CORP</ns1:nameOfIssuer>
+                <ns1:cusip>00123a101</ns1:cusip>
+                <ns1:value>1000000</ns1:value>
+                <ns1:shrsOrPrnAmt><ns1:sshPrnamt>10000</ns1:sshPrnamt><ns1:sshPrnamtType>SH</ns1:sshPrnamtType></ns1:shrsOrPrnAmt>
+            </ns1:infoTable>
+            <ns1:infoTable>
+                <ns1:nameOfIssuer>ACME  CORP</ns1:nameOfIssuer>
+                <ns1:cusip>00123A101</ns1:cusip>
+                <ns1:value>500000</ns1:value>
+                <ns1:shrsOrPrnAmt><ns1:sshPrnamt>5000</ns1:sshPrnamt><ns1:sshPrnamtType>SH</ns1:sshPrnamtType></ns1:shrsOrPrnAmt>
+            </ns1:infoTable>
+            <ns1:infoTable>
+                <ns1:nameOfIssuer>ACME CORP</ns1:nameOfIssuer>
+                <ns1:cusip>00123A101</ns1:cusip>
+                <ns1:value>200000</ns1:value>
+                <ns1:shrsOrPrnAmt><ns1:sshPrnamt>2000</ns1:sshPrnamt><ns1:sshPrnamtType>SH</ns1:sshPrnamtType></ns1:shrsOrPrnAmt>
+                <ns1:putCall>Call</ns1:putCall>
+            </ns1:infoTable>
+        </ns1:informationTable>
+        """
+
+        df = xml_to_dataframe_13f(xml_content)
+
+        self.assertEqual(len(df), 1)
+        self.assertEqual(df["CUSIP"][0], "00123A101")
+        self.assertEqual(df["Company"][0], "ACME CORP")
+        self.assertEqual(df["Value"][0], 1500000)
+        self.assertEqual(df["Shares"][0], 15000)
+
+    def test_xml_to_dataframe_13f_drops_holdings_without_cusip(self):
+        """
+        Holdings missing the <cusip> tag are dropped, whether there is one of
+        them or several, and the remaining rows are unaffected.
+        """
+        holding = """
+            <infotable>
+                <nameofissuer>{name}</nameofissuer>
+                {cusip}
+                <value>{value}</value>
+                <shrsorprnamt><sshprnamt>{shares}</sshprnamt></shrsorprnamt>
+            </infotable>"""
+        known = holding.format(
+            name="Known Corp", cusip="<cusip>123456789</cusip>", value=1000000, shares=10000
+        )
+        missing = [
+            holding.format(name="Mystery Corp", cusip="", value=500000, shares=5000),
+            holding.format(name="Enigma Corp", cusip="", value=300000, shares=3000),
+        ]
+
+        for count in (1, 2):
+            with self.subTest(null_cusips=count):
+                xml_content = (
+                    f"<informationtable>{known}{''.join(missing[:count])}</informationtable>"
+                )
+
+                df = xml_to_dataframe_13f(xml_content)
+
+                self.assertEqual(df["CUSIP"].tolist(), ["123456789"])
+                self.assertEqual(df["Value"][0], 1000000)
+                self.assertEqual(df["Shares"][0], 10000)
+
 
 class TestXmlToDataframeSchedule(unittest.TestCase):
     SCHEDULE_XML = """
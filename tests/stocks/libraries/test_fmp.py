@@ -16,7 +16,7 @@ def _mock_response(status_code: int, payload):
 
 
 class TestFmpGetCusip(unittest.TestCase):
-    @patch("app.stocks.libraries.fmp.requests.get")
+    @patch("app.stocks.libraries.fmp.http_session.get")
     def test_returns_cusip_for_us_ticker(self, mock_get):
         """
         Returns the CUSIP from the profile payload for a US-listed equity.
@@ -33,7 +33,7 @@ class TestFmpGetCusip(unittest.TestCase):
         self.assertEqual(params["symbol"], "AAPL")
         self.assertEqual(params["apikey"], "test-key")
 
-    @patch("app.stocks.libraries.fmp.requests.get")
+    @patch("app.stocks.libraries.fmp.http_session.get")
     def test_returns_none_when_cusip_field_absent(self, mock_get):
         """
         Returns None for non-US securities where FMP omits the CUSIP field
@@ -47,7 +47,7 @@ class TestFmpGetCusip(unittest.TestCase):
         with patch.object(FMP, "API_KEY", "test-key"):
             self.assertIsNone(FMP.get_cusip("QTEX"))
 
-    @patch("app.stocks.libraries.fmp.requests.get")
+    @patch("app.stocks.libraries.fmp.http_session.get")
     def test_returns_none_when_no_data(self, mock_get):
         """
         Returns None when the profile endpoint replies with an empty list.
@@ -56,7 +56,7 @@ class TestFmpGetCusip(unittest.TestCase):
         with patch.object(FMP, "API_KEY", "test-key"):
             self.assertIsNone(FMP.get_cusip("ZZZZ"))
 
-    @patch("app.stocks.libraries.fmp.requests.get")
+    @patch("app.stocks.libraries.fmp.http_session.get")
     def test_returns_none_without_api_key(self, mock_get):
         """
         Returns None and skips the HTTP call when FMP_API_KEY is unset.
@@ -65,7 +65,7 @@ class TestFmpGetCusip(unittest.TestCase):
             self.assertIsNone(FMP.get_cusip("AAPL"))
         mock_get.assert_not_called()
 
-    @patch("app.stocks.libraries.fmp.requests.get")
+    @patch("app.stocks.libraries.fmp.http_session.get")
     def test_returns_none_on_http_error(self, mock_get):
         """
         Returns None when the endpoint replies with a non-OK status (rate limit, 5xx, ...).
@@ -76,7 +76,7 @@ class TestFmpGetCusip(unittest.TestCase):
 
 
 class TestFmpGetProfile(unittest.TestCase):
-    @patch("app.stocks.libraries.fmp.requests.get")
+    @patch("app.stocks.libraries.fmp.http_session.get")
     def test_returns_profile_fields_without_isin(self, mock_get):
         """
         Returns sector/industry/country alongside cusip; ISIN is intentionally omitted.
@@ -110,7 +110,7 @@ class TestFmpGetProfile(unittest.TestCase):
         )
         self.assertNotIn("isin", profile)
 
-    @patch("app.stocks.libraries.fmp.requests.get")
+    @patch("app.stocks.libraries.fmp.http_session.get")
     def test_returns_none_when_no_data(self, mock_get):
         """
         Returns None when the profile endpoint replies empty.
@@ -119,7 +119,7 @@ class TestFmpGetProfile(unittest.TestCase):
         with patch.object(FMP, "API_KEY", "test-key"):
             self.assertIsNone(FMP.get_profile("ZZZZ"))
 
-    @patch("app.stocks.libraries.fmp.requests.get")
+    @patch("app.stocks.libraries.fmp.http_session.get")
     def test_returns_none_without_api_key(self, mock_get):
         """
         Returns None without performing an HTTP call when FMP_API_KEY is unset.
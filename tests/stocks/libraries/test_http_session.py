@@ -0,0 +1,72 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.stocks.libraries import http_session
+
+
+class TestHttpSession(unittest.TestCase):
+    def setUp(self):
+        """
+        Starts each test without any pooled session.
+        """
+        http_session.close_sessions()
+        self.addCleanup(http_session.close_sessions)
+
+    @patch("app.stocks.libraries.http_session.requests.Session")
+    def test_reuses_one_session_per_thread(self, mock_session_cls):
+        """
+        Repeated calls on one thread share a Session; another thread gets its own.
+        """
+        mock_session_cls.side_effect = lambda: MagicMock()
+
+        http_session.get("https://example.com/a", timeout=5)
+        http_session.post("https://example.com/b", json=[])
+        main_session = http_session._get_session()
+
+        other: list = []
+        worker = threading.Thread(target=lambda: other.append(http_session._get_session()))
+        worker.start()
+        worker.join()
+
+        self.assertEqual(mock_session_cls.call_count, 2)
+        main_session.get.assert_called_once_with("https://example.com/a", timeout=5)
+        main_session.post.assert_called_once_with("https://example.com/b", json=[])
+        self.assertIsNot(other[0], main_session)
+
+    @patch("app.stocks.libraries.http_session.requests.Session")
+    def test_close_sessions_closes_every_thread_session(self, mock_session_cls):
+        """
+        close_sessions closes all registered sessions and the next call rebuilds one.
+        """
+        mock_session_cls.side_effect = lambda: MagicMock()
+        first = http_session._get_session()
+
+        http_session.close_sessions()
+
+        first.close.assert_called_once()
+        self.assertIsNot(http_session._get_session(), first)
+
+    @patch("app.stocks.libraries.http_session.requests.Session")
+    def test_sessions_of_exited_threads_are_closed(self, mock_session_cls):
+        """
+        A session owned by a thread that has exited is closed when the next
+        session is created, so short-lived threads do not leak one each.
+        """
+        mock_session_cls.side_effect = lambda: MagicMock()
+        worker_sessions: list = []
+        worker = threading.Thread(
+            target=lambda: worker_sessions.append(http_session._get_session())
+        )
+        worker.start()
+        worker.join()
+
+        main_session = http_session._get_session()
+
+        worker_sessions[0].close.assert_called_once()
+        main_session.close.assert_not_called()
+        self.assertEqual(list(http_session._sessions.values()), [main_session])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -64,7 +64,7 @@ class TestNasdaqParsePrice(unittest.TestCase):
 
 
 class TestNasdaqFetchHistorical(unittest.TestCase):
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_returns_matching_row_for_date(self, mock_get):
         """
         Returns the row matching the requested date.
@@ -82,7 +82,7 @@ class TestNasdaqFetchHistorical(unittest.TestCase):
 
         self.assertEqual(row["close"], "10.23")
 
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_returns_none_when_date_not_in_rows(self, mock_get):
         """
         Returns None when the API returns data but not for the requested date.
@@ -99,7 +99,7 @@ class TestNasdaqFetchHistorical(unittest.TestCase):
 
         self.assertIsNone(row)
 
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_returns_none_when_api_returns_no_data(self, mock_get):
         """
         Returns None when the API returns a null data field.
@@ -112,7 +112,7 @@ class TestNasdaqFetchHistorical(unittest.TestCase):
 
         self.assertIsNone(row)
 
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_returns_none_when_request_raises(self, mock_get):
         """
         Returns None when the HTTP request raises an exception.
@@ -186,7 +186,7 @@ class TestNasdaqGetAvgPrice(unittest.TestCase):
 
 
 class TestNasdaqGetCurrentPrice(unittest.TestCase):
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_returns_latest_close_price(self, mock_get):
         """
         Returns the close price from the most recent row.
@@ -203,7 +203,7 @@ class TestNasdaqGetCurrentPrice(unittest.TestCase):
 
         self.assertEqual(price, 10.22)
 
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_returns_none_when_no_data(self, mock_get):
         """
         Returns None when the API returns no data.
@@ -216,7 +216,7 @@ class TestNasdaqGetCurrentPrice(unittest.TestCase):
 
         self.assertIsNone(price)
 
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_returns_none_when_request_raises(self, mock_get):
         """
         Returns None when the HTTP request raises an exception.
@@ -227,7 +227,7 @@ class TestNasdaqGetCurrentPrice(unittest.TestCase):
 
         self.assertIsNone(price)
 
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_strips_dollar_sign_from_stock_price(self, mock_get):
         """
         Correctly parses prices with $ prefix.
@@ -246,7 +246,7 @@ class TestNasdaqGetCurrentPrice(unittest.TestCase):
 
 
 class TestNasdaqGetSymbolChanges(unittest.TestCase):
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_returns_list_of_old_new_ticker_pairs(self, mock_get):
         """
         Returns a list of dicts with oldSymbol, newSymbol, and companyName.
@@ -279,7 +279,7 @@ class TestNasdaqGetSymbolChanges(unittest.TestCase):
         self.assertEqual(changes[0]["newSymbol"], "KEEL")
         self.assertEqual(changes[1]["oldSymbol"], "NBY")
 
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_returns_empty_list_when_no_data(self, mock_get):
         """
         Returns an empty list when the API returns null data.
@@ -292,7 +292,7 @@ class TestNasdaqGetSymbolChanges(unittest.TestCase):
 
         self.assertEqual(changes, [])
 
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_returns_empty_list_when_request_fails(self, mock_get):
         """
         Returns an empty list when the HTTP request raises an exception.
@@ -303,7 +303,7 @@ class TestNasdaqGetSymbolChanges(unittest.TestCase):
 
         self.assertEqual(changes, [])
 
-    @patch("app.stocks.libraries.nasdaq.requests.get")
+    @patch("app.stocks.libraries.nasdaq.http_session.get")
     def test_calls_correct_api_endpoint(self, mock_get):
         """
         Calls the NASDAQ symbol change history API with correct URL and headers.
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from curl_cffi.requests.exceptions import RequestException
+
 from app.stocks.libraries.openfigi import OpenFIGI
 
 
@@ -16,7 +18,18 @@ def _mock_response(status_code: int, payload):
 
 
 class TestOpenFIGI(unittest.TestCase):
-    @patch("app.stocks.libraries.openfigi.requests.post")
+    def setUp(self):
+        """
+        Clears the per-process lookup and batch caches so each test sees its own
+        mocked response, and stubs the rate limiter so tests don't wait for tokens.
+        """
+        OpenFIGI._lookup_by_cusip.cache_clear()
+        OpenFIGI._batch_records.clear()
+        limiter_patcher = patch.object(OpenFIGI, "_limiter")
+        self.mock_limiter = limiter_patcher.start()
+        self.addCleanup(limiter_patcher.stop)
+
+    @patch("app.stocks.libraries.openfigi.http_session.post")
     def test_get_ticker_by_cusip(self, mock_post):
         """
         Returns the ticker from the first Common Stock match.
@@ -34,7 +47,7 @@ class TestOpenFIGI(unittest.TestCase):
             [{"idType": "ID_CUSIP", "idValue": "88160R101", "exchCode": "US"}],
         )
 
-    @patch("app.stocks.libraries.openfigi.requests.post")
+    @patch("app.stocks.libraries.openfigi.http_session.post")
     def test_get_ticker_prefers_common_stock(self, mock_post):
         """
         When multiple matches are returned, prefers Common Stock over other types.
@@ -53,7 +66,7 @@ class TestOpenFIGI(unittest.TestCase):
 
         self.assertEqual(OpenFIGI.get_ticker("88160R101"), "TSLA")
 
-    @patch("app.stocks.libraries.openfigi.requests.post")
+    @patch("app.stocks.libraries.openfigi.http_session.post")
     def test_get_ticker_no_match(self, mock_post):
         """
         Returns None when OpenFIGI reports no matches.
@@ -61,7 +74,7 @@ class TestOpenFIGI(unittest.TestCase):
         mock_post.return_value = _mock_response(200, [{"warning": "No identifier found."}])
         self.assertIsNone(OpenFIGI.get_ticker("00000X000"))
 
-    @patch("app.stocks.libraries.openfigi.requests.post")
+    @patch("app.stocks.libraries.openfigi.http_session.post")
     def test_get_company(self, mock_post):
         """
         Returns the company name, run through format_string.
@@ -73,7 +86,7 @@ class TestOpenFIGI(unittest.TestCase):
 
         self.assertEqual(OpenFIGI.get_company("88160R101"), "Tesla Inc")
 
-    @patch("app.stocks.libraries.openfigi.requests.post")
+    @patch("app.stocks.libraries.openfigi.http_session.post")
     def test_rate_limit_returns_none(self, mock_post):
         """
         On HTTP 429 (rate limit), logs and returns None instead of raising.
@@ -81,7 +94,7 @@ class TestOpenFIGI(unittest.TestCase):
         mock_post.return_value = _mock_response(429, {"message": "Too Many Requests"})
         self.assertIsNone(OpenFIGI.get_ticker("88160R101"))
 
-    @patch("app.stocks.libraries.openfigi.requests.post")
+    @patch("app.stocks.libraries.openfigi.http_session.post")
     def test_http_error_returns_none(self, mock_post):
         """
         On non-OK HTTP responses (other than 429), returns None rather than raising.
@@ -89,9 +102,22 @@ class TestOpenFIGI(unittest.TestCase):
         mock_post.return_value = _mock_response(500, {"message": "Server Error"})
         self.assertIsNone(OpenFIGI.get_ticker("88160R101"))
 
-    @patch("app.stocks.libraries.openfigi.time.sleep")
+    @patch("app.stocks.libraries.openfigi.http_session.post")
+    def test_each_request_takes_a_rate_limit_token(self, mock_post):
+        """
+        Every POST first acquires a token from the rate limiter instead of
+        sleeping a fixed pause after the previous request.
+        """
+        mock_post.return_value = _mock_response(200, [{"warning": "No identifier found."}])
+
+        with patch.object(OpenFIGI, "API_KEY", None):
+            OpenFIGI.map_cusips([f"CUSIP{i:04d}" for i in range(12)])
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(self.mock_limiter.return_value.acquire.call_count, 2)
+
     @patch("app.stocks.libraries.openfigi.OpenFIGI._post")
-    def test_map_cusips_batches_and_maps(self, mock_post, _mock_sleep):
+    def test_map_cusips_batches_and_maps(self, mock_post):
         """
         Maps CUSIPs in batched requests (10 jobs per request without an API
         key) and returns the best record for each resolved CUSIP; unresolved
@@ -121,9 +147,8 @@ class TestOpenFIGI(unittest.TestCase):
         self.assertEqual(result["CUSIP0010"]["name"], "Co 10")
         self.assertNotIn("CUSIP0011", result)
 
-    @patch("app.stocks.libraries.openfigi.time.sleep")
     @patch("app.stocks.libraries.openfigi.OpenFIGI._post")
-    def test_map_cusips_logs_periodic_progress(self, mock_post, _mock_sleep):
+    def test_map_cusips_logs_periodic_progress(self, mock_post):
         """
         Long reconciliation runs emit a progress log every 10 batches so the
         CLI/SSE stream shows the sweep is alive.
@@ -139,9 +164,8 @@ class TestOpenFIGI(unittest.TestCase):
 
         self.assertTrue(any("10/11" in message for message in logs.output))
 
-    @patch("app.stocks.libraries.openfigi.time.sleep")
     @patch("app.stocks.libraries.openfigi.OpenFIGI._post")
-    def test_map_cusips_skips_failed_batches(self, mock_post, _mock_sleep):
+    def test_map_cusips_skips_failed_batches(self, mock_post):
         """
         A batch that fails outright (rate limit / network) is skipped without
         losing the other batches' results.
@@ -151,7 +175,7 @@ class TestOpenFIGI(unittest.TestCase):
             {"data": [{"ticker": "T10", "name": "Co 10", "securityType": "Common Stock"}]},
             {"data": [{"ticker": "T11", "name": "Co 11", "securityType": "Common Stock"}]},
         ]
-        mock_post.side_effect = [None, second_batch]
+        mock_post.side_effect = [RequestException("boom"), second_batch]
 
         with patch.object(OpenFIGI, "API_KEY", None):
             result = OpenFIGI.map_cusips(cusips)
@@ -159,7 +183,133 @@ class TestOpenFIGI(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result["CUSIP0011"]["ticker"], "T11")
 
-    @patch("app.stocks.libraries.openfigi.requests.post")
+    @patch("app.stocks.libraries.openfigi.http_session.post")
+    def test_ticker_and_company_share_one_request(self, mock_post):
+        """
+        Looking up the ticker and then the company of one CUSIP hits the API once.
+        """
+        mock_post.return_value = _mock_response(
+            200,
+            [{"data": [{"ticker": "TSLA", "name": "TESLA INC", "securityType": "Common Stock"}]}],
+        )
+
+        self.assertEqual(OpenFIGI.get_ticker("88160R101"), "TSLA")
+        self.assertEqual(OpenFIGI.get_company("88160R101"), "Tesla Inc")
+        mock_post.assert_called_once()
+
+    @patch("app.stocks.libraries.openfigi.http_session.post")
+    def test_lookup_caches_answers_but_not_failures(self, mock_post):
+        """
+        A CUSIP that was answered is not looked up again, while a rate-limited
+        or failed request is retried on the next call instead of being
+        remembered as a miss.
+        """
+        mock_post.side_effect = [
+            _mock_response(429, {"message": "Too Many Requests"}),
+            RequestException("boom"),
+            _mock_response(200, [{"data": [{"ticker": "TSLA", "securityType": "Common Stock"}]}]),
+        ]
+
+        self.assertIsNone(OpenFIGI.get_ticker("88160R101"))
+        self.assertIsNone(OpenFIGI.get_ticker("88160R101"))
+        self.assertEqual(OpenFIGI.get_ticker("88160R101"), "TSLA")
+        self.assertEqual(OpenFIGI.get_ticker("88160R101"), "TSLA")
+        self.assertEqual(mock_post.call_count, 3)
+
+    @patch("app.stocks.libraries.openfigi.OpenFIGI._post")
+    def test_get_tickers_normalizes_batched_records(self, mock_post):
+        """
+        Resolves a batch in one request, normalizing bond-style tickers and
+        answering None for CUSIPs without a ticker or without a match.
+        """
+        mock_post.return_value = [
+            {"data": [{"ticker": "TSLA"}]},
+            {"data": [{"ticker": "INFN 2.5 03/01/27"}]},
+            {"data": [{"name": "No Ticker Corp"}]},
+            {"warning": "No identifier found."},
+        ]
+
+        result = OpenFIGI.get_tickers(
+            {"88160R101": "Tesla", "45667G103": "Infinera", "000000000": "No Ticker", "X": "?"}
+        )
+
+        mock_post.assert_called_once()
+        self.assertEqual(
+            [job["idValue"] for job in mock_post.call_args.args[0]],
+            ["88160R101", "45667G103", "000000000", "X"],
+        )
+        self.assertEqual(
+            result, {"88160R101": "TSLA", "45667G103": "INFN", "000000000": None, "X": None}
+        )
+
+    @patch("app.stocks.libraries.openfigi.OpenFIGI._post")
+    def test_get_tickers_leaves_out_failed_batches(self, mock_post):
+        """
+        CUSIPs of a batch whose request failed are not answered at all, so the
+        resolver does not record them as misses.
+        """
+        mock_post.side_effect = [RequestException("boom"), [{"warning": "No identifier found."}]]
+        cusips = {f"CUSIP{i:04d}": "Co" for i in range(11)}
+
+        with patch.object(OpenFIGI, "API_KEY", None):
+            result = OpenFIGI.get_tickers(cusips)
+
+        self.assertEqual(result, {"CUSIP0010": None})
+
+    @patch("app.stocks.libraries.openfigi.OpenFIGI._post")
+    def test_get_tickers_leaves_out_short_responses_and_job_errors(self, mock_post):
+        """
+        A response with fewer results than jobs fails its whole batch, and a
+        per-job error leaves only that CUSIP unanswered; neither is reported
+        as "no match".
+        """
+        mock_post.side_effect = [
+            [{"data": [{"ticker": "T0"}]}],
+            [{"error": "Invalid idValue format."}, {"warning": "No identifier found."}],
+        ]
+        cusips = {f"CUSIP{i:04d}": "Co" for i in range(12)}
+
+        with patch.object(OpenFIGI, "API_KEY", None):
+            result = OpenFIGI.get_tickers(cusips)
+
+        self.assertEqual(result, {"CUSIP0011": None})
+
+    @patch("app.stocks.libraries.openfigi.http_session.post")
+    def test_get_company_reuses_batch_records(self, mock_post):
+        """
+        After a batched lookup, the company name and "no match" answers are
+        served from the batch instead of another rate-limited request.
+        """
+        mock_post.return_value = _mock_response(
+            200,
+            [
+                {"data": [{"ticker": "TSLA", "name": "TESLA INC"}]},
+                {"warning": "No identifier found."},
+            ],
+        )
+
+        OpenFIGI.get_tickers({"88160R101": "Tesla", "999999999": "Unknown"})
+
+        self.assertEqual(OpenFIGI.get_company("88160R101"), "Tesla Inc")
+        self.assertIsNone(OpenFIGI.get_company("999999999"))
+        mock_post.assert_called_once()
+
+    @patch("app.stocks.libraries.openfigi.http_session.post")
+    def test_single_lookup_job_error_is_not_cached(self, mock_post):
+        """
+        A per-job error on a single-CUSIP lookup is a failure, retried on the
+        next call rather than cached as "no match".
+        """
+        mock_post.side_effect = [
+            _mock_response(200, [{"error": "Internal error."}]),
+            _mock_response(200, [{"data": [{"ticker": "TSLA"}]}]),
+        ]
+
+        self.assertIsNone(OpenFIGI.get_ticker("88160R101"))
+        self.assertEqual(OpenFIGI.get_ticker("88160R101"), "TSLA")
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("app.stocks.libraries.openfigi.http_session.post")
     def test_sends_api_key_when_present(self, mock_post):
         """
         Sends the X-OPENFIGI-APIKEY header when OPENFIGI_API_KEY is set.
@@ -175,7 +325,7 @@ class TestOpenFIGI(unittest.TestCase):
         headers = mock_post.call_args.kwargs["headers"]
         self.assertEqual(headers.get("X-OPENFIGI-APIKEY"), "test-key")
 
-    @patch("app.stocks.libraries.openfigi.requests.post")
+    @patch("app.stocks.libraries.openfigi.http_session.post")
     def test_omits_api_key_header_when_absent(self, mock_post):
         """
         Does not send the X-OPENFIGI-APIKEY header when no key is configured.
@@ -13,7 +13,7 @@ def _make_api_response(rows):
 
 
 class TestStockAnalysisFetchHistory(unittest.TestCase):
-    @patch("app.stocks.libraries.stockanalysis.requests.get")
+    @patch("app.stocks.libraries.stockanalysis.http_session.get")
     def test_returns_rows_from_api(self, mock_get):
         """
         Returns the raw rows list from a successful API response.
@@ -29,7 +29,7 @@ class TestStockAnalysisFetchHistory(unittest.TestCase):
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0]["c"], 374.3)
 
-    @patch("app.stocks.libraries.stockanalysis.requests.get")
+    @patch("app.stocks.libraries.stockanalysis.http_session.get")
     def test_returns_empty_list_when_no_data(self, mock_get):
         """
         Returns an empty list when the API reports no data for an unknown ticker.
@@ -42,7 +42,7 @@ class TestStockAnalysisFetchHistory(unittest.TestCase):
 
         self.assertEqual(rows, [])
 
-    @patch("app.stocks.libraries.stockanalysis.requests.get")
+    @patch("app.stocks.libraries.stockanalysis.http_session.get")
     def test_returns_empty_list_when_request_raises(self, mock_get):
         """
         Returns an empty list when the HTTP request raises an exception.
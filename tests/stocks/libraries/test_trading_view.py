@@ -241,7 +241,14 @@ def _symbol_search_response(symbols):
 
 
 class TestTradingViewIdentifierLookup(unittest.TestCase):
-    @patch("app.stocks.libraries.trading_view.requests.get")
+    def setUp(self):
+        """
+        Clears the per-process lookup caches so each test sees its own mocked response.
+        """
+        TradingView._search_cusip.cache_clear()
+        TradingView._search_by_text.cache_clear()
+
+    @patch("app.stocks.libraries.trading_view.http_session.get")
     def test_get_ticker_returns_first_us_exchange_match(self, mock_get):
         """
         Converts CUSIP to ISIN, calls symbol_search, returns the ticker of the first US-listed match.
@@ -269,7 +276,7 @@ class TestTradingViewIdentifierLookup(unittest.TestCase):
         params = mock_get.call_args.kwargs["params"]
         self.assertEqual(params["text"], "US0378331005")
 
-    @patch("app.stocks.libraries.trading_view.requests.get")
+    @patch("app.stocks.libraries.trading_view.http_session.get")
     def test_get_ticker_returns_none_when_only_non_us_listings(self, mock_get):
         """
         Returns None when the ISIN search yields only non-US listings — picking a
@@ -289,7 +296,7 @@ class TestTradingViewIdentifierLookup(unittest.TestCase):
 
         self.assertIsNone(TradingView.get_ticker("282644400"))
 
-    @patch("app.stocks.libraries.trading_view.requests.get")
+    @patch("app.stocks.libraries.trading_view.http_session.get")
     def test_get_ticker_falls_back_to_non_us_description_when_isin_has_no_us_match(self, mock_get):
         """
         When the ISIN search returns only non-US listings, retries the search using
@@ -324,7 +331,7 @@ class TestTradingViewIdentifierLookup(unittest.TestCase):
         second_call_params = mock_get.call_args_list[1].kwargs["params"]
         self.assertEqual(second_call_params["text"], "CHRONOSCALE CORPORATION")
 
-    @patch("app.stocks.libraries.trading_view.requests.get")
+    @patch("app.stocks.libraries.trading_view.http_session.get")
     def test_get_ticker_returns_none_when_no_us_listing_anywhere(self, mock_get):
         """
         Returns None when neither the ISIN search nor the description-based fallback
@@ -342,7 +349,28 @@ class TestTradingViewIdentifierLookup(unittest.TestCase):
         self.assertIsNone(TradingView.get_ticker("282644400"))
         self.assertEqual(mock_get.call_count, 2)
 
-    @patch("app.stocks.libraries.trading_view.requests.get")
+    @patch("app.stocks.libraries.trading_view.http_session.get")
+    def test_name_search_is_shared_across_share_classes(self, mock_get):
+        """
+        Two CUSIPs of one issuer falling back to the same description trigger a
+        single name search; only their ISIN searches are sent separately.
+        """
+        non_us = _symbol_search_response(
+            [{"symbol": "ABEA", "description": "ALPHABET INC", "exchange": "XETR"}]
+        )
+        mock_get.side_effect = [
+            non_us,
+            _symbol_search_response(
+                [{"symbol": "GOOGL", "description": "Alphabet Inc.", "exchange": "NASDAQ"}]
+            ),
+            non_us,
+        ]
+
+        self.assertEqual(TradingView.get_ticker("02079K305"), "GOOGL")
+        self.assertEqual(TradingView.get_ticker("02079K107"), "GOOGL")
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("app.stocks.libraries.trading_view.http_session.get")
     def test_strips_em_highlight_tags_from_results(self, mock_get):
         """
         TradingView wraps the matched substring with <em>...</em> tags in the
@@ -362,7 +390,7 @@ class TestTradingViewIdentifierLookup(unittest.TestCase):
         self.assertEqual(TradingView.get_company("282644301"), "ChronoScale Corporation")
         self.assertEqual(TradingView.get_ticker("282644301"), "CHRN")
 
-    @patch("app.stocks.libraries.trading_view.requests.get")
+    @patch("app.stocks.libraries.trading_view.http_session.get")
     def test_get_ticker_skips_description_fallback_when_no_isin_results(self, mock_get):
         """
         When the ISIN search itself returns nothing, there is no description to fall
@@ -373,7 +401,7 @@ class TestTradingViewIdentifierLookup(unittest.TestCase):
         self.assertIsNone(TradingView.get_ticker("282644400"))
         self.assertEqual(mock_get.call_count, 1)
 
-    @patch("app.stocks.libraries.trading_view.requests.get")
+    @patch("app.stocks.libraries.trading_view.http_session.get")
     def test_get_ticker_returns_none_when_no_symbols(self, mock_get):
         """
         Returns None when the endpoint reports zero matches.
@@ -381,7 +409,7 @@ class TestTradingViewIdentifierLookup(unittest.TestCase):
         mock_get.return_value = _symbol_search_response([])
         self.assertIsNone(TradingView.get_ticker("037833100"))
 
-    @patch("app.stocks.libraries.trading_view.requests.get")
+    @patch("app.stocks.libraries.trading_view.http_session.get")
     def test_get_ticker_returns_none_on_invalid_cusip(self, mock_get):
         """
         Returns None when the CUSIP cannot be converted to an ISIN (skips the HTTP call).
@@ -389,19 +417,68 @@ class TestTradingViewIdentifierLookup(unittest.TestCase):
         self.assertIsNone(TradingView.get_ticker("BADCUSIP"))
         mock_get.assert_not_called()
 
-    @patch("app.stocks.libraries.trading_view.requests.get")
-    def test_get_ticker_returns_none_on_http_error(self, mock_get):
+    @patch("app.stocks.libraries.trading_view.http_session.get")
+    def test_get_ticker_raises_on_http_error(self, mock_get):
         """
-        Returns None when the endpoint replies with a non-OK status.
+        A non-OK status raises from get_ticker, so batch resolution does not
+        take it for a miss, while get_company still degrades to None.
         """
+        from curl_cffi.requests.exceptions import RequestException
+
         resp = MagicMock()
         resp.ok = False
         resp.status_code = 403
         mock_get.return_value = resp
 
-        self.assertIsNone(TradingView.get_ticker("037833100"))
+        with self.assertRaises(RequestException):
+            TradingView.get_ticker("037833100")
+        self.assertIsNone(TradingView.get_company("037833100"))
+
+    @patch("app.stocks.libraries.trading_view.http_session.get")
+    def test_failed_text_search_is_not_cached(self, mock_get):
+        """
+        A network error, non-OK status or invalid JSON leaves the query uncached,
+        so the next call asks again instead of reusing an empty result.
+        """
+        from curl_cffi.requests.exceptions import RequestException
+
+        forbidden = MagicMock(ok=False, status_code=429)
+        bad_json = MagicMock(ok=True, status_code=200)
+        bad_json.json.side_effect = ValueError("not JSON")
+        mock_get.side_effect = [
+            RequestException("boom"),
+            forbidden,
+            bad_json,
+            _symbol_search_response([{"symbol": "AAPL", "exchange": "NASDAQ"}]),
+        ]
+
+        for _ in range(3):
+            with self.assertRaises((RequestException, ValueError)):
+                TradingView._search_by_text("US0378331005")
+        self.assertEqual(TradingView._search_by_text("US0378331005")[0]["symbol"], "AAPL")
+        self.assertEqual(TradingView._search_by_text("US0378331005")[0]["symbol"], "AAPL")
+        self.assertEqual(mock_get.call_count, 4)
+
+    @patch("app.stocks.libraries.trading_view.http_session.get")
+    def test_get_ticker_caches_answers_but_not_failures(self, mock_get):
+        """
+        A CUSIP that was answered is not searched again, while a failed search
+        is retried on the next call instead of being remembered as a miss.
+        """
+        from curl_cffi.requests.exceptions import RequestException
+
+        mock_get.side_effect = [
+            RequestException("boom"),
+            _symbol_search_response([{"symbol": "AAPL", "exchange": "NASDAQ"}]),
+        ]
+
+        with self.assertRaises(RequestException):
+            TradingView.get_ticker("037833100")
+        self.assertEqual(TradingView.get_ticker("037833100"), "AAPL")
+        self.assertEqual(TradingView.get_ticker("037833100"), "AAPL")
+        self.assertEqual(mock_get.call_count, 2)
 
-    @patch("app.stocks.libraries.trading_view.requests.get")
+    @patch("app.stocks.libraries.trading_view.http_session.get")
     def test_get_company_returns_formatted_description(self, mock_get):
         """
         Returns the description of the best match, run through format_string.
@@ -419,7 +496,7 @@ class TestTradingViewIdentifierLookup(unittest.TestCase):
 
         self.assertEqual(TradingView.get_company("037833100"), "Apple Inc")
 
-    @patch("app.stocks.libraries.trading_view.requests.get")
+    @patch("app.stocks.libraries.trading_view.http_session.get")
     def test_sends_browser_headers(self, mock_get):
         """
         Sends Referer and Origin headers so TradingView does not reject the request with 403.
@@ -1,14 +1,26 @@
+import threading
 import unittest
 from datetime import date, timedelta
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
-from app.stocks.libraries.yfinance import YFinance
+from app.stocks.libraries.base_library import FinanceLibrary
+from app.stocks.libraries.yfinance import YFinance, _PriceCache
 
 
 class TestYFinance(unittest.TestCase):
-    @patch("app.stocks.libraries.yfinance.requests.get")
+    def setUp(self):
+        """
+        Clears the per-process CUSIP search, price and sector caches so each
+        test sees its own mocked response.
+        """
+        YFinance._search_cusip.cache_clear()
+        YFinance._sector_top_companies.cache_clear()
+        YFinance._avg_price_cache.clear()
+        YFinance._current_price_cache.clear()
+
+    @patch("app.stocks.libraries.yfinance.http_session.get")
     def test_get_ticker(self, mock_get):
         """
         Tests the get_ticker method using mocks.
@@ -68,6 +80,10 @@ class TestYFinance(unittest.TestCase):
         self.assertIsNone(company)
         mock_yf_ticker.assert_not_called()
 
+        # A failed CUSIP search degrades to None as well.
+        mock_get_ticker.side_effect = ValueError("bad payload")
+        self.assertIsNone(YFinance.get_company("unknown_cusip"))
+
     @patch("app.stocks.libraries.yfinance.yf.Ticker")
     def test_get_classification_returns_sector_and_industry(self, mock_yf_ticker):
         """
@@ -159,7 +175,7 @@ class TestYFinance(unittest.TestCase):
 
         self.assertIsNone(YFinance.get_classification("AAPL"))
 
-    @patch("app.stocks.libraries.yfinance.requests.get")
+    @patch("app.stocks.libraries.yfinance.http_session.get")
     def test_get_ticker_returns_none_when_quote_symbol_is_empty(self, mock_get):
         """
         Returns None when the Yahoo search response includes a quote whose
@@ -175,6 +191,24 @@ class TestYFinance(unittest.TestCase):
 
         self.assertIsNone(ticker)
 
+    @patch("app.stocks.libraries.yfinance.http_session.get")
+    def test_get_ticker_caches_answers_but_not_failures(self, mock_get):
+        """
+        A CUSIP that was answered is not searched again, while a failed search
+        raises (so it is not taken for a miss) and is retried on the next call.
+        """
+        from curl_cffi.requests.exceptions import RequestException
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"quotes": [{"symbol": "AAPL"}]}
+        mock_get.side_effect = [RequestException("boom"), mock_response]
+
+        with self.assertRaises(RequestException):
+            YFinance.get_ticker("037833100")
+        self.assertEqual(YFinance.get_ticker("037833100"), "AAPL")
+        self.assertEqual(YFinance.get_ticker("037833100"), "AAPL")
+        self.assertEqual(mock_get.call_count, 2)
+
     @patch("app.stocks.libraries.yfinance.yf.Ticker")
     def test_get_current_price(self, mock_yf_ticker):
         """
@@ -206,11 +240,112 @@ class TestYFinance(unittest.TestCase):
         # When no historical data exists in the window, the price must not be
         # silently substituted with today's current price (that made the stored
         # value drift between runs); it returns None so the fallback chain continues.
+        YFinance._avg_price_cache.clear()
         mock_download.return_value = pd.DataFrame()
         price = YFinance.get_avg_price("AAPL", test_date)
         self.assertIsNone(price)
         mock_get_current.assert_not_called()
 
+    @patch("app.stocks.libraries.yfinance.yf.download")
+    def test_get_avg_price_caches_past_days_only(self, mock_download):
+        """
+        A completed day's average is fetched once per process (share-class
+        spellings share the entry); today's is fetched again, as is a miss.
+        """
+        mock_download.return_value = pd.DataFrame({"High": [110.0], "Low": [90.0]})
+        past = date(2024, 1, 15)
+
+        self.assertEqual(YFinance.get_avg_price("BRK.B", past), 100.0)
+        self.assertEqual(YFinance.get_avg_price("BRK-B", past), 100.0)
+        self.assertEqual(mock_download.call_count, 1)
+
+        YFinance.get_avg_price("BRK.B", date.today())
+        YFinance.get_avg_price("BRK.B", date.today())
+        self.assertEqual(mock_download.call_count, 3)
+
+        mock_download.return_value = pd.DataFrame()
+        YFinance.get_avg_price("BRK.B", date(2024, 1, 16))
+        YFinance.get_avg_price("BRK.B", date(2024, 1, 16))
+        self.assertEqual(mock_download.call_count, 5)
+
+    @patch("app.stocks.libraries.yfinance.yf.download")
+    def test_get_avg_prices_batches_one_download(self, mock_download):
+        """
+        Averages every ticker from one download, taking each ticker's last
+        trading day at or before the date and omitting tickers without data.
+        """
+        index = pd.to_datetime(["2024-01-12", "2024-01-15"])
+        columns = pd.MultiIndex.from_product([["AAA", "BRK-B", "NONE"], ["High", "Low"]])
+        nan = float("nan")
+        mock_download.return_value = pd.DataFrame(
+            [[10.0, 8.0, 50.0, 40.0, nan, nan], [12.0, 10.0, nan, nan, nan, nan]],
+            index=index,
+            columns=columns,
+        )
+
+        prices = YFinance.get_avg_prices(["AAA", "BRK.B", "NONE"], date(2024, 1, 15))
+
+        self.assertEqual(prices, {"AAA": 11.0, "BRK.B": 45.0})
+        mock_download.assert_called_once()
+        self.assertEqual(mock_download.call_args.kwargs["tickers"], ["AAA", "BRK-B", "NONE"])
+
+        # Resolved prices are reused by the single-ticker lookup.
+        self.assertEqual(YFinance.get_avg_price("AAA", date(2024, 1, 15)), 11.0)
+        mock_download.assert_called_once()
+
+    @patch("app.stocks.libraries.yfinance.time.monotonic")
+    @patch("app.stocks.libraries.yfinance.yf.Ticker")
+    def test_get_current_price_is_reused_until_ttl_expires(self, mock_yf_ticker, mock_monotonic):
+        """
+        A current price is served from memory for CURRENT_PRICE_TTL_S seconds,
+        then fetched again.
+        """
+        mock_yf_ticker.return_value = MagicMock(info={"currentPrice": 150.0})
+        mock_monotonic.return_value = 1000.0
+
+        self.assertEqual(YFinance.get_current_price("AAPL"), 150.0)
+        mock_monotonic.return_value += YFinance.CURRENT_PRICE_TTL_S - 1
+        self.assertEqual(YFinance.get_current_price("AAPL"), 150.0)
+        self.assertEqual(mock_yf_ticker.call_count, 1)
+
+        mock_monotonic.return_value += 1
+        YFinance.get_current_price("AAPL")
+        self.assertEqual(mock_yf_ticker.call_count, 2)
+
+    def test_price_cache_evicts_least_recently_used_past_maxsize(self):
+        """
+        The average-price cache stays within maxsize, dropping the entry used
+        least recently rather than the one just read.
+        """
+        cache = _PriceCache(maxsize=2)
+        cache.set("AAA", 1.0)
+        cache.set("BBB", 2.0)
+        self.assertEqual(cache.get("AAA"), 1.0)
+
+        cache.set("CCC", 3.0)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("BBB"))
+        self.assertEqual(cache.get("AAA"), 1.0)
+        self.assertEqual(cache.get("CCC"), 3.0)
+
+    @patch("app.stocks.libraries.yfinance.time.monotonic")
+    def test_price_cache_evicts_expired_entries_on_store(self, mock_monotonic):
+        """
+        With a TTL, expired entries are dropped when a new price is stored, so
+        prices that are never read again do not pile up.
+        """
+        cache = _PriceCache(maxsize=10, ttl_s=300)
+        mock_monotonic.return_value = 1000.0
+        cache.set("AAA", 1.0)
+        cache.set("BBB", 2.0)
+
+        mock_monotonic.return_value += 300
+        cache.set("CCC", 3.0)
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("CCC"), 3.0)
+
     @patch("app.stocks.libraries.yfinance.yf.download")
     @patch("app.stocks.libraries.yfinance.YFinance.get_current_price")
     def test_get_avg_price_uses_last_trading_day_for_non_trading_date(
@@ -296,6 +431,35 @@ class TestYFinance(unittest.TestCase):
         with self.assertRaises(YFRateLimitError):
             YFinance.get_stocks_info.__wrapped__(["AAA"])
 
+    @patch("app.stocks.libraries.yfinance.yf.download")
+    @patch("app.stocks.libraries.yfinance.yf.Ticker")
+    def test_get_stocks_info_rate_limit_stops_remaining_lookups(self, mock_ticker, mock_download):
+        """
+        Once a sector lookup is rate-limited, the queued lookups must not go on
+        to hit Yahoo: at most the ones already in flight have made a request.
+        """
+        from yfinance.exceptions import YFRateLimitError
+
+        tickers = ["AAA", "BBB", "CCC", "DDD", "EEE", "FFF"]
+        mock_download.return_value = pd.DataFrame()
+        # Other lookups stay in flight until the test ends, so any extra
+        # request can only come from a lookup started after the rate limit.
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def ticker_side_effect(symbol):
+            if symbol == "AAA":
+                raise YFRateLimitError()
+            release.wait(5)
+            return MagicMock(info={"sector": "Technology"})
+
+        mock_ticker.side_effect = ticker_side_effect
+
+        with self.assertRaises(YFRateLimitError):
+            YFinance.get_stocks_info.__wrapped__(tickers)
+
+        self.assertLessEqual(mock_ticker.call_count, FinanceLibrary.LOOKUP_WORKERS)
+
     @patch("app.stocks.libraries.yfinance.yf.download")
     @patch("app.stocks.libraries.yfinance.yf.Ticker")
     def test_get_stocks_info_per_ticker_error_keeps_partial_results(
@@ -312,6 +476,29 @@ class TestYFinance(unittest.TestCase):
 
         self.assertEqual(stocks_info, {"AAA": {"price": 10.0, "sector": None}})
 
+    @patch("app.stocks.libraries.yfinance.yf.download")
+    @patch("app.stocks.libraries.yfinance.yf.Ticker")
+    def test_get_stocks_info_parallel_lookups_keep_ticker_order(self, mock_ticker, mock_download):
+        """
+        Sector lookups run concurrently; a failed lookup must not shift the
+        other tickers' sectors onto the wrong symbol.
+        """
+        columns = pd.MultiIndex.from_tuples([(t, "Close") for t in ("AAA", "BBB", "CCC")])
+        mock_download.return_value = pd.DataFrame([[1.0, 2.0, 3.0]], columns=columns)
+
+        def ticker_side_effect(symbol):
+            if symbol == "BBB":
+                raise ValueError("bad payload")
+            return MagicMock(info={"sector": f"Sector {symbol}"})
+
+        mock_ticker.side_effect = ticker_side_effect
+
+        stocks_info = YFinance.get_stocks_info.__wrapped__(["AAA", "BBB", "CCC"])
+
+        self.assertEqual(stocks_info["AAA"], {"price": 1.0, "sector": "Sector AAA"})
+        self.assertEqual(stocks_info["BBB"], {"price": 2.0, "sector": None})
+        self.assertEqual(stocks_info["CCC"], {"price": 3.0, "sector": "Sector CCC"})
+
     @patch("app.stocks.libraries.yfinance.yf.Sector")
     def test_get_sector_tickers(self, mock_yf_sector):
         """
@@ -330,10 +517,16 @@ class TestYFinance(unittest.TestCase):
         self.assertEqual(len(companies), 1)
         self.assertEqual(companies[0]["symbol"], "AAPL")
 
+        # The same sector is served from memory for the rest of the day.
+        self.assertEqual(len(YFinance.get_sector_tickers("technology")), 2)
+        mock_yf_sector.assert_called_once_with("technology")
+
+    @patch("time.sleep")
     @patch("app.stocks.libraries.yfinance.yf.Sector")
-    def test_get_sector_tickers_invalid_sector(self, mock_yf_sector):
+    def test_get_sector_tickers_invalid_sector(self, mock_yf_sector, _mock_sleep):
         """
         Tests the get_sector_tickers method with retry logic on failure.
+        (time.sleep is patched so the retry backoff doesn't stall the test.)
         """
         mock_yf_sector.return_value.top_companies = None
 
@@ -1,9 +1,9 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
-from app.stocks.classification import resolve_industry
+from app.stocks.classification import _llm_classify, resolve_industry
 
 
 def _stocks_df(rows: list[tuple[str, str, str, str]]) -> pd.DataFrame:
@@ -125,5 +125,23 @@ class TestResolveIndustry(unittest.TestCase):
             self.assertEqual(resolve_industry("AEVAW", ""), "")
 
 
+class TestLlmClassify(unittest.TestCase):
+    @patch.dict("os.environ", {"GROQ_API_KEY": "test-key"})
+    @patch("app.stocks.classification.load_sector_hierarchy")
+    @patch("app.stocks.classification.http_session.post")
+    def test_classifies_through_the_pooled_session(self, mock_post, mock_hierarchy):
+        """
+        The Groq request goes through the shared pooled session, and the answer
+        is mapped back onto the closed Industry vocabulary.
+        """
+        mock_hierarchy.return_value = pd.DataFrame({"Industry": ["Auto Parts", "Shell Companies"]})
+        response = MagicMock(ok=True)
+        response.json.return_value = {"choices": [{"message": {"content": "`auto parts`"}}]}
+        mock_post.return_value = response
+
+        self.assertEqual(_llm_classify("AEVA", "Aeva Technologies Inc"), "Auto Parts")
+        mock_post.assert_called_once()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -185,6 +185,21 @@ class TestPriceFetcher(unittest.TestCase):
         self.assertEqual(price, 0)
         mock_tv.assert_not_called()
 
+    @patch("app.stocks.price_fetcher.PriceFetcher.get_avg_price")
+    @patch("app.stocks.price_fetcher.YFinance.get_avg_prices")
+    def test_get_avg_prices_falls_back_per_ticker_for_batch_misses(self, mock_batch, mock_single):
+        """
+        Takes what the YFinance batch resolved and runs only the misses through
+        the per-ticker fallback chain.
+        """
+        mock_batch.return_value = {"AAPL": 145.5}
+        mock_single.return_value = None
+
+        prices = PriceFetcher.get_avg_prices(["AAPL", "FMSMX"], date(2023, 12, 25))
+
+        self.assertEqual(prices, {"AAPL": 145.5, "FMSMX": None})
+        mock_single.assert_called_once_with("FMSMX", date(2023, 12, 25))
+
     # --- get_history ---
 
     @patch("app.stocks.price_fetcher.TradingView.get_history")
@@ -0,0 +1,87 @@
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+from app.stocks.ticker_cache import TickerMissCache
+
+
+class TestTickerMissCache(unittest.TestCase):
+    """
+    Tests for the persistent record of unresolvable CUSIPs.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary cache file path.
+        """
+        self.tmp = tempfile.mkdtemp(prefix="hft_ticker_cache_")
+        self.path = Path(self.tmp) / "misses.csv"
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+    def test_recorded_miss_persists_across_instances(self):
+        """
+        A recorded miss is reported as recent by a fresh instance reading the same file.
+        """
+        TickerMissCache(self.path, today_fn=lambda: date(2025, 6, 1)).record(["999999999"])
+
+        cache = TickerMissCache(self.path, today_fn=lambda: date(2025, 6, 3))
+
+        self.assertEqual(cache.recent_misses(), {"999999999"})
+
+    def test_miss_expires_after_ttl(self):
+        """
+        Misses older than the TTL are retried, so new listings eventually resolve.
+        """
+        TickerMissCache(self.path, today_fn=lambda: date(2025, 6, 1)).record(["999999999"])
+
+        cache = TickerMissCache(self.path, ttl_days=7, today_fn=lambda: date(2025, 6, 8))
+
+        self.assertEqual(cache.recent_misses(), set())
+
+    def test_latest_check_wins_and_malformed_rows_are_skipped(self):
+        """
+        Re-recording a CUSIP refreshes its date; rows with a bad date are ignored.
+        """
+        TickerMissCache(self.path, today_fn=lambda: date(2025, 1, 1)).record(["111111111"])
+        TickerMissCache(self.path, today_fn=lambda: date(2025, 6, 1)).record(["111111111"])
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write('"222222222","not-a-date"\n')
+
+        cache = TickerMissCache(self.path, today_fn=lambda: date(2025, 6, 2))
+
+        self.assertEqual(cache.recent_misses(), {"111111111"})
+
+    def test_record_rewrites_file_without_expired_misses(self):
+        """
+        Recording compacts the file: expired misses and superseded checks are
+        dropped, leaving one row per live miss.
+        """
+        TickerMissCache(self.path, today_fn=lambda: date(2025, 1, 1)).record(["111111111"])
+        TickerMissCache(self.path, today_fn=lambda: date(2025, 6, 1)).record(["222222222"])
+        TickerMissCache(self.path, today_fn=lambda: date(2025, 6, 2)).record(["222222222"])
+
+        rows = self.path.read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(rows, ['"cusip","checked_on"', '"222222222","2025-06-02"'])
+        self.assertEqual(list(Path(self.tmp).iterdir()), [self.path])
+
+    def test_instances_loaded_together_keep_each_others_misses(self):
+        """
+        Two caches loaded before either records (as on concurrent report
+        threads) must not overwrite each other's misses when they write.
+        """
+        first = TickerMissCache(self.path, today_fn=lambda: date(2025, 6, 1))
+        second = TickerMissCache(self.path, today_fn=lambda: date(2025, 6, 1))
+
+        first.record(["111111111"])
+        second.record(["222222222"])
+
+        cache = TickerMissCache(self.path, today_fn=lambda: date(2025, 6, 2))
+        self.assertEqual(cache.recent_misses(), {"111111111", "222222222"})
+        self.assertEqual(second.recent_misses(), {"111111111", "222222222"})
+
+
+if __name__ == "__main__":
+    unittest.main()
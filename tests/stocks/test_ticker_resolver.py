@@ -1,8 +1,11 @@
+import shutil
+import tempfile
 import unittest
 from unittest.mock import patch
 
 import pandas as pd
 
+from app.stocks.libraries.openfigi import OpenFIGI
 from app.stocks.ticker_resolver import TickerResolver
 
 
@@ -46,6 +49,18 @@ class TestTickerResolverGetLibraries(unittest.TestCase):
 
 
 class TestTickerResolverResolveTicker(unittest.TestCase):
+    def setUp(self):
+        """
+        Redirects the ticker miss cache to a temporary directory and forgets
+        OpenFIGI's batch answers from earlier tests.
+        """
+        OpenFIGI._batch_records.clear()
+        self.cache_dir = tempfile.mkdtemp(prefix="hft_ticker_cache_")
+        patcher = patch("app.stocks.ticker_cache.CACHE_DIR", self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+
     @patch("app.stocks.ticker_resolver.load_stocks")
     def test_uses_cached_ticker_when_cusip_in_database(self, mock_load):
         """
@@ -112,7 +127,7 @@ class TestTickerResolverResolveTicker(unittest.TestCase):
 
     @patch("app.stocks.ticker_resolver.save_stock")
     @patch("app.stocks.ticker_resolver.OpenFIGI.get_company")
-    @patch("app.stocks.ticker_resolver.OpenFIGI.get_ticker")
+    @patch("app.stocks.ticker_resolver.OpenFIGI.get_tickers")
     @patch("app.stocks.ticker_resolver.YFinance.get_ticker")
     @patch("app.stocks.ticker_resolver.load_stocks")
     def test_falls_back_to_second_library_when_first_returns_none(
@@ -123,7 +138,7 @@ class TestTickerResolverResolveTicker(unittest.TestCase):
         """
         mock_load.return_value = _empty_stocks()
         mock_yf_ticker.return_value = None
-        mock_of_ticker.return_value = "AAPL"
+        mock_of_ticker.return_value = {"037833100": "AAPL"}
         mock_of_company.return_value = "Apple Inc"
         df = pd.DataFrame({"CUSIP": ["037833100"], "Company": ["Apple Inc"]})
 
@@ -132,9 +147,41 @@ class TestTickerResolverResolveTicker(unittest.TestCase):
         self.assertEqual(result.loc[0, "Ticker"], "AAPL")
         mock_save.assert_called_once()
 
+    @patch("app.stocks.ticker_resolver.save_stock")
+    @patch("app.stocks.ticker_resolver.YFinance.get_company")
+    @patch("app.stocks.libraries.openfigi.OpenFIGI._post")
+    @patch("app.stocks.ticker_resolver.YFinance.get_ticker")
+    @patch("app.stocks.ticker_resolver.load_stocks")
+    def test_batches_openfigi_lookups_for_unique_misses(
+        self, mock_load, mock_yf_ticker, mock_post, mock_company, mock_save
+    ):
+        """
+        Sends only the unique CUSIPs YFinance missed to OpenFIGI, in a single batch call.
+        """
+        mock_load.return_value = _empty_stocks()
+        mock_yf_ticker.side_effect = lambda cusip, **kwargs: (
+            "AAPL" if cusip == "037833100" else None
+        )
+        mock_post.return_value = [{"data": [{"ticker": "JNJ"}]}, {"data": [{"ticker": "MSFT"}]}]
+        mock_company.return_value = "Company"
+        df = pd.DataFrame(
+            {
+                "CUSIP": ["037833100", "478160104", "594918104", "478160104"],
+                "Company": ["Apple Inc", "Johnson & Johnson", "Microsoft", "Johnson & Johnson"],
+            }
+        )
+
+        result = TickerResolver.resolve_ticker(df)
+
+        mock_post.assert_called_once()
+        self.assertEqual(
+            [job["idValue"] for job in mock_post.call_args.args[0]], ["478160104", "594918104"]
+        )
+        self.assertEqual(list(result["Ticker"]), ["AAPL", "JNJ", "MSFT", "JNJ"])
+
     @patch("app.stocks.ticker_resolver.open_issue")
     @patch("app.stocks.ticker_resolver.TradingView.get_ticker")
-    @patch("app.stocks.ticker_resolver.OpenFIGI.get_ticker")
+    @patch("app.stocks.ticker_resolver.OpenFIGI.get_tickers")
     @patch("app.stocks.ticker_resolver.YFinance.get_ticker")
     @patch("app.stocks.ticker_resolver.load_stocks")
     def test_opens_github_issue_when_no_library_resolves_ticker(
@@ -145,7 +192,7 @@ class TestTickerResolverResolveTicker(unittest.TestCase):
         """
         mock_load.return_value = _empty_stocks()
         mock_yf.return_value = None
-        mock_of.return_value = None
+        mock_of.return_value = {}
         mock_tv.return_value = None
         df = pd.DataFrame({"CUSIP": ["999999999"], "Company": ["Unknown Corp"]})
 
@@ -155,6 +202,81 @@ class TestTickerResolverResolveTicker(unittest.TestCase):
         subject = mock_issue.call_args[0][0]
         self.assertIn("Ticker not found", subject)
 
+    @patch("app.stocks.ticker_resolver.open_issue")
+    @patch("app.stocks.ticker_resolver.TradingView.get_ticker")
+    @patch("app.stocks.ticker_resolver.OpenFIGI.get_tickers")
+    @patch("app.stocks.ticker_resolver.YFinance.get_ticker")
+    @patch("app.stocks.ticker_resolver.load_stocks")
+    def test_recent_miss_is_not_looked_up_again(
+        self, mock_load, mock_yf, mock_of, mock_tv, mock_issue
+    ):
+        """
+        A CUSIP that failed to resolve is skipped on the next run: no library
+        calls and no duplicate GitHub issue.
+        """
+        mock_load.return_value = _empty_stocks()
+        mock_yf.return_value = None
+        mock_of.return_value = {"999999999": None}
+        mock_tv.return_value = None
+
+        for _ in range(2):
+            df = pd.DataFrame({"CUSIP": ["999999999"], "Company": ["Unknown Corp"]})
+            result = TickerResolver.resolve_ticker(df)
+
+        mock_yf.assert_called_once()
+        mock_issue.assert_called_once()
+        self.assertTrue(pd.isna(result.loc[0, "Ticker"]))
+
+    @patch("app.stocks.ticker_resolver.open_issue")
+    @patch("app.stocks.ticker_resolver.TradingView.get_ticker")
+    @patch("app.stocks.ticker_resolver.OpenFIGI.get_tickers")
+    @patch("app.stocks.ticker_resolver.YFinance.get_ticker")
+    @patch("app.stocks.ticker_resolver.load_stocks")
+    def test_failed_lookup_is_not_recorded_as_a_miss(
+        self, mock_load, mock_yf, mock_of, mock_tv, mock_issue
+    ):
+        """
+        A CUSIP that one library could not answer (network error, rate limit)
+        is not a confirmed miss, so the next run looks it up again.
+        """
+        from curl_cffi.requests.exceptions import RequestException
+
+        mock_load.return_value = _empty_stocks()
+        mock_yf.side_effect = RequestException("rate limited")
+        mock_of.return_value = {"999999999": None}
+        mock_tv.return_value = None
+
+        for _ in range(2):
+            df = pd.DataFrame({"CUSIP": ["999999999"], "Company": ["Unknown Corp"]})
+            TickerResolver.resolve_ticker(df)
+
+        self.assertEqual(mock_yf.call_count, 2)
+        self.assertEqual(mock_of.call_count, 2)
+
+    @patch("app.stocks.ticker_resolver.open_issue")
+    @patch("app.stocks.ticker_resolver.TradingView.get_ticker")
+    @patch("app.stocks.ticker_resolver.OpenFIGI.get_tickers")
+    @patch("app.stocks.ticker_resolver.YFinance.get_ticker")
+    @patch("app.stocks.ticker_resolver.load_stocks")
+    def test_duplicated_unresolved_cusip_is_looked_up_once(
+        self, mock_load, mock_yf, mock_of, mock_tv, mock_issue
+    ):
+        """
+        Repeated rows for the same unknown CUSIP trigger one lookup and one issue,
+        and every row is left without a ticker.
+        """
+        mock_load.return_value = _empty_stocks()
+        mock_yf.return_value = None
+        mock_of.return_value = {}
+        mock_tv.return_value = None
+        df = pd.DataFrame({"CUSIP": ["999999999"] * 3, "Company": ["Unknown Corp"] * 3})
+
+        result = TickerResolver.resolve_ticker(df)
+
+        mock_yf.assert_called_once()
+        mock_issue.assert_called_once()
+        self.assertTrue(result["Ticker"].isna().all())
+
     @patch("app.stocks.ticker_resolver.open_issue")
     @patch("app.stocks.ticker_resolver.save_stock")
     @patch("app.stocks.ticker_resolver.TradingView.get_company")
@@ -229,7 +351,11 @@ class TestTickerResolverResolveTicker(unittest.TestCase):
         Resolves each row in the DataFrame independently, saving each resolved ticker.
         """
         mock_load.return_value = _empty_stocks()
-        mock_ticker.side_effect = ["AAPL", "JNJ"]
+        # Lookups run concurrently, so answer by CUSIP rather than call order.
+        mock_ticker.side_effect = lambda cusip, **kwargs: {
+            "037833100": "AAPL",
+            "478160104": "JNJ",
+        }[cusip]
         mock_company.side_effect = ["Apple Inc", "Johnson & Johnson"]
         df = pd.DataFrame(
             {"CUSIP": ["037833100", "478160104"], "Company": ["Apple Inc", "Johnson & Johnson"]}
@@ -302,6 +428,40 @@ class TestTickerResolverResolveTicker(unittest.TestCase):
         mock_save.assert_called_once_with("222222222", "ACME", "Acme Corp", industry="")
         mock_resolve_industry.assert_not_called()
 
+    @patch("app.stocks.ticker_resolver.resolve_industry")
+    @patch("app.stocks.ticker_resolver.save_stock")
+    @patch("app.stocks.ticker_resolver.YFinance.get_company")
+    @patch("app.stocks.ticker_resolver.YFinance.get_ticker")
+    @patch("app.stocks.ticker_resolver.load_stocks")
+    def test_second_new_cusip_inherits_ticker_added_in_same_batch(
+        self,
+        mock_load,
+        mock_get_ticker,
+        mock_get_company,
+        mock_save,
+        mock_resolve_industry,
+    ):
+        """
+        Two new CUSIPs resolving to the same new ticker share the Company and
+        Industry resolved for the first one.
+        """
+        mock_load.return_value = _empty_stocks()
+        mock_get_ticker.return_value = "GOOGL"
+        mock_get_company.return_value = "Alphabet Inc"
+        mock_resolve_industry.return_value = "Internet Content & Information"
+        df = pd.DataFrame(
+            {"CUSIP": ["02079K305", "02079K107"], "Company": ["Alphabet A", "Alphabet C"]}
+        )
+
+        result = TickerResolver.resolve_ticker(df)
+
+        self.assertEqual(list(result["Ticker"]), ["GOOGL", "GOOGL"])
+        mock_get_company.assert_called_once()
+        mock_resolve_industry.assert_called_once()
+        mock_save.assert_called_with(
+            "02079K107", "GOOGL", "Alphabet Inc", industry="Internet Content & Information"
+        )
+
     @patch("app.stocks.ticker_resolver.open_issue")
     @patch("app.stocks.ticker_resolver.save_stock")
     @patch("app.stocks.ticker_resolver.TradingView.get_company")
@@ -419,6 +579,27 @@ class TestTickerResolverAssignCUSIP(unittest.TestCase):
         self.assertEqual(result.loc[0, "CUSIP"], "037833100")
         self.assertEqual(result.loc[1, "CUSIP"], "594918104")
 
+    @patch("app.stocks.ticker_resolver.resolve_industry", return_value="")
+    @patch("app.stocks.ticker_resolver.save_stock")
+    @patch("app.stocks.ticker_resolver.FMP.get_cusip")
+    @patch("app.stocks.ticker_resolver.load_stocks")
+    def test_repeated_new_ticker_is_fetched_once(
+        self, mock_load, mock_get_cusip, mock_save, _mock_industry
+    ):
+        """
+        A new ticker appearing on several rows is looked up and saved once, and
+        every one of its rows gets the CUSIP.
+        """
+        mock_load.return_value = _empty_stocks()
+        mock_get_cusip.return_value = "037833100"
+        df = pd.DataFrame({"Ticker": ["AAPL", "AAPL"], "Company": ["Apple Inc", "Apple Inc"]})
+
+        result = TickerResolver.assign_cusip(df)
+
+        self.assertEqual(result["CUSIP"].tolist(), ["037833100", "037833100"])
+        mock_get_cusip.assert_called_once_with("AAPL")
+        mock_save.assert_called_once()
+
 
 class TestTickerResolverUpdateChangedTickers(unittest.TestCase):
     def _stocks_with(self, entries):
@@ -0,0 +1,55 @@
+"""
+Tests for scripts.generate_secrets .env key detection.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.generate_secrets import _existing_keys
+
+
+class TestExistingKeys(unittest.TestCase):
+    """
+    Verify that `--update` sees every key the runtime .env loader would load,
+    so it never appends a second (overriding) value for an existing secret.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary directory for the .env file.
+        """
+        self.tmp = tempfile.mkdtemp(prefix="hft_secrets_")
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.path = Path(self.tmp) / ".env"
+
+    def test_missing_file_has_no_keys(self):
+        """
+        A .env that does not exist yet contributes no keys.
+        """
+        self.assertEqual(_existing_keys(self.path), set())
+
+    def test_parses_plain_exported_and_quoted_keys(self):
+        """
+        Plain, `export`-prefixed, quoted and empty assignments all count; comments
+        and bare names without `=` do not.
+        """
+        self.path.write_text(
+            "# comment\n"
+            "\n"
+            "MASTER_KEY=abc\n"
+            "export JWT_SECRET=def\n"
+            'CSRF_SECRET="g h # i"\n'
+            "EMPTY=\n"
+            "BARE_NAME\n",
+            encoding="utf-8",
+        )
+
+        self.assertEqual(
+            _existing_keys(self.path), {"MASTER_KEY", "JWT_SECRET", "CSRF_SECRET", "EMPTY"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -374,6 +374,19 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(df_stocks.loc["123", "Industry"], "Software - Application")
         self.assertEqual(df_stocks.loc["456", "Industry"], "Banks - Regional")
 
+    def test_sort_stocks_skips_rewrite_when_already_sorted(self):
+        """
+        A second sort has nothing to change, so the file must not be rewritten
+        (a rewrite bumps the mtime and invalidates the load_stocks cache).
+        """
+        stocks_path = str(Path(self.test_db_folder) / STOCKS_FILE)
+        sort_stocks(stocks_path)
+
+        with unittest.mock.patch("app.utils.pd.atomic_to_csv") as mock_write:
+            sort_stocks(stocks_path)
+
+        mock_write.assert_not_called()
+
     def test_save_stocks_round_trip_preserves_industry(self):
         """
         save_stocks(load_stocks()) must be idempotent on the Industry column.
@@ -6,10 +6,12 @@ import pandas as pd
 from app.utils.pd import (
     coalesce,
     escape_csv_text_columns,
+    format_percentage_series,
     format_value_series,
     get_numeric_series,
     get_percentage_number_series,
 )
+from app.utils.strings import format_percentage, format_value
 
 
 class TestPandas(unittest.TestCase):
@@ -37,6 +39,19 @@ class TestPandas(unittest.TestCase):
         expected = pd.Series([10.0, 2.0, 30.0])
         pd.testing.assert_series_equal(result, expected)
 
+    def test_coalesce_scalar_default_and_dtype(self):
+        """
+        Scalar defaults fill the remaining gaps and the first Series' dtype,
+        index and name survive the NumPy round-trip.
+        """
+        s1 = pd.Series(["A", None, None], index=[10, 20, 30], name="Ticker", dtype=object)
+        s2 = pd.Series([None, "B", None], index=[10, 20, 30], dtype=object)
+
+        result = coalesce(s1, s2, "N/A")
+
+        expected = pd.Series(["A", "B", "N/A"], index=[10, 20, 30], name="Ticker", dtype=object)
+        pd.testing.assert_series_equal(result, expected)
+
     def test_format_value_series(self):
         """
         Tests the vectorized format_value_series function.
@@ -49,6 +64,40 @@ class TestPandas(unittest.TestCase):
         result = format_value_series(input_series)
         pd.testing.assert_series_equal(result, expected_output, check_names=False)
 
+    def test_format_value_series_matches_scalar(self):
+        """
+        The vectorized format_value_series matches format_value at every scale
+        boundary, for nullable and object inputs alike.
+        """
+        values = [0, 999, 1_000, -1_000, 999_999, 1_000_000, 10**12, 10**15, -np.inf, 0.004]
+        for series in (
+            pd.Series(values, dtype="float64"),
+            pd.Series([*values[:-2], None], dtype="Int64"),
+            pd.Series([*values, None], dtype=object),
+        ):
+            with self.subTest(dtype=str(series.dtype)):
+                self.assertEqual(
+                    format_value_series(series).tolist(), [format_value(v) for v in series]
+                )
+
+    def test_format_percentage_series_matches_scalar(self):
+        """
+        The vectorized format_percentage_series matches format_percentage value by value.
+        """
+        input_series = pd.Series(
+            [12.345, -3.04, 0.005, 0.0, 100.0, 2.675, np.nan, np.inf, pd.NA], dtype=object
+        )
+
+        for show_sign in (False, True):
+            for decimal_places in (1, 2):
+                with self.subTest(show_sign=show_sign, decimal_places=decimal_places):
+                    result = format_percentage_series(input_series, show_sign, decimal_places)
+                    expected = [
+                        format_percentage(value, show_sign, decimal_places)
+                        for value in input_series
+                    ]
+                    self.assertEqual(list(result), expected)
+
     def test_get_numeric_series(self):
         """
         Tests the vectorized get_numeric_series function.